@@ -4,6 +4,7 @@ Cocoon プロジェクトのアンケート分析設定
 survey-analysis-core パッケージを使用した実装例。
 """
 
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -28,7 +29,7 @@ class CocoonSurveyConfig(SurveyConfig):
             project_root = Path(__file__).resolve().parents[4]
         self._project_root = project_root
 
-    @property
+    @cached_property
     def questions(self) -> Dict[str, str]:
         """質問ID → カラム名のマッピング"""
         return {
@@ -69,12 +70,12 @@ class CocoonSurveyConfig(SurveyConfig):
             'h2_connection_thoughts': 'H-2. 人とのつながりについて、日頃感じていることがあれば自由にお書きください',
         }
 
-    @property
+    @cached_property
     def raw_data_path(self) -> Path:
         """アンケートCSVのパス"""
         return self._project_root / "tools" / "surveys" / "raw-data" / "user-needs-survey-v2.0.csv"
 
-    @property
+    @cached_property
     def output_dir(self) -> Path:
         """出力ディレクトリ"""
         return self._project_root / "output" / "survey-analysis"
@@ -84,7 +85,7 @@ class CocoonSurveyConfig(SurveyConfig):
         """ファイルエンコーディング（auto = 自動検出）"""
         return 'auto'
 
-    @property
+    @cached_property
     def category_orders(self) -> Dict[str, List[str]]:
         """カテゴリカル変数の順序定義"""
         return {
@@ -123,7 +124,7 @@ class CocoonSurveyConfig(SurveyConfig):
             ],
         }
 
-    @property
+    @cached_property
     def stopwords(self) -> List[str]:
         """テキスト分析用ストップワード"""
         return [
@@ -141,7 +142,7 @@ class CocoonSurveyConfig(SurveyConfig):
         """有意水準"""
         return 0.05
 
-    @property
+    @cached_property
     def crosstab_tiers(self) -> Dict[int, List[tuple]]:
         """Tier別クロス集計定義"""
         return {
@@ -184,7 +185,7 @@ class CocoonSurveyConfig(SurveyConfig):
         """ターゲット年齢層"""
         return ('23〜26歳', '27〜29歳', '30〜34歳')
 
-    @property
+    @cached_property
     def numeric_mappings(self) -> Dict[str, Dict[str, int]]:
         """カテゴリ→数値変換マッピング"""
         return {
@@ -212,7 +213,7 @@ class CocoonSurveyConfig(SurveyConfig):
             },
         }
 
-    @property
+    @cached_property
     def figure_style(self) -> Dict:
         """グラフスタイル設定"""
         return {
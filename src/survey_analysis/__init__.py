@@ -22,10 +22,33 @@ survey-analysis-core - 汎用アンケート解析コアライブラリ
 __version__ = '1.0.0'
 __author__ = 'SHIRO Inc.'
 
-from .base import SurveyConfig, ReportGenerator
+import importlib
+from typing import Any, Dict
+
+# 公開名 -> 定義元モジュール（初回アクセス時に読み込む）
+_LAZY_IMPORTS: Dict[str, str] = {
+    'SurveyConfig': '.base.config',
+    'ReportGenerator': '.base.report',
+}
 
 __all__ = [
     'SurveyConfig',
     'ReportGenerator',
     '__version__',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """公開名への初回アクセス時に定義元モジュールを読み込む"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -21,9 +21,15 @@
             return Path('output/analysis')
 """
 
+import os
 from abc import ABC, abstractmethod
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Mapping, Optional, Any
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class SurveyConfig(ABC):
@@ -190,7 +196,7 @@ class SurveyConfig(ABC):
         Returns:
             str: 実際のカラム名（見つからない場合はIDをそのまま返す）
         """
-        return self.questions.get(question_id, question_id)
+        return self._questions_frozen.get(question_id, question_id)
 
     def get_question_id(self, column_name: str) -> Optional[str]:
         """
@@ -202,10 +208,53 @@ class SurveyConfig(ABC):
         Returns:
             str or None: 質問ID（見つからない場合はNone）
         """
-        for qid, col in self.questions.items():
-            if col == column_name:
-                return qid
-        return None
+        return self._question_id_by_column.get(column_name)
+
+    # questions / category_orders から派生するインスタンス内キャッシュ（cached_property）
+    _DERIVED_CACHE_ATTRS = (
+        '_questions_frozen', '_expected_columns', '_category_dtypes', '_question_id_by_column'
+    )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        pickle 用の状態（派生キャッシュは除外し、復元後に再構築させる）
+
+        MappingProxyType は pickle できないため、プロセス並列で設定をワーカーへ渡せるよう除外する。
+        """
+        state = self.__dict__.copy()
+        for name in self._DERIVED_CACHE_ATTRS:
+            state.pop(name, None)
+        return state
+
+    @cached_property
+    def _questions_frozen(self) -> Mapping[str, str]:
+        """questions の読み取り専用スナップショット（インスタンスごとに1回だけ構築）"""
+        return MappingProxyType(dict(self.questions))
+
+    @cached_property
+    def _expected_columns(self) -> FrozenSet[str]:
+        """データに期待されるカラム名の集合（インスタンスごとに1回だけ構築）"""
+        return frozenset(self._questions_frozen.values())
+
+    @cached_property
+    def _category_dtypes(self) -> Dict[str, 'pd.CategoricalDtype']:
+        """質問ID -> 順序付きカテゴリ型（category_orders からインスタンスごとに1回だけ構築）"""
+        # 設定クラスの読み込みだけで pandas を import しないよう、使用時に読み込む
+        import pandas as pd
+
+        return {
+            col_key: pd.CategoricalDtype(categories=order, ordered=True)
+            for col_key, order in self.category_orders.items()
+        }
+
+    @cached_property
+    def _question_id_by_column(self) -> Dict[str, str]:
+        """カラム名 -> 質問IDの逆引きインデックス（インスタンスごとに1回だけ構築）"""
+        index: Dict[str, str] = {}
+        for qid, col in self._questions_frozen.items():
+            # 同一カラム名が複数ある場合は最初の質問IDを優先
+            index.setdefault(col, qid)
+        return index
 
     def ensure_output_dir(self) -> Path:
         """
@@ -227,7 +276,7 @@ class SurveyConfig(ABC):
         errors = []
 
         # raw_data_path の存在チェック
-        if not self.raw_data_path.exists():
+        if not os.path.isfile(self.raw_data_path):
             errors.append(f"データファイルが見つかりません: {self.raw_data_path}")
 
         # questions が空でないかチェック
@@ -11,8 +11,10 @@
 """
 
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 from pathlib import Path
 from typing import Any, Dict, Optional
+import numpy as np
 import pandas as pd
 
 
@@ -24,6 +26,13 @@ class ReportGenerator(ABC):
     プロジェクト固有のレポート形式を実装する。
     """
 
+    # 有意水準の星（p < 0.001, p < 0.01, p < alpha, それ以外）
+    _SIGNIFICANCE_LABELS = ('***', '**', '*', 'ns')
+
+    # Cramer's V の解釈の閾値とラベル
+    _CRAMERS_V_THRESHOLDS = (0.1, 0.3, 0.5)
+    _CRAMERS_V_LABELS = ("効果なし", "弱い関連", "中程度の関連", "強い関連")
+
     def __init__(self, config: 'SurveyConfig'):
         """
         Args:
@@ -117,6 +126,24 @@ class ReportGenerator(ABC):
         else:
             return "ns"
 
+    def _significance_stars_vec(self, p_values: np.ndarray) -> np.ndarray:
+        """
+        複数のp値から有意水準の星をまとめて返す
+
+        Args:
+            p_values: p値の配列
+
+        Returns:
+            np.ndarray: 星の配列（_get_significance_stars と同じ判定）
+        """
+        p = np.asarray(p_values, dtype=float)
+        *labels, default = self._SIGNIFICANCE_LABELS
+        return np.select(
+            [p < 0.001, p < 0.01, p < self.config.alpha],
+            labels,
+            default=default
+        )
+
     def format_crosstab_summary(
         self,
         row_var: str,
@@ -150,11 +177,4 @@ class ReportGenerator(ABC):
 
     def _interpret_cramers_v(self, v: float) -> str:
         """Cramer's Vの解釈"""
-        if v < 0.1:
-            return "効果なし"
-        elif v < 0.3:
-            return "弱い関連"
-        elif v < 0.5:
-            return "中程度の関連"
-        else:
-            return "強い関連"
+        return self._CRAMERS_V_LABELS[bisect_right(self._CRAMERS_V_THRESHOLDS, v)]
@@ -4,65 +4,78 @@ survey_analysis.core - コア分析モジュール
 データ読み込み、統計分析、クロス集計、可視化、テキスト分析、監査機能を提供。
 """
 
-from .loader import (
-    detect_encoding,
-    load_raw_data,
-    clean_column_names,
-    handle_missing_values,
-    split_multiselect_cell,
-    convert_ordered_categories,
-    create_numeric_scores,
-    add_derived_columns,
-    load_and_prepare_data,
-    validate_data,
-)
+import importlib
+from typing import Any, Dict, Tuple
 
-from .stats import (
-    chi_square_test,
-    t_test_independent,
-    anova_test,
-    correlation_test,
-    apply_fdr_correction,
-    run_statistical_tests,
-    analyze_missing_values,
-    get_basic_stats,
-    get_value_counts,
-)
+# 公開名 -> 定義元サブモジュール
+# サブモジュールは属性への初回アクセス時に読み込む（PEP 562）。
+# パッケージのimport時に matplotlib / scipy 等を一括で読み込まないため。
+_SUBMODULE_EXPORTS: Dict[str, Tuple[str, ...]] = {
+    'loader': (
+        'detect_encoding',
+        'load_raw_data',
+        'clean_column_names',
+        'handle_missing_values',
+        'split_multiselect_cell',
+        'split_multiselect_series',
+        'convert_ordered_categories',
+        'convert_string_columns_to_category',
+        'create_numeric_scores',
+        'add_derived_columns',
+        'load_and_prepare_data',
+        'validate_data',
+    ),
+    'stats': (
+        'chi_square_test',
+        't_test_independent',
+        'anova_test',
+        'correlation_test',
+        'apply_fdr_correction',
+        'apply_fdr_correction_to_results',
+        'run_statistical_tests',
+        'analyze_missing_values',
+        'get_basic_stats',
+        'get_value_counts',
+    ),
+    'crosstab': (
+        'create_crosstab',
+        'create_crosstab_with_totals',
+        'create_percentage_crosstab',
+        'analyze_crosstabs_by_tier',
+        'export_crosstabs_to_csv',
+    ),
+    'viz': (
+        'setup_japanese_font',
+        'plot_crosstab_heatmap',
+        'plot_bar_chart',
+        'plot_stacked_bar',
+        'plot_pie_chart',
+        'plot_histogram',
+        'create_visualization_report',
+    ),
+    'text': (
+        'set_tokenizer_backend',
+        'tokenize_japanese_text',
+        'extract_word_frequency',
+        'extract_tfidf_keywords',
+        'generate_wordcloud',
+        'analyze_freetext_column',
+        'analyze_all_freetext',
+    ),
+    'audit': (
+        'check_data_completeness',
+        'check_data_validity',
+        'check_data_consistency',
+        'generate_audit_report',
+        'get_data_profile',
+    ),
+}
 
-from .crosstab import (
-    create_crosstab,
-    create_crosstab_with_totals,
-    create_percentage_crosstab,
-    analyze_crosstabs_by_tier,
-    export_crosstabs_to_csv,
-)
-
-from .viz import (
-    setup_japanese_font,
-    plot_crosstab_heatmap,
-    plot_bar_chart,
-    plot_stacked_bar,
-    plot_pie_chart,
-    plot_histogram,
-    create_visualization_report,
-)
-
-from .text import (
-    tokenize_japanese_text,
-    extract_word_frequency,
-    extract_tfidf_keywords,
-    generate_wordcloud,
-    analyze_freetext_column,
-    analyze_all_freetext,
-)
-
-from .audit import (
-    check_data_completeness,
-    check_data_validity,
-    check_data_consistency,
-    generate_audit_report,
-    get_data_profile,
-)
+_LAZY_IMPORTS: Dict[str, str] = {
+    name: module
+    for module, names in _SUBMODULE_EXPORTS.items()
+    for name in names
+}
 
 __all__ = [
     # loader
@@ -71,7 +84,9 @@ __all__ = [
     'clean_column_names',
     'handle_missing_values',
     'split_multiselect_cell',
+    'split_multiselect_series',
     'convert_ordered_categories',
+    'convert_string_columns_to_category',
     'create_numeric_scores',
     'add_derived_columns',
     'load_and_prepare_data',
@@ -82,6 +97,7 @@ __all__ = [
     'anova_test',
     'correlation_test',
     'apply_fdr_correction',
+    'apply_fdr_correction_to_results',
     'run_statistical_tests',
     'analyze_missing_values',
     'get_basic_stats',
@@ -101,6 +117,7 @@ __all__ = [
     'plot_histogram',
     'create_visualization_report',
     # text
+    'set_tokenizer_backend',
     'tokenize_japanese_text',
     'extract_word_frequency',
     'extract_tfidf_keywords',
@@ -114,3 +131,20 @@ __all__ = [
     'generate_audit_report',
     'get_data_profile',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """公開名への初回アクセス時に定義元サブモジュールを読み込む"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f'.{module_name}', __name__)
+    value = getattr(module, name)
+    # 2回目以降は通常の属性参照で解決されるようキャッシュ
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
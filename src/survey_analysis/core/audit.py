@@ -4,8 +4,13 @@
 データ品質チェック、監査レポート生成を提供。
 """
 
+import codecs
+import copy
+import hashlib
+import io
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, TextIO
 from datetime import datetime
 
 import pandas as pd
@@ -13,10 +18,119 @@ import numpy as np
 
 from survey_analysis.base.config import SurveyConfig
 
+# オプショナル依存
+_PYARROW_AVAILABLE: bool = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    _PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    pa_csv = None
+
+# 監査チェック結果のキャッシュ: (データ指紋, 設定の内容) -> (完全性, 妥当性, 一貫性)
+# 結果は呼び出し側で変更されてもよいよう、格納時・返却時にコピーする
+_AUDIT_CACHE: Dict[tuple, tuple] = {}
+_AUDIT_CACHE_MAXSIZE = 32
+
+# 監査レポートのMarkdownテンプレート（セクション単位で書き出す）
+_AUDIT_REPORT_SECTIONS = (
+    "# データ監査レポート\n\n"
+    "生成日時: {generated_at}\n\n\n",
+
+    "## 1. 概要\n\n"
+    "- 総行数: {total_rows:,}\n"
+    "- 総カラム数: {total_columns}\n"
+    "- 期待カラム数: {expected_columns}\n\n",
+
+    "## 2. 完全性チェック\n\n"
+    "{completeness_block}\n\n"
+    "### 欠損値サマリー\n\n"
+    "{missing_table}\n\n",
+
+    "## 3. 妥当性チェック\n\n"
+    "{validity_block}\n\n",
+
+    "## 4. 一貫性チェック\n\n"
+    "{consistency_block}\n\n",
+
+    "## 5. サマリー\n\n"
+    "{summary_block}",
+)
+
+
+def _emit(writer: TextIO, *lines: str) -> None:
+    """レポートの断片をwriterへ書き出す"""
+    writer.write("\n".join(lines))
+
+
+def _write_csv(df: pd.DataFrame, path: Path) -> None:
+    """
+    データフレームをBOM付きUTF-8のCSVとして書き出す
+
+    pyarrowが利用可能ならArrowのCSVライターを使い、
+    Arrow型に変換できない場合や未インストールの場合はpandasで書き出す。
+
+    Args:
+        df: データフレーム
+        path: 出力パス
+    """
+    if _PYARROW_AVAILABLE:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            table = None
+
+        if table is not None:
+            with open(path, 'wb') as f:
+                f.write(codecs.BOM_UTF8)
+                pa_csv.write_csv(table, f)
+            return
+
+    df.to_csv(path, index=False, encoding='utf-8-sig')
+
+
+def _compute_column_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    カラム単位の基本統計をまとめて計算
+
+    完全性・一貫性チェックとデータプロファイルで共通に使う集計を1回で求め、
+    各関数の stats 引数に渡して再計算を避ける。
+
+    Args:
+        df: データフレーム
+
+    Returns:
+        pd.DataFrame: カラムをインデックスとし、count, nunique, is_numeric,
+            mean, std, min, max（数値型以外はNaN）を持つ集計表
+    """
+    is_numeric = df.dtypes.map(pd.api.types.is_numeric_dtype).to_numpy(dtype=bool)
+
+    stats = pd.DataFrame({
+        'count': df.count().to_numpy(dtype=np.int64),
+        'nunique': df.nunique(dropna=True).to_numpy(dtype=np.int64),
+        'is_numeric': is_numeric,
+    }, index=df.columns)
+
+    numeric_stats = ['mean', 'std', 'min', 'max']
+    if is_numeric.any():
+        num = df.loc[:, is_numeric].agg(numeric_stats).T.astype(np.float64)
+        for stat in numeric_stats:
+            values = np.full(len(df.columns), np.nan)
+            values[is_numeric] = num[stat].to_numpy()
+            stats[stat] = values
+    else:
+        for stat in numeric_stats:
+            stats[stat] = np.nan
+
+    return stats
+
 
 def check_data_completeness(
     df: pd.DataFrame,
-    config: SurveyConfig
+    config: SurveyConfig,
+    stats: Optional[pd.DataFrame] = None
 ) -> Dict[str, Any]:
     """
     データの完全性をチェック
@@ -24,6 +138,7 @@ def check_data_completeness(
     Args:
         df: データフレーム
         config: SurveyConfig
+        stats: _compute_column_stats の計算済み結果（省略時は内部で計算）
 
     Returns:
         dict: 完全性チェック結果
@@ -38,20 +153,28 @@ def check_data_completeness(
     }
 
     # 期待カラムとの比較
-    expected = set(config.questions.values())
-    actual = set(df.columns)
-
-    results['missing_columns'] = list(expected - actual)
-    results['extra_columns'] = list(actual - expected)
-
-    # カラムごとの完全性
-    for col in df.columns:
-        non_null = df[col].notna().sum()
-        results['column_completeness'][col] = {
+    expected = config._expected_columns
+
+    results['missing_columns'] = list(expected.difference(df.columns))
+    results['extra_columns'] = list(set(df.columns).difference(expected))
+
+    # カラムごとの完全性（全カラムの非欠損数を1回で集計）
+    if stats is None:
+        stats = _compute_column_stats(df)
+    n = len(df)
+    non_null_counts = stats['count'].to_numpy(dtype=np.int64)
+    null_counts = n - non_null_counts
+    completeness_rates = non_null_counts / n * 100
+    results['column_completeness'] = {
+        col: {
             'non_null_count': int(non_null),
-            'null_count': int(len(df) - non_null),
-            'completeness_rate': float(non_null / len(df) * 100)
+            'null_count': int(null),
+            'completeness_rate': float(rate)
         }
+        for col, non_null, null, rate in zip(
+            df.columns, non_null_counts, null_counts, completeness_rates
+        )
+    }
 
     return results
 
@@ -76,34 +199,50 @@ def check_data_validity(
     }
 
     # カテゴリ変数の妥当性チェック
+    q_map = config._questions_frozen
     for q_id, order in config.category_orders.items():
-        col_name = config.get_column_name(q_id)
+        col_name = q_map.get(q_id, q_id)
         if col_name not in df.columns:
             continue
 
-        valid_values = set(order)
-        actual_values = set(df[col_name].dropna().unique())
-        invalid = actual_values - valid_values
+        series = df[col_name]
+        valid_arr = np.asarray(order, dtype=object)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # category型: 実際に出現しているカテゴリだけを順序定義と照合
+            codes = series.cat.codes.to_numpy()
+            present = np.bincount(
+                codes[codes >= 0], minlength=len(series.cat.categories)
+            ) > 0
+            categories = series.cat.categories[present]
+            invalid = categories[~categories.isin(order)].tolist()
+        else:
+            # 順序定義にない非欠損行をマスクで抽出し、その値だけをユニーク化
+            mask = ~series.isin(order) & series.notna()
+            invalid = pd.unique(series[mask].to_numpy()).tolist()
 
         results['category_validity'][q_id] = {
             'column': col_name,
-            'expected_values': list(valid_values),
-            'invalid_values': list(invalid),
+            'expected_values': valid_arr.tolist(),
+            'invalid_values': invalid,
             'is_valid': len(invalid) == 0
         }
 
         if invalid:
-            results['invalid_values'][q_id] = list(invalid)
+            results['invalid_values'][q_id] = invalid
 
     return results
 
 
-def check_data_consistency(df: pd.DataFrame) -> Dict[str, Any]:
+def check_data_consistency(
+    df: pd.DataFrame,
+    stats: Optional[pd.DataFrame] = None
+) -> Dict[str, Any]:
     """
     データの一貫性をチェック
 
     Args:
         df: データフレーム
+        stats: _compute_column_stats の計算済み結果（省略時は内部で計算）
 
     Returns:
         dict: 一貫性チェック結果
@@ -116,188 +255,303 @@ def check_data_consistency(df: pd.DataFrame) -> Dict[str, Any]:
     }
 
     # 重複行チェック
-    duplicates = df.duplicated()
+    # 行スライスを作らず、ブールマスクから直接インデックスを取得
+    duplicates = df.duplicated().to_numpy()
     results['duplicate_rows'] = int(duplicates.sum())
-    results['duplicate_indices'] = df[duplicates].index.tolist()
-
-    # 定数カラム（1値のみ）チェック
-    for col in df.columns:
-        unique_count = df[col].nunique(dropna=True)
-        if unique_count <= 1:
-            results['constant_columns'].append(col)
-        elif unique_count > len(df) * 0.9:  # 90%以上がユニーク
-            results['high_cardinality_columns'].append({
-                'column': col,
-                'unique_count': int(unique_count),
-                'percentage': float(unique_count / len(df) * 100)
-            })
+    results['duplicate_indices'] = df.index[duplicates].tolist()
+
+    # 定数カラム（1値のみ）・高カーディナリティ（90%以上がユニーク）チェック
+    # ユニーク数は全カラム分を1回で取得する
+    if stats is None:
+        stats = _compute_column_stats(df)
+    n = len(df)
+    nunique = stats['nunique']
+    constant_mask = nunique <= 1
+    results['constant_columns'] = nunique.index[constant_mask].tolist()
+    high_card = nunique[~constant_mask & (nunique > n * 0.9)]
+    results['high_cardinality_columns'] = [
+        {
+            'column': col,
+            'unique_count': int(unique_count),
+            'percentage': float(unique_count / n * 100)
+        }
+        for col, unique_count in high_card.items()
+    ]
 
     return results
 
 
+def _audit_cache_key(df: pd.DataFrame, config: SurveyConfig) -> Optional[tuple]:
+    """監査キャッシュのキー（インデックスを含むデータ内容の指紋 + チェックが参照する設定）を生成"""
+    try:
+        # 重複行の報告はインデックスのラベルと行の順序に依存するため、両方を指紋に含める
+        row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+        config_key = (
+            tuple(config._questions_frozen.items()),
+            tuple((q_id, tuple(order)) for q_id, order in config.category_orders.items()),
+        )
+        hash(config_key)
+    except TypeError:
+        # リスト等のハッシュ不能な値を含む場合はキャッシュしない
+        return None
+    content_hash = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest()
+    return (df.shape, tuple(df.columns), tuple(map(str, df.dtypes)), content_hash, config_key)
+
+
+def _run_audit_checks(
+    df: pd.DataFrame,
+    config: SurveyConfig,
+    use_cache: bool = True,
+    stats: Optional[pd.DataFrame] = None
+) -> tuple:
+    """完全性・妥当性・一貫性チェックを実行（同一データ・設定ならキャッシュを返す）"""
+    key = _audit_cache_key(df, config) if use_cache else None
+    if key is not None and key in _AUDIT_CACHE:
+        return copy.deepcopy(_AUDIT_CACHE[key])
+
+    if stats is None:
+        stats = _compute_column_stats(df)
+    checks = (
+        check_data_completeness(df, config, stats),
+        check_data_validity(df, config),
+        check_data_consistency(df, stats),
+    )
+
+    if key is not None:
+        if len(_AUDIT_CACHE) >= _AUDIT_CACHE_MAXSIZE:
+            _AUDIT_CACHE.pop(next(iter(_AUDIT_CACHE)))
+        _AUDIT_CACHE[key] = copy.deepcopy(checks)
+
+    return checks
+
+
 def generate_audit_report(
     df: pd.DataFrame,
     config: SurveyConfig,
-    output_path: Optional[Path] = None
-) -> str:
+    output_path: Optional[Path] = None,
+    use_cache: bool = True,
+    return_text: bool = True,
+    stats: Optional[pd.DataFrame] = None
+) -> Optional[str]:
     """
     データ監査レポートを生成
 
+    インデックスを含めて同一内容のデータと、質問・カテゴリ順序が同じ設定に対する
+    チェック結果はキャッシュされ、
+    再呼び出し時はレポートの整形のみを行う。
+    output_path 指定時はセクション単位でファイルへ直接書き出す。
+
     Args:
         df: データフレーム
         config: SurveyConfig
         output_path: 出力パス（省略時はテキストのみ返す）
+        use_cache: チェック結果のキャッシュを使用するか
+        return_text: レポート全文を文字列として返すか
+            （False の場合はメモリ上に全文を保持せず None を返す）
+        stats: _compute_column_stats の計算済み結果（省略時は必要に応じて計算）
 
     Returns:
-        str: 監査レポート（Markdown形式）
+        str or None: 監査レポート（Markdown形式）
     """
     # 各チェックを実行
-    completeness = check_data_completeness(df, config)
-    validity = check_data_validity(df, config)
-    consistency = check_data_consistency(df)
-
-    # レポート生成
-    report = []
-    report.append("# データ監査レポート\n")
-    report.append(f"生成日時: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-
-    # 概要
-    report.append("\n## 1. 概要\n")
-    report.append(f"- 総行数: {completeness['total_rows']:,}")
-    report.append(f"- 総カラム数: {completeness['total_columns']}")
-    report.append(f"- 期待カラム数: {completeness['expected_columns']}")
-
-    # 完全性
-    report.append("\n## 2. 完全性チェック\n")
-
-    if completeness['missing_columns']:
-        report.append("\n### 欠損カラム（期待されるが存在しない）\n")
-        for col in completeness['missing_columns']:
-            report.append(f"- {col}")
+    completeness, validity, consistency = _run_audit_checks(df, config, use_cache, stats)
+
+    # 各セクションを組み立て
+    missing_columns = completeness['missing_columns']
+    if missing_columns:
+        completeness_block = (
+            "\n### 欠損カラム（期待されるが存在しない）\n\n"
+            + "\n".join(f"- {col}" for col in missing_columns)
+        )
     else:
-        report.append("\n✅ 全ての期待カラムが存在します\n")
-
-    # 欠損値サマリー
-    report.append("\n### 欠損値サマリー\n")
-    report.append("| カラム | 欠損数 | 欠損率 |")
-    report.append("|--------|--------|--------|")
-
-    sorted_cols = sorted(
-        completeness['column_completeness'].items(),
-        key=lambda x: x[1]['null_count'],
-        reverse=True
-    )
-
-    for col, stats in sorted_cols[:20]:  # 上位20件
-        if stats['null_count'] > 0:
-            report.append(
-                f"| {col[:40]}... | {stats['null_count']} | "
-                f"{100 - stats['completeness_rate']:.1f}% |"
+        completeness_block = "\n✅ 全ての期待カラムが存在します\n"
+
+    column_completeness = pd.DataFrame.from_dict(
+        completeness['column_completeness'],
+        orient='index',
+        columns=['non_null_count', 'null_count', 'completeness_rate']
+    ).astype({'null_count': np.int64, 'completeness_rate': np.float64})
+    top_missing = column_completeness[
+        column_completeness['null_count'] > 0
+    ].nlargest(20, 'null_count')  # 上位20件
+    missing_table = "\n".join([
+        "| カラム | 欠損数 | 欠損率 |",
+        "|--------|--------|--------|",
+        *(
+            f"| {col[:40]}... | {null_count} | {100 - completeness_rate:.1f}% |"
+            for col, null_count, completeness_rate in zip(
+                top_missing.index,
+                top_missing['null_count'].tolist(),
+                top_missing['completeness_rate'].tolist()
             )
-
-    # 妥当性
-    report.append("\n## 3. 妥当性チェック\n")
-
-    invalid_count = sum(
-        1 for v in validity['category_validity'].values()
-        if not v['is_valid']
-    )
-
+        ),
+    ])
+
+    invalid_checks = [
+        (q_id, check) for q_id, check in validity['category_validity'].items()
+        if not check['is_valid']
+    ]
+    invalid_count = len(invalid_checks)
     if invalid_count == 0:
-        report.append("✅ 全てのカテゴリ値が妥当です\n")
+        validity_block = "✅ 全てのカテゴリ値が妥当です\n"
     else:
-        report.append(f"⚠️ {invalid_count} カラムに不正な値があります\n")
-        for q_id, check in validity['category_validity'].items():
-            if not check['is_valid']:
-                report.append(f"\n### {q_id} ({check['column'][:30]}...)")
-                report.append(f"- 不正な値: {check['invalid_values']}")
-
-    # 一貫性
-    report.append("\n## 4. 一貫性チェック\n")
-
-    if consistency['duplicate_rows'] > 0:
-        report.append(
-            f"⚠️ 重複行: {consistency['duplicate_rows']} 件\n"
-        )
-    else:
-        report.append("✅ 重複行はありません\n")
-
+        validity_block = "\n".join([
+            f"⚠️ {invalid_count} カラムに不正な値があります\n",
+            *(
+                f"\n### {q_id} ({check['column'][:30]}...)\n"
+                f"- 不正な値: {check['invalid_values']}"
+                for q_id, check in invalid_checks
+            ),
+        ])
+
+    consistency_lines = [
+        f"⚠️ 重複行: {consistency['duplicate_rows']} 件\n"
+        if consistency['duplicate_rows'] > 0
+        else "✅ 重複行はありません\n"
+    ]
     if consistency['constant_columns']:
-        report.append(f"\n⚠️ 定数カラム（1値のみ）: {len(consistency['constant_columns'])} 件")
-        for col in consistency['constant_columns'][:10]:
-            report.append(f"  - {col}")
-
-    # サマリー
-    report.append("\n## 5. サマリー\n")
+        consistency_lines.append(
+            f"\n⚠️ 定数カラム（1値のみ）: {len(consistency['constant_columns'])} 件"
+        )
+        consistency_lines.extend(f"  - {col}" for col in consistency['constant_columns'][:10])
+    consistency_block = "\n".join(consistency_lines)
 
     issues = []
-    if completeness['missing_columns']:
-        issues.append(f"欠損カラム: {len(completeness['missing_columns'])} 件")
+    if missing_columns:
+        issues.append(f"欠損カラム: {len(missing_columns)} 件")
     if invalid_count > 0:
         issues.append(f"不正値カラム: {invalid_count} 件")
     if consistency['duplicate_rows'] > 0:
         issues.append(f"重複行: {consistency['duplicate_rows']} 件")
 
     if issues:
-        report.append("### 検出された問題\n")
-        for issue in issues:
-            report.append(f"- {issue}")
+        summary_block = "\n".join(["### 検出された問題\n", *(f"- {issue}" for issue in issues)])
     else:
-        report.append("✅ 重大な問題は検出されませんでした\n")
+        summary_block = "✅ 重大な問題は検出されませんでした\n"
+
+    fields = {
+        'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'total_rows': completeness['total_rows'],
+        'total_columns': completeness['total_columns'],
+        'expected_columns': completeness['expected_columns'],
+        'completeness_block': completeness_block,
+        'missing_table': missing_table,
+        'validity_block': validity_block,
+        'consistency_block': consistency_block,
+        'summary_block': summary_block,
+    }
+
+    # 書き出し先（ファイル and/or 返却用バッファ）
+    buffer = io.StringIO() if return_text else None
 
-    report_text = '\n'.join(report)
+    with ExitStack() as stack:
+        writers: List[TextIO] = [buffer] if buffer is not None else []
+        if output_path:
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            writers.append(stack.enter_context(open(output_path, 'w', encoding='utf-8')))
+
+        for template in _AUDIT_REPORT_SECTIONS:
+            section = template.format(**fields)
+            for writer in writers:
+                _emit(writer, section)
 
-    # ファイル出力
     if output_path:
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(report_text, encoding='utf-8')
         print(f"監査レポート保存: {output_path}")
 
-    return report_text
+    return buffer.getvalue() if buffer is not None else None
 
 
-def get_data_profile(df: pd.DataFrame) -> pd.DataFrame:
+def get_data_profile(
+    df: pd.DataFrame,
+    stats: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
     """
     データプロファイルを取得
 
     Args:
         df: データフレーム
+        stats: _compute_column_stats の計算済み結果（省略時は内部で計算）
 
     Returns:
         pd.DataFrame: プロファイル情報
     """
-    profile = []
-
-    for col in df.columns:
-        series = df[col]
-
-        row = {
-            'column': col,
-            'dtype': str(series.dtype),
-            'non_null_count': int(series.notna().sum()),
-            'null_count': int(series.isna().sum()),
-            'null_percentage': float(series.isna().sum() / len(df) * 100),
-            'unique_count': int(series.nunique()),
-            'unique_percentage': float(series.nunique() / len(df) * 100),
-        }
-
-        # 数値型の場合
-        if pd.api.types.is_numeric_dtype(series):
-            row['mean'] = float(series.mean()) if series.notna().any() else None
-            row['std'] = float(series.std()) if series.notna().any() else None
-            row['min'] = float(series.min()) if series.notna().any() else None
-            row['max'] = float(series.max()) if series.notna().any() else None
-
-        # カテゴリカル型の場合
-        else:
-            value_counts = series.value_counts()
-            row['top_value'] = value_counts.index[0] if len(value_counts) > 0 else None
-            row['top_count'] = int(value_counts.iloc[0]) if len(value_counts) > 0 else 0
-
-        profile.append(row)
-
-    return pd.DataFrame(profile)
+    n = len(df)
+
+    # 全カラム共通の集計（カラムごとのループではなくフレーム単位で1回ずつ）
+    if stats is None:
+        stats = _compute_column_stats(df)
+    non_null = stats['count']
+    null = n - non_null
+    nunique = stats['nunique']
+
+    profile = pd.DataFrame({
+        'column': df.columns,
+        'dtype': df.dtypes.astype(str).to_numpy(),
+        'non_null_count': non_null.to_numpy(dtype=np.int64),
+        'null_count': null.to_numpy(dtype=np.int64),
+        'null_percentage': (null / n * 100).to_numpy(dtype=np.float64),
+        'unique_count': nunique.to_numpy(dtype=np.int64),
+        'unique_percentage': (nunique / n * 100).to_numpy(dtype=np.float64),
+    })
+
+    is_numeric = stats['is_numeric'].to_numpy(dtype=bool)
+
+    # 数値型カラム
+    if is_numeric.any():
+        for stat in ['mean', 'std', 'min', 'max']:
+            profile[stat] = stats[stat].to_numpy(dtype=np.float64)
+
+    # カテゴリカル型カラム
+    if not is_numeric.all():
+        categorical = df.loc[:, ~is_numeric]
+        n_categorical = categorical.shape[1]
+        top_values = np.full(n_categorical, None, dtype=object)
+        top_counts = np.zeros(n_categorical, dtype=np.int64)
+
+        is_category_dtype = categorical.dtypes.map(
+            lambda dtype: isinstance(dtype, pd.CategoricalDtype)
+        ).to_numpy(dtype=bool)
+
+        # object型等: 出現順のコードの出現数から最頻値を取得
+        # （分布全体をソートせず、同数の場合は value_counts と同じく先に出現した値）
+        for pos in np.flatnonzero(~is_category_dtype):
+            codes, uniques = pd.factorize(categorical.iloc[:, pos], use_na_sentinel=True)
+            codes = codes[codes >= 0]
+            if len(codes) > 0:
+                counts = np.bincount(codes)
+                idx = int(counts.argmax())
+                top_values[pos] = uniques[idx]
+                top_counts[pos] = counts[idx]
+
+        # category型: カテゴリコードの出現数から最頻値を取得
+        for pos in np.flatnonzero(is_category_dtype):
+            series = categorical.iloc[:, pos]
+            codes = series.cat.codes.to_numpy()
+            codes = codes[codes >= 0]
+            if len(codes) > 0:
+                counts = np.bincount(codes)
+                idx = int(counts.argmax())
+                top_values[pos] = series.cat.categories[idx]
+                top_counts[pos] = counts[idx]
+
+        if is_numeric.any():
+            # 数値型カラムの top_value/top_count は欠損
+            all_top_values = np.full(len(df.columns), np.nan, dtype=object)
+            all_top_counts = np.full(len(df.columns), np.nan)
+            all_top_values[~is_numeric] = top_values
+            all_top_counts[~is_numeric] = top_counts
+            top_values, top_counts = all_top_values, all_top_counts
+        # 値の型に応じた dtype にする（文字列のみなら str 型）
+        profile['top_value'] = pd.Series(top_values.tolist(), index=profile.index)
+        profile['top_count'] = top_counts
+
+        # 先頭カラムがカテゴリカル型の場合は top_value/top_count を数値統計より前に置く
+        if not is_numeric[0] and is_numeric.any():
+            head = [c for c in profile.columns if c not in ('mean', 'std', 'min', 'max')]
+            profile = profile[head + ['mean', 'std', 'min', 'max']]
+
+    return profile
 
 
 def export_audit_results(
@@ -321,15 +575,18 @@ def export_audit_results(
 
     paths = {}
 
+    # レポートとプロファイルで共通の集計を1回だけ計算
+    stats = _compute_column_stats(df)
+
     # 監査レポート
     report_path = output_dir / 'audit_report.md'
-    generate_audit_report(df, config, report_path)
+    generate_audit_report(df, config, report_path, return_text=False, stats=stats)
     paths['report'] = report_path
 
     # データプロファイル
-    profile = get_data_profile(df)
+    profile = get_data_profile(df, stats)
     profile_path = output_dir / 'data_profile.csv'
-    profile.to_csv(profile_path, index=False, encoding='utf-8-sig')
+    _write_csv(profile, profile_path)
     paths['profile'] = profile_path
     print(f"データプロファイル保存: {profile_path}")
 
@@ -11,8 +11,77 @@ import pandas as pd
 import numpy as np
 
 from survey_analysis.base.config import SurveyConfig
+from survey_analysis.utils.parallel import map_in_threads
 
-warnings.filterwarnings('ignore')
+
+def _fast_crosstab_counts(
+    row: pd.Series,
+    col: pd.Series
+) -> Tuple[Any, Any, np.ndarray]:
+    """
+    2変数の度数をカテゴリコード上で集計
+
+    各変数を整数コードに変換し、(行コード, 列コード) の組を
+    np.bincount で1パス集計する。いずれかが欠損の行は除外する。
+
+    Args:
+        row: 行変数のSeries
+        col: 列変数のSeries
+
+    Returns:
+        tuple: (行ラベル, 列ラベル, 度数行列)
+    """
+    mask = row.notna().to_numpy() & col.notna().to_numpy()
+    row_codes, row_labels = pd.factorize(row[mask], sort=True)
+    col_codes, col_labels = pd.factorize(col[mask], sort=True)
+
+    n_rows, n_cols = len(row_labels), len(col_labels)
+    flat = row_codes.astype(np.int64) * n_cols + col_codes
+    counts = np.bincount(flat, minlength=n_rows * n_cols).reshape(n_rows, n_cols)
+
+    return row_labels, col_labels, counts
+
+
+def _crosstab_counts(
+    df: pd.DataFrame,
+    row_col: str,
+    col_col: str,
+    margins: bool = False,
+    margins_name: str = '合計'
+) -> pd.DataFrame:
+    """
+    2変数の度数クロス集計表を作成（pd.crosstab と同じ結果）
+
+    Args:
+        df: データフレーム
+        row_col: 行変数のカラム名
+        col_col: 列変数のカラム名
+        margins: 合計行/列を追加するか
+        margins_name: 合計行/列のラベル
+
+    Returns:
+        pd.DataFrame: クロス集計表（いずれかが欠損の行は除外）
+    """
+    row, col = df[row_col], df[col_col]
+    try:
+        row_labels, col_labels, counts = _fast_crosstab_counts(row, col)
+        ct = pd.DataFrame(
+            counts,
+            index=pd.Index(row_labels, name=row.name),
+            columns=pd.Index(col_labels, name=col.name)
+        )
+    except TypeError:
+        # 型の混在した値はソートできないため groupby で集計
+        ct = row.groupby([row, col], observed=True, sort=True).size().unstack(fill_value=0)
+
+    if margins and not ct.empty:
+        # category型のインデックスには合計ラベルを追加できないため通常のIndexに戻す
+        ct.index = pd.Index(ct.index.tolist(), name=ct.index.name)
+        ct.columns = pd.Index(ct.columns.tolist(), name=ct.columns.name)
+        ct[margins_name] = ct.sum(axis=1)
+        ct.loc[margins_name] = ct.sum(axis=0)
+
+    return ct
 
 
 def create_crosstab(
@@ -47,12 +116,7 @@ def create_crosstab(
         raise ValueError(f"カラムが見つかりません: {col_col}")
 
     # クロス集計
-    ct = pd.crosstab(
-        df[row_col],
-        df[col_col],
-        margins=margins,
-        margins_name='合計'
-    )
+    ct = _crosstab_counts(df, row_col, col_col, margins=margins)
 
     # 正規化
     if normalize:
@@ -134,28 +198,33 @@ def create_multiselect_crosstab(
     if row_col not in df.columns or col_col not in df.columns:
         raise ValueError("カラムが見つかりません")
 
-    # 作業用データフレーム作成（必要なカラムのみ）
-    work_df = df[[row_col, col_col]].copy()
-
-    # 欠損値と非文字列を除外
-    work_df = work_df.dropna(subset=[col_col])
-    work_df = work_df[work_df[col_col].apply(lambda x: isinstance(x, str))]
-
-    if len(work_df) == 0:
+    # 欠損値と非文字列を除外（文字列型のカラムは要素ごとの型チェック不要）
+    values = df[col_col]
+    if isinstance(values.dtype, pd.StringDtype):
+        keep = values.notna().to_numpy()
+    else:
+        keep = np.fromiter(
+            (type(v) is str for v in values.to_numpy(dtype=object)),
+            dtype=bool,
+            count=len(values)
+        )
+
+    if not keep.any():
         return pd.DataFrame()
 
-    # explode()で複数選択を展開（ベクトル化処理でiterrows()より高速）
-    work_df[col_col] = work_df[col_col].str.split(delimiter)
-    expanded_df = work_df.explode(col_col)
-
-    # 空白を除去し、空文字を除外
-    expanded_df[col_col] = expanded_df[col_col].str.strip()
-    expanded_df = expanded_df[expanded_df[col_col] != '']
+    # 複数選択の列だけを分割・展開し、行変数は選択数ぶん位置で繰り返して対応付ける
+    # （2カラムのDataFrameをコピー・展開しない）
+    split_values = values[keep].str.split(delimiter)
+    positions = np.repeat(np.flatnonzero(keep), split_values.str.len().to_numpy())
+    choices = split_values.explode(ignore_index=True).str.strip()
+    rows = df[row_col].iloc[positions].reset_index(drop=True)
 
-    if len(expanded_df) == 0:
+    # 空文字を除外
+    non_empty = (choices != '').to_numpy()
+    if not non_empty.any():
         return pd.DataFrame()
 
-    return pd.crosstab(expanded_df[row_col], expanded_df[col_col])
+    return pd.crosstab(rows[non_empty], choices[non_empty])
 
 
 def analyze_crosstabs_by_tier(
@@ -174,23 +243,31 @@ def analyze_crosstabs_by_tier(
     Returns:
         dict: クロス集計結果のマッピング
     """
-    results = {}
-
     tier_pairs = config.crosstab_tiers.get(tier, [])
+    q_map = config._questions_frozen
 
-    for row_var, col_var in tier_pairs:
+    def build(pair: Tuple[str, str]) -> Tuple[str, Optional[pd.DataFrame]]:
+        row_var, col_var = pair
         key = f"{row_var}_x_{col_var}"
         try:
-            ct = create_crosstab_with_totals(df, row_var, col_var, config)
-            results[key] = ct
+            # カラム名は解決済みのため config は渡さない
+            return key, create_crosstab_with_totals(
+                df, q_map.get(row_var, row_var), q_map.get(col_var, col_var)
+            )
         except Exception as e:
             warnings.warn(
                 f"{key} のクロス集計に失敗: {e}",
                 UserWarning,
-                stacklevel=2
+                stacklevel=3
             )
+            return key, None
 
-    return results
+    # ペアごとの集計は独立しているためスレッドで並列実行
+    return {
+        key: ct
+        for key, ct in map_in_threads(build, tier_pairs)
+        if ct is not None
+    }
 
 
 def get_crosstab_summary(
@@ -210,20 +287,20 @@ def get_crosstab_summary(
         dict: サマリー情報
     """
     # 合計行/列を除外
-    ct_clean = ct.copy()
-    if '合計' in ct_clean.index:
-        ct_clean = ct_clean.drop('合計')
-    if '合計' in ct_clean.columns:
-        ct_clean = ct_clean.drop('合計', axis=1)
+    ct_clean = ct.drop(index='合計', columns='合計', errors='ignore')
 
-    total_n = ct_clean.values.sum()
+    arr = ct_clean.to_numpy()
+    # 整数・真偽値の度数表は int64 で累積（桁あふれ防止）
+    if arr.dtype == bool or np.issubdtype(arr.dtype, np.integer):
+        total_n = arr.sum(dtype=np.int64)
+    else:
+        total_n = arr.sum()
 
     # 最頻セル
-    max_idx = ct_clean.values.argmax()
-    max_row_idx, max_col_idx = divmod(max_idx, ct_clean.shape[1])
+    max_row_idx, max_col_idx = np.unravel_index(arr.argmax(), arr.shape)
     max_row = ct_clean.index[max_row_idx]
     max_col = ct_clean.columns[max_col_idx]
-    max_count = ct_clean.iloc[max_row_idx, max_col_idx]
+    max_count = arr[max_row_idx, max_col_idx]
 
     return {
         'row_var': row_var,
@@ -256,17 +333,10 @@ def filter_crosstab_by_category(
     Returns:
         pd.DataFrame: フィルタ済みクロス集計表
     """
-    result = ct.copy()
-
-    if row_categories:
-        valid_rows = [r for r in row_categories if r in result.index]
-        result = result.loc[valid_rows]
+    rows = [r for r in row_categories if r in ct.index] if row_categories else slice(None)
+    cols = [c for c in col_categories if c in ct.columns] if col_categories else slice(None)
 
-    if col_categories:
-        valid_cols = [c for c in col_categories if c in result.columns]
-        result = result[valid_cols]
-
-    return result
+    return ct.loc[rows, cols]
 
 
 def calculate_row_percentages(ct: pd.DataFrame) -> pd.DataFrame:
@@ -280,14 +350,13 @@ def calculate_row_percentages(ct: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: パーセンテージ表
     """
     # 合計列を除外して計算
-    ct_clean = ct.copy()
-    if '合計' in ct_clean.columns:
-        ct_clean = ct_clean.drop('合計', axis=1)
+    ct_clean = ct.drop(columns='合計', errors='ignore')
 
-    row_sums = ct_clean.sum(axis=1)
-    pct = ct_clean.div(row_sums, axis=0) * 100
+    arr = ct_clean.to_numpy(dtype=np.float64)
+    row_sums = arr.sum(axis=1, keepdims=True)
+    pct = np.divide(arr, row_sums, out=np.full_like(arr, np.nan), where=row_sums != 0) * 100
 
-    return pct.round(1)
+    return pd.DataFrame(pct, index=ct_clean.index, columns=ct_clean.columns).round(1)
 
 
 def calculate_column_percentages(ct: pd.DataFrame) -> pd.DataFrame:
@@ -301,14 +370,13 @@ def calculate_column_percentages(ct: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: パーセンテージ表
     """
     # 合計行を除外して計算
-    ct_clean = ct.copy()
-    if '合計' in ct_clean.index:
-        ct_clean = ct_clean.drop('合計')
+    ct_clean = ct.drop(index='合計', errors='ignore')
 
-    col_sums = ct_clean.sum(axis=0)
-    pct = ct_clean.div(col_sums, axis=1) * 100
+    arr = ct_clean.to_numpy(dtype=np.float64)
+    col_sums = arr.sum(axis=0, keepdims=True)
+    pct = np.divide(arr, col_sums, out=np.full_like(arr, np.nan), where=col_sums != 0) * 100
 
-    return pct.round(1)
+    return pd.DataFrame(pct, index=ct_clean.index, columns=ct_clean.columns).round(1)
 
 
 def export_crosstabs_to_csv(
@@ -332,13 +400,19 @@ def export_crosstabs_to_csv(
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    saved_files = []
-
-    for name, ct in crosstabs.items():
-        filename = f"{prefix}_{name}.csv"
-        filepath = output_path / filename
+    def save(item: Tuple[str, pd.DataFrame]) -> str:
+        name, ct = item
+        filepath = output_path / f"{prefix}_{name}.csv"
         ct.to_csv(filepath, encoding='utf-8-sig')
-        saved_files.append(str(filepath))
-        warnings.warn(f"保存完了: {filename}", UserWarning, stacklevel=2)
+        return str(filepath)
+
+    # ファイルごとの書き出しは独立しているためスレッドで並列実行（順序は入力どおり）
+    saved_files = map_in_threads(save, list(crosstabs.items()), max_workers=8)
+
+    if saved_files:
+        warnings.warn(
+            f"保存完了: {len(saved_files)}ファイル ({output_path})",
+            UserWarning, stacklevel=2
+        )
 
     return saved_files
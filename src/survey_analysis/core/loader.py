@@ -4,8 +4,10 @@
 CSVデータの読み込み、クリーニング、前処理を提供。
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Dict, Any
+import codecs
 import warnings
 
 import pandas as pd
@@ -14,13 +16,32 @@ import chardet
 
 from survey_analysis.base.config import SurveyConfig
 
-warnings.filterwarnings('ignore')
+
+# オプショナル依存
+_PYARROW_AVAILABLE: bool = False
+
+try:
+    import pyarrow as pa
+    _PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+
+
+# BOM -> エンコーディング名（長いBOMから順に判定）
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
 
 
 def detect_encoding(file_path: Path, sample_size: int = 10000) -> str:
     """
     ファイルのエンコーディングを自動検出
 
+    BOMがあればそれで判定し、無い場合のみ chardet で推定する。
+    結果はファイルの更新日時ごとにキャッシュされる。
+
     Args:
         file_path: ファイルパス
         sample_size: 検出に使用するバイト数
@@ -28,17 +49,66 @@ def detect_encoding(file_path: Path, sample_size: int = 10000) -> str:
     Returns:
         str: 検出されたエンコーディング名
     """
+    stat = Path(file_path).stat()
+    return _detect_encoding_cached(
+        str(file_path), stat.st_mtime_ns, stat.st_size, sample_size
+    )
+
+
+@lru_cache(maxsize=64)
+def _detect_encoding_cached(
+    file_path: str,
+    mtime_ns: int,
+    file_size: int,
+    sample_size: int
+) -> str:
+    """detect_encoding の本体（更新日時・サイズをキーにキャッシュ）"""
     with open(file_path, 'rb') as f:
         raw_data = f.read(sample_size)
+
+    return _detect_encoding_from_bytes(raw_data)
+
+
+def _detect_encoding_from_bytes(raw_data: bytes) -> str:
+    """
+    バイト列からエンコーディングを判定（BOM優先、無ければ chardet で推定）
+
+    Args:
+        raw_data: ファイル先頭のバイト列
+
+    Returns:
+        str: 検出されたエンコーディング名
+    """
+    for bom, bom_encoding in _BOM_ENCODINGS:
+        if raw_data.startswith(bom):
+            return bom_encoding
+
     result = chardet.detect(raw_data)
-    encoding = result['encoding']
+    return result['encoding'] or 'utf-8'
+
+
+def _read_csv(file_path: Path, encoding: str) -> pd.DataFrame:
+    """
+    CSVを読み込む
+
+    pyarrowが利用可能ならArrowのCSVパーサー（マルチスレッド）で読み込み、
+    解釈できない場合はCエンジンで読み直す（Pythonエンジンには落とさない）。
+    列の型は従来どおりNumPyベースのまま返す。
 
-    # BOM付きUTF-8の処理
-    if encoding and encoding.lower() in ['utf-8', 'ascii']:
-        if raw_data.startswith(b'\xef\xbb\xbf'):
-            encoding = 'utf-8-sig'
+    Args:
+        file_path: ファイルパス
+        encoding: エンコーディング名
+
+    Returns:
+        pd.DataFrame: 読み込んだデータフレーム
+    """
+    if _PYARROW_AVAILABLE:
+        try:
+            return pd.read_csv(file_path, encoding=encoding, engine='pyarrow')
+        except (ValueError, UnicodeError, pa.ArrowException):
+            pass
 
-    return encoding or 'utf-8'
+    return pd.read_csv(file_path, encoding=encoding, engine='c')
 
 
 def load_raw_data(config: SurveyConfig) -> pd.DataFrame:
@@ -61,7 +131,7 @@ def load_raw_data(config: SurveyConfig) -> pd.DataFrame:
     if encoding == 'auto':
         encoding = detect_encoding(file_path)
 
-    df = pd.read_csv(file_path, encoding=encoding)
+    df = _read_csv(file_path, encoding)
     warnings.warn(
         f"データ読み込み完了: {len(df)} 行 × {len(df.columns)} 列",
         UserWarning,
@@ -81,10 +151,13 @@ def clean_column_names(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: クリーニング済みデータフレーム
     """
-    df = df.copy()
-    # 前後の空白を削除
-    df.columns = df.columns.str.strip()
-    return df
+    columns = df.columns
+    # 除去する空白がなければ Index を作り直さずそのまま使う
+    if all(isinstance(c, str) and c == c.strip() for c in columns):
+        return df.set_axis(columns, axis=1)
+
+    # 前後の空白を削除（カラム名の付け替えのみのためデータはコピーしない）
+    return df.set_axis(columns.str.strip(), axis=1)
 
 
 def handle_missing_values(
@@ -103,15 +176,13 @@ def handle_missing_values(
     Returns:
         pd.DataFrame: 処理済みデータフレーム
     """
-    df = df.copy()
-
     if strategy == 'drop':
-        df = df.dropna()
-    elif strategy == 'fill':
-        df = df.fillna(fill_value if fill_value is not None else '')
-    # 'keep' の場合はそのまま
+        return df.dropna()
+    if strategy == 'fill':
+        return df.fillna(fill_value if fill_value is not None else '')
 
-    return df
+    # 'keep' の場合はそのまま（データはコピーしない）
+    return df.copy(deep=False)
 
 
 def split_multiselect_cell(cell_value: str, delimiter: str = '、') -> List[str]:
@@ -130,6 +201,30 @@ def split_multiselect_cell(cell_value: str, delimiter: str = '、') -> List[str]
     return [v.strip() for v in cell_value.split(delimiter) if v.strip()]
 
 
+def split_multiselect_series(series: pd.Series, delimiter: str = '、') -> pd.Series:
+    """
+    複数選択カラムをまとめて分割
+
+    各要素の結果は split_multiselect_cell と同じ（文字列以外・欠損値は空リスト）。
+    Series.apply を介さず、値を1回だけリスト化して分割する。
+
+    Args:
+        series: 複数選択カラム
+        delimiter: 区切り文字
+
+    Returns:
+        pd.Series: 分割された値のリストを要素に持つシリーズ（元と同じインデックス）
+    """
+    result = []
+    for value in series.tolist():
+        if isinstance(value, str):
+            result.append([v.strip() for v in value.split(delimiter) if v.strip()])
+        else:
+            result.append([])
+
+    return pd.Series(result, index=series.index, dtype=object, name=series.name)
+
+
 def convert_ordered_categories(
     df: pd.DataFrame,
     config: SurveyConfig
@@ -144,32 +239,72 @@ def convert_ordered_categories(
     Returns:
         pd.DataFrame: 変換済みデータフレーム
     """
-    df = df.copy()
+    # カラム単位で置き換えるだけなので浅いコピーで入力は変更されない
+    df = df.copy(deep=False)
 
-    for col_key, order in config.category_orders.items():
+    for col_key, dtype in config._category_dtypes.items():
         # 質問IDからカラム名を取得
         col_name = config.get_column_name(col_key)
         if col_name not in df.columns:
             continue
 
-        # 既存の値をチェック
-        existing_values = df[col_name].dropna().unique()
+        # 順序上の位置をコードとしてカテゴリカル型を構築（構築済みの型を再利用）
+        # 順序に含まれない値はコード -1（欠損）になる
+        series = df[col_name]
+        codes = dtype.categories.get_indexer(series)
+        converted = pd.Series(
+            pd.Categorical.from_codes(codes, dtype=dtype),
+            index=series.index,
+            name=col_name
+        )
 
-        # 順序に含まれない値があれば警告
-        missing_from_order = set(existing_values) - set(order)
-        if missing_from_order:
+        # 順序に含まれない値があれば、その場合のみ該当値を調べて警告
+        dropped = (codes == -1) & series.notna().to_numpy()
+        if dropped.any():
+            missing_from_order = set(series[dropped].unique())
             warnings.warn(
                 f"'{col_name}' に順序定義にない値があります: {missing_from_order}",
                 UserWarning,
                 stacklevel=2
             )
 
-        # カテゴリカル型に変換
-        df[col_name] = pd.Categorical(
-            df[col_name],
-            categories=order,
-            ordered=True
-        )
+        df[col_name] = converted
+
+    return df
+
+
+def convert_string_columns_to_category(
+    df: pd.DataFrame,
+    max_unique_ratio: float = 0.5
+) -> pd.DataFrame:
+    """
+    繰り返しの多い文字列カラムをcategory型に変換
+
+    アンケートの回答カラムは少数の選択肢が繰り返されるため、
+    category型（整数コード + カテゴリ辞書）にするとメモリが減り、
+    以降の groupby / クロス集計もコード上で処理される。
+    自由記述のようにユニーク値の多いカラムは変換しない。
+
+    Args:
+        df: データフレーム
+        max_unique_ratio: 変換対象とするユニーク値の割合の上限（行数比）
+
+    Returns:
+        pd.DataFrame: 変換済みデータフレーム
+    """
+    df = df.copy(deep=False)
+
+    n = len(df)
+    for col in df.columns:
+        dtype = df[col].dtype
+        # 既にcategory型（順序付きを含む）のカラムはそのまま
+        if isinstance(dtype, pd.CategoricalDtype):
+            continue
+        if not (pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)):
+            continue
+
+        if df[col].nunique(dropna=True) < n * max_unique_ratio:
+            df[col] = df[col].astype('category')
 
     return df
 
@@ -190,7 +325,15 @@ def create_numeric_scores(
     Returns:
         pd.Series: 数値スコアのシリーズ
     """
-    return df[column].map(score_mapping)
+    # Series.map(dict) はハッシュ表による一括変換（category型ではカテゴリ数だけ変換してコードで展開）
+    scores = df[column].map(score_mapping)
+
+    # category型の入力で全カテゴリが対応付くと結果もcategory型になるため数値型に戻す
+    if isinstance(scores.dtype, pd.CategoricalDtype):
+        numeric_dtype = np.float64 if scores.isna().any() else scores.cat.categories.dtype
+        scores = scores.astype(numeric_dtype)
+
+    return scores
 
 
 def add_derived_columns(
@@ -209,7 +352,7 @@ def add_derived_columns(
     Returns:
         pd.DataFrame: 派生カラム追加済みデータフレーム
     """
-    df = df.copy()
+    df = df.copy(deep=False)
 
     if derivations:
         for col_name, func in derivations.items():
@@ -228,7 +371,8 @@ def add_derived_columns(
 def load_and_prepare_data(
     config: SurveyConfig,
     missing_strategy: str = 'keep',
-    derivations: Optional[Dict[str, callable]] = None
+    derivations: Optional[Dict[str, callable]] = None,
+    categorize: bool = False
 ) -> pd.DataFrame:
     """
     データを読み込み、前処理を実行
@@ -237,6 +381,9 @@ def load_and_prepare_data(
         config: SurveyConfig の具象クラスインスタンス
         missing_strategy: 欠損値処理戦略
         derivations: 派生カラム生成関数のマッピング
+        categorize: 繰り返しの多い文字列カラムをcategory型に変換するか
+            （create_crosstab / chi_square_test 等の集計が整数コード上で行われる。
+            category型の列には新しい値を fillna や代入で追加できないため、明示的に指定した場合のみ変換）
 
     Returns:
         pd.DataFrame: 前処理済みデータフレーム
@@ -265,6 +412,10 @@ def load_and_prepare_data(
     if derivations:
         df = add_derived_columns(df, config, derivations)
 
+    # 6. 文字列カラムをcategory型に変換（派生カラムの生成関数には元の型を渡す）
+    if categorize:
+        df = convert_string_columns_to_category(df)
+
     warnings.warn(
         f"前処理完了: {len(df)} 行 × {len(df.columns)} 列",
         UserWarning,
@@ -296,11 +447,10 @@ def validate_data(df: pd.DataFrame, config: SurveyConfig) -> Dict[str, Any]:
     }
 
     # 必要なカラムの存在チェック
-    expected_columns = set(config.questions.values())
-    actual_columns = set(df.columns)
+    expected_columns = config._expected_columns
 
-    results['missing_columns'] = list(expected_columns - actual_columns)
-    results['extra_columns'] = list(actual_columns - expected_columns)
+    results['missing_columns'] = list(expected_columns.difference(df.columns))
+    results['extra_columns'] = list(set(df.columns).difference(expected_columns))
 
     if results['missing_columns']:
         results['is_valid'] = False
@@ -308,13 +458,12 @@ def validate_data(df: pd.DataFrame, config: SurveyConfig) -> Dict[str, Any]:
             f"必要なカラムがありません: {results['missing_columns']}"
         )
 
-    # 欠損値チェック
-    for col in df.columns:
-        missing_count = df[col].isna().sum()
-        if missing_count > 0:
-            results['missing_values'][col] = {
-                'count': int(missing_count),
-                'percentage': float(missing_count / len(df) * 100)
-            }
+    # 欠損値チェック（全カラムの欠損数を1回の走査で集計）
+    missing_counts = df.isna().sum()
+    for col, missing_count in missing_counts[missing_counts > 0].items():
+        results['missing_values'][col] = {
+            'count': int(missing_count),
+            'percentage': float(missing_count / len(df) * 100)
+        }
 
     return results
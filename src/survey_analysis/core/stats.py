@@ -15,8 +15,8 @@ import statsmodels.api as sm
 from statsmodels.stats.multitest import multipletests
 
 from survey_analysis.base.config import SurveyConfig
-
-warnings.filterwarnings('ignore')
+from survey_analysis.core.crosstab import _fast_crosstab_counts
+from survey_analysis.utils.parallel import map_in_threads
 
 
 # =============================================================================
@@ -39,17 +39,19 @@ def calculate_frequency_distribution(
     Returns:
         pd.DataFrame: 度数分布表
     """
-    counts = df[column].value_counts(dropna=False)
+    series = df[column]
+    counts = series.value_counts(dropna=False)
 
-    result = pd.DataFrame({
+    data = {
         'choice': counts.index,
-        'count': counts.values
-    })
+        'count': counts.to_numpy()
+    }
 
     if normalize:
-        result['percentage'] = (result['count'] / result['count'].sum() * 100).round(2)
+        # dropna=False のため度数の合計は行数と等しい（合計の再計算は不要）
+        data['percentage'] = (data['count'] / len(series) * 100).round(2)
 
-    return result
+    return pd.DataFrame(data)
 
 
 def calculate_summary_statistics(
@@ -70,18 +72,7 @@ def calculate_summary_statistics(
 
     # 数値型の場合
     if pd.api.types.is_numeric_dtype(series):
-        return {
-            'count': int(len(series)),
-            'mean': float(series.mean()),
-            'std': float(series.std()),
-            'min': float(series.min()),
-            'max': float(series.max()),
-            'median': float(series.median()),
-            'q1': float(series.quantile(0.25)),
-            'q3': float(series.quantile(0.75)),
-            'skewness': float(series.skew()),
-            'kurtosis': float(series.kurtosis())
-        }
+        return _numeric_summary(series.to_numpy(dtype=np.float64))
 
     # カテゴリカル型の場合
     value_counts = series.value_counts()
@@ -94,6 +85,52 @@ def calculate_summary_statistics(
     }
 
 
+def _numeric_summary(values: np.ndarray) -> Dict[str, Any]:
+    """
+    数値配列の要約統計量を計算（モーメントと分位点をそれぞれ1回の走査で算出）
+
+    pandas の mean/std/skew/kurtosis と同じ定義（不偏分散、バイアス補正済みの
+    歪度・超過尖度）で、件数不足や分散0の場合の扱いも揃える。
+
+    Args:
+        values: 欠損値を除いた float64 配列
+
+    Returns:
+        dict: 要約統計量
+    """
+    n = len(values)
+    if n == 0:
+        return {
+            'count': 0, 'mean': np.nan, 'std': np.nan, 'min': np.nan, 'max': np.nan,
+            'median': np.nan, 'q1': np.nan, 'q3': np.nan,
+            'skewness': np.nan, 'kurtosis': np.nan
+        }
+
+    # 分散0のデータでは SciPy が精度低下の RuntimeWarning を出すが、その場合の値は下で上書きする
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        desc = stats.describe(values, bias=False)
+    q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+
+    # pandas と同様、歪度は3件以上・尖度は4件以上で定義し、分散0なら0とする
+    constant = desc.variance == 0
+    skewness = np.nan if n < 3 else (0.0 if constant else desc.skewness)
+    kurtosis = np.nan if n < 4 else (0.0 if constant else desc.kurtosis)
+
+    return {
+        'count': int(n),
+        'mean': float(desc.mean),
+        'std': float(np.sqrt(desc.variance)),
+        'min': float(desc.minmax[0]),
+        'max': float(desc.minmax[1]),
+        'median': float(median),
+        'q1': float(q1),
+        'q3': float(q3),
+        'skewness': float(skewness),
+        'kurtosis': float(kurtosis)
+    }
+
+
 def calculate_all_frequencies(
     df: pd.DataFrame,
     config: SurveyConfig,
@@ -137,16 +174,17 @@ def analyze_missing_values(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: 欠損値分析結果
     """
-    missing_counts = df.isnull().sum()
+    missing_counts = df.isna().to_numpy().sum(axis=0, dtype=np.int64)
     missing_pcts = (missing_counts / len(df) * 100).round(2)
 
-    result = pd.DataFrame({
-        'column': missing_counts.index,
-        'missing_count': missing_counts.values,
-        'missing_percentage': missing_pcts.values
-    })
+    # 欠損数の降順（同数の場合は元のカラム順）
+    order = np.argsort(-missing_counts, kind='stable')
 
-    return result.sort_values('missing_count', ascending=False)
+    return pd.DataFrame({
+        'column': df.columns.to_numpy()[order],
+        'missing_count': missing_counts[order],
+        'missing_percentage': missing_pcts[order]
+    }, index=order)
 
 
 # =============================================================================
@@ -157,7 +195,8 @@ def chi_square_test(
     df: pd.DataFrame,
     var1: str,
     var2: str,
-    config: Optional[SurveyConfig] = None
+    config: Optional[SurveyConfig] = None,
+    contingency_table: Optional[pd.DataFrame] = None
 ) -> Dict[str, Any]:
     """
     カイ二乗検定を実行
@@ -167,6 +206,8 @@ def chi_square_test(
         var1: 行変数（質問IDまたはカラム名）
         var2: 列変数（質問IDまたはカラム名）
         config: SurveyConfig（質問ID→カラム名変換用）
+        contingency_table: 作成済みのクロス集計表（'合計' 行/列は無視）。
+            指定時は df から集計し直さない
 
     Returns:
         dict: 検定結果（chi2, p_value, dof, cramers_v等）
@@ -175,24 +216,54 @@ def chi_square_test(
     col1 = config.get_column_name(var1) if config else var1
     col2 = config.get_column_name(var2) if config else var2
 
+    return _chi_square_on_columns(df, col1, col2, var1, var2, contingency_table)
+
+
+def _chi_square_on_columns(
+    df: pd.DataFrame,
+    col1: str,
+    col2: str,
+    var1: str,
+    var2: str,
+    contingency_table: Optional[pd.DataFrame] = None
+) -> Dict[str, Any]:
+    """
+    解決済みのカラム名でカイ二乗検定を実行（chi_square_test の本体）
+
+    Args:
+        df: データフレーム
+        col1: 行変数のカラム名
+        col2: 列変数のカラム名
+        var1: 結果に記録する行変数名
+        var2: 結果に記録する列変数名
+        contingency_table: 作成済みのクロス集計表
+
+    Returns:
+        dict: 検定結果
+    """
     if col1 not in df.columns:
         raise ValueError(f"カラムが見つかりません: {col1}")
     if col2 not in df.columns:
         raise ValueError(f"カラムが見つかりません: {col2}")
 
     # クロス集計表作成
-    contingency_table = pd.crosstab(df[col1], df[col2])
+    if contingency_table is not None:
+        observed = contingency_table.drop(
+            index='合計', columns='合計', errors='ignore'
+        ).to_numpy()
+    else:
+        _, _, observed = _fast_crosstab_counts(df[col1], df[col2])
 
     # 空のセルがある場合の処理
-    if contingency_table.shape[0] < 2 or contingency_table.shape[1] < 2:
+    if observed.shape[0] < 2 or observed.shape[1] < 2:
         raise ValueError(f"クロス集計表が小さすぎます（2x2未満）: {var1} x {var2}")
 
     # カイ二乗検定
-    chi2, p_value, dof, expected = chi2_contingency(contingency_table)
+    chi2, p_value, dof, expected = chi2_contingency(observed)
 
     # Cramer's V（効果量）
-    n = contingency_table.sum().sum()
-    min_dim = min(contingency_table.shape[0] - 1, contingency_table.shape[1] - 1)
+    n = observed.sum()
+    min_dim = min(observed.shape[0] - 1, observed.shape[1] - 1)
     cramers_v = np.sqrt(chi2 / (n * min_dim)) if min_dim > 0 else 0
 
     return {
@@ -204,7 +275,7 @@ def chi_square_test(
         'dof': int(dof),
         'cramers_v': float(cramers_v),
         'expected': expected.tolist(),
-        'observed': contingency_table.values.tolist()
+        'observed': observed.tolist()
     }
 
 
@@ -301,9 +372,17 @@ def anova_test(
     if value_col not in df.columns:
         raise ValueError(f"カラムが見つかりません: {value_col}")
 
-    # グループ別データ
-    groups = df.groupby(group_col)[value_col].apply(list).to_dict()
-    group_data = [np.array(v) for v in groups.values() if len(v) > 0]
+    # グループ別データ（グループを整数コード化し、コード順に並べて分割）
+    values = df[value_col].to_numpy(dtype=np.float64)
+    codes, labels = pd.factorize(df[group_col], sort=True)
+    mask = (codes >= 0) & ~np.isnan(values)
+    values, codes = values[mask], codes[mask]
+
+    counts = np.bincount(codes, minlength=len(labels))
+    sorted_values = values[np.argsort(codes, kind='stable')]
+    group_data = [
+        g for g in np.split(sorted_values, np.cumsum(counts)[:-1]) if len(g) > 0
+    ]
 
     if len(group_data) < 2:
         raise ValueError(f"グループ数が不足しています: {len(group_data)}グループ")
@@ -312,10 +391,12 @@ def anova_test(
     f_stat, p_value = f_oneway(*group_data)
 
     # η²（効果量）
-    all_data = np.concatenate(group_data)
-    grand_mean = all_data.mean()
-    ss_between = sum(len(g) * (g.mean() - grand_mean) ** 2 for g in group_data)
-    ss_total = sum((all_data - grand_mean) ** 2)
+    observed = counts > 0
+    group_counts = counts[observed]
+    group_means = np.bincount(codes, weights=values, minlength=len(labels))[observed] / group_counts
+    grand_mean = values.mean()
+    ss_between = np.sum(group_counts * (group_means - grand_mean) ** 2)
+    ss_total = np.sum((values - grand_mean) ** 2)
     eta_squared = ss_between / ss_total if ss_total > 0 else 0
 
     return {
@@ -326,7 +407,11 @@ def anova_test(
         'p_value': float(p_value),
         'eta_squared': float(eta_squared),
         'n_groups': len(group_data),
-        'group_sizes': {k: len(v) for k, v in groups.items()}
+        'group_sizes': {
+            label: count
+            for label, count in zip(list(labels), counts.tolist())
+            if count > 0
+        }
     }
 
 
@@ -365,14 +450,14 @@ def correlation_test(
     if len(valid_data) < 3:
         raise ValueError(f"サンプルサイズが不足しています: {len(valid_data)}件")
 
-    # 順序カテゴリカルの場合はコード化
+    # 順序カテゴリカルの場合は整数コードの配列をそのまま渡す
     x = valid_data[col1]
     y = valid_data[col2]
 
-    if hasattr(x, 'cat') and x.cat.ordered:
-        x = x.cat.codes
-    if hasattr(y, 'cat') and y.cat.ordered:
-        y = y.cat.codes
+    if isinstance(x.dtype, pd.CategoricalDtype) and x.dtype.ordered:
+        x = x.cat.codes.to_numpy()
+    if isinstance(y.dtype, pd.CategoricalDtype) and y.dtype.ordered:
+        y = y.cat.codes.to_numpy()
 
     # 相関係数計算
     if method == 'spearman':
@@ -404,21 +489,57 @@ def apply_fdr_correction(
     多重検定補正（FDR）を適用
 
     Args:
-        p_values: p値のリスト
+        p_values: p値のリスト（配列・Seriesも可）
         method: 補正方法（'fdr_bh', 'bonferroni', 'holm'等）
         alpha: 有意水準
 
     Returns:
         tuple: (reject配列, 補正後p値, corrected_alpha_sidak, corrected_alpha_bonferroni)
     """
+    # Seriesのラベル参照にならないよう、先頭要素はイテレータで取り出す
+    if isinstance(next(iter(p_values), None), dict):
+        raise TypeError(
+            "検定結果の辞書のリストには apply_fdr_correction_to_results を使用してください"
+        )
+
     return multipletests(p_values, alpha=alpha, method=method)
 
 
+def apply_fdr_correction_to_results(
+    results: List[Dict[str, Any]],
+    method: str = 'fdr_bh',
+    alpha: float = 0.05
+) -> List[Dict[str, Any]]:
+    """
+    検定結果の辞書のリストに多重検定補正（FDR）を適用
+
+    Args:
+        results: 検定結果の辞書のリスト（'p_value' キーを持つ）
+        method: 補正方法（'fdr_bh', 'bonferroni', 'holm'等）
+        alpha: 有意水準
+
+    Returns:
+        List[Dict]: 各結果に 'p_value_corrected' と 'significant' を追加した新しい辞書のリスト
+    """
+    if not results:
+        return []
+
+    p_array = np.fromiter(
+        (r['p_value'] for r in results), dtype=np.float64, count=len(results)
+    )
+    reject, corrected, _, _ = multipletests(p_array, alpha=alpha, method=method)
+    return [
+        {**r, 'p_value_corrected': float(p), 'significant': bool(rej)}
+        for r, p, rej in zip(results, corrected, reject)
+    ]
+
+
 def run_all_chi_square_tests(
     df: pd.DataFrame,
     pairs: List[Tuple[str, str]],
     config: SurveyConfig,
-    apply_correction: bool = True
+    apply_correction: bool = True,
+    crosstabs: Optional[Dict[str, pd.DataFrame]] = None
 ) -> pd.DataFrame:
     """
     複数のカイ二乗検定を実行し、FDR補正を適用
@@ -428,15 +549,24 @@ def run_all_chi_square_tests(
         pairs: 検定する変数ペアのリスト
         config: SurveyConfig
         apply_correction: FDR補正を適用するか
+        crosstabs: 作成済みのクロス集計表（analyze_crosstabs_by_tier の戻り値）。
+            "{var1}_x_{var2}" のキーがあるペアはその表を再利用する
 
     Returns:
         pd.DataFrame: 検定結果一覧
     """
-    results = []
-
-    for var1, var2 in pairs:
-        result = chi_square_test(df, var1, var2, config)
-        results.append(result)
+    crosstabs = crosstabs or {}
+
+    # カラム名はペアの列挙時に1回だけ解決
+    q_map = config._questions_frozen
+    tasks = [
+        (q_map.get(var1, var1), q_map.get(var2, var2), var1, var2,
+         crosstabs.get(f"{var1}_x_{var2}"))
+        for var1, var2 in pairs
+    ]
+
+    # ペアごとの検定は独立しているためスレッドで並列実行（結果はペアの順序のまま）
+    results = map_in_threads(lambda task: _chi_square_on_columns(df, *task), tasks)
 
     # DataFrameに変換
     df_results = pd.DataFrame(results)
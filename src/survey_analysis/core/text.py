@@ -4,9 +4,14 @@
 形態素解析、頻出語分析、TF-IDF、ワードクラウド生成を提供。
 """
 
-from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import AbstractSet, Dict, FrozenSet, Iterable, Iterator, List, Optional, Any, Tuple
+from itertools import chain
+import os
+import platform
 import warnings
 import re
 
@@ -18,10 +23,17 @@ from survey_analysis.base.config import SurveyConfig
 warnings.filterwarnings('ignore')
 
 # オプショナル依存
+_FUGASHI_AVAILABLE: bool = False
 _JANOME_AVAILABLE: bool = False
 _SKLEARN_AVAILABLE: bool = False
 _WORDCLOUD_AVAILABLE: bool = False
 
+try:
+    import fugashi
+    _FUGASHI_AVAILABLE = True
+except ImportError:
+    fugashi = None
+
 try:
     from janome.tokenizer import Tokenizer
     _JANOME_AVAILABLE = True
@@ -42,7 +54,8 @@ except ImportError:
 
 
 # デフォルトストップワード（日本語）
-DEFAULT_STOPWORDS = [
+# トークンごとに所属判定するため frozenset で保持
+DEFAULT_STOPWORDS: FrozenSet[str] = frozenset([
     'の', 'に', 'は', 'を', 'た', 'が', 'で', 'て', 'と', 'し', 'れ', 'さ',
     'ある', 'いる', 'も', 'する', 'から', 'な', 'こと', 'として', 'い', 'や',
     'れる', 'など', 'なっ', 'ない', 'この', 'ため', 'その', 'あっ', 'よう',
@@ -53,7 +66,21 @@ DEFAULT_STOPWORDS = [
     'ませ', 'ん', 'よ', 'ね', 'けど', 'けれど', 'だけ', 'でも', 'じゃ',
     '思う', '思い', '感じ', '欲しい', 'ほしい', 'たい', 'くださ', 'ください',
     '特に', 'とても', 'すごく', 'やはり', 'やっぱり', '本当', 'ほんと',
-]
+])
+
+# デフォルトで抽出する品詞
+_DEFAULT_POS_FILTER: FrozenSet[str] = frozenset(['名詞', '動詞', '形容詞'])
+
+# 形態素解析のバックエンド（'janome' または 'fugashi'）
+# 基本形の表記が辞書によって異なるため、fugashiは明示的に指定した場合のみ使う
+_TOKENIZER_BACKENDS: Tuple[str, ...] = ('janome', 'fugashi')
+_TOKENIZER_BACKEND: str = 'janome'
+
+# 並列トークン化で1ワーカーに渡す最小テキスト数（短い回答を1件ずつ送ると転送コストが勝る）
+_TOKENIZE_MIN_BATCH_SIZE: int = 64
+
+# 数字のみのトークン（半角・全角）
+_DIGITS_ONLY_RE = re.compile(r'[0-9０-９]+')
 
 
 def check_janome_available() -> bool:
@@ -66,11 +93,99 @@ def check_wordcloud_available() -> bool:
     return _WORDCLOUD_AVAILABLE
 
 
+def set_tokenizer_backend(backend: str) -> None:
+    """
+    形態素解析のバックエンドを設定
+
+    Args:
+        backend: 'janome'（デフォルト）または 'fugashi'
+    """
+    global _TOKENIZER_BACKEND
+
+    if backend not in _TOKENIZER_BACKENDS:
+        raise ValueError(f"未対応のバックエンド: {backend}（'janome', 'fugashi' のいずれかを指定）")
+    _TOKENIZER_BACKEND = backend
+
+
+def _as_set(words: Iterable[str]) -> AbstractSet[str]:
+    """集合型でなければ frozenset に変換"""
+    if isinstance(words, (set, frozenset)):
+        return words
+    return frozenset(words)
+
+
+def _get_tokenizer() -> Any:
+    """
+    共有のトークナイザを取得
+
+    辞書の読み込みが重いため、インスタンスはバックエンドごとに1回だけ生成して使い回す。
+
+    Returns:
+        fugashi.Tagger または janome Tokenizer
+    """
+    return _create_tokenizer(_TOKENIZER_BACKEND)
+
+
+@lru_cache(maxsize=None)
+def _create_tokenizer(backend: str) -> Any:
+    """
+    指定バックエンドのトークナイザを生成
+
+    Args:
+        backend: 'janome' または 'fugashi'
+
+    Returns:
+        fugashi.Tagger または janome Tokenizer
+    """
+    if backend not in _TOKENIZER_BACKENDS:
+        raise ValueError(f"未対応のバックエンド: {backend}（'janome', 'fugashi' のいずれかを指定）")
+
+    # fugashi（MeCabバインディング）はJanomeより高速だが、辞書が未導入なら生成に失敗する
+    if backend == 'fugashi':
+        if not _FUGASHI_AVAILABLE:
+            raise ImportError("fugashiがインストールされていません: pip install 'fugashi[unidic-lite]'")
+        return fugashi.Tagger()
+
+    if not _JANOME_AVAILABLE:
+        raise ImportError("janomeがインストールされていません: pip install janome")
+    return Tokenizer()
+
+
+def _iter_morphemes(tokenizer: Any, text: str) -> Iterator[Tuple[str, str]]:
+    """
+    形態素ごとに (品詞大分類, 基本形) を返す
+
+    Args:
+        tokenizer: fugashi.Tagger または janome Tokenizer
+        text: 入力テキスト
+
+    Yields:
+        tuple: (品詞大分類, 基本形)。基本形がない場合は表層形
+    """
+    if Tokenizer is not None and isinstance(tokenizer, Tokenizer):
+        for token in tokenizer.tokenize(text):
+            base_form = token.base_form
+            if base_form == '*':
+                base_form = token.surface
+            yield token.part_of_speech.split(',')[0], base_form
+        return
+
+    # fugashi（UniDic）: 語彙素（lemma）は 為る・有る のように漢字表記に正規化されるため、
+    # Janomeの基本形と表記が揃う書字形基本形（orthBase）を使う
+    for word in tokenizer(text):
+        feature = word.feature
+        base_form = getattr(feature, 'orthBase', None)
+        if not base_form or base_form == '*':
+            base_form = word.surface
+        yield feature.pos1, base_form
+
+
 def tokenize_japanese_text(
     text: str,
-    pos_filter: Optional[List[str]] = None,
-    stopwords: Optional[List[str]] = None,
-    min_length: int = 2
+    pos_filter: Optional[Iterable[str]] = None,
+    stopwords: Optional[Iterable[str]] = None,
+    min_length: int = 2,
+    tokenizer: Optional[Any] = None
 ) -> List[str]:
     """
     日本語テキストを形態素解析してトークン化
@@ -80,42 +195,34 @@ def tokenize_japanese_text(
         pos_filter: 抽出する品詞（None=名詞・動詞・形容詞）
         stopwords: 除外する単語
         min_length: 最小文字数
+        tokenizer: 使用するトークナイザ（None=共有インスタンス）
 
     Returns:
         List[str]: トークンリスト
     """
-    if not _JANOME_AVAILABLE:
-        raise ImportError("janomeがインストールされていません: pip install janome")
+    if tokenizer is None:
+        tokenizer = _get_tokenizer()
 
     if pd.isna(text) or not isinstance(text, str) or not text.strip():
         return []
 
-    if pos_filter is None:
-        pos_filter = ['名詞', '動詞', '形容詞']
-
-    if stopwords is None:
-        stopwords = DEFAULT_STOPWORDS
+    # 所属判定はトークンごとに行うため、集合でなければ1回だけ変換
+    pos_filter = _DEFAULT_POS_FILTER if pos_filter is None else _as_set(pos_filter)
+    stopwords = DEFAULT_STOPWORDS if stopwords is None else _as_set(stopwords)
 
-    tokenizer = Tokenizer()
     tokens = []
 
-    for token in tokenizer.tokenize(text):
+    for pos, base_form in _iter_morphemes(tokenizer, text):
         # 品詞フィルタ
-        pos = token.part_of_speech.split(',')[0]
         if pos not in pos_filter:
             continue
 
-        # 基本形を使用
-        base_form = token.base_form
-        if base_form == '*':
-            base_form = token.surface
-
         # フィルタリング
         if len(base_form) < min_length:
             continue
         if base_form in stopwords:
             continue
-        if re.match(r'^[0-9０-９]+$', base_form):  # 数字のみ除外
+        if _DIGITS_ONLY_RE.fullmatch(base_form):  # 数字のみ除外
             continue
 
         tokens.append(base_form)
@@ -123,11 +230,85 @@ def tokenize_japanese_text(
     return tokens
 
 
+def _tokenize_texts(
+    texts: List[str],
+    config: Optional[SurveyConfig] = None,
+    pos_filter: Optional[Iterable[str]] = None,
+    n_jobs: int = 1
+) -> List[List[str]]:
+    """
+    テキストリストをまとめてトークン化
+
+    ストップワード・品詞フィルタの集合化とトークナイザの取得は1回だけ行う。
+    形態素解析はGILを解放しないため、並列化はプロセスで行う。
+
+    Args:
+        texts: テキストリスト
+        config: SurveyConfig（stopwords使用）
+        pos_filter: 品詞フィルタ
+        n_jobs: 並列プロセス数（1=逐次実行、-1=CPU数）
+
+    Returns:
+        List[List[str]]: テキストごとのトークンリスト（入力と同じ順序）
+    """
+    stopwords = frozenset(config.stopwords) if config else DEFAULT_STOPWORDS
+    if pos_filter is not None:
+        pos_filter = _as_set(pos_filter)
+
+    workers = (os.cpu_count() or 1) if n_jobs < 0 else n_jobs
+    batch_size = max(_TOKENIZE_MIN_BATCH_SIZE, len(texts) // (max(workers, 1) * 4))
+    if workers <= 1 or len(texts) <= batch_size:
+        return _tokenize_batch(texts, pos_filter, stopwords)
+
+    # トークナイザ（辞書）は転送せず、各ワーカープロセスで初回に生成する
+    batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(batches))) as executor:
+        results = executor.map(
+            _tokenize_batch,
+            batches,
+            [pos_filter] * len(batches),
+            [stopwords] * len(batches),
+            [_TOKENIZER_BACKEND] * len(batches)
+        )
+        return [tokens for batch in results for tokens in batch]
+
+
+def _tokenize_batch(
+    texts: List[str],
+    pos_filter: Optional[AbstractSet[str]],
+    stopwords: AbstractSet[str],
+    backend: Optional[str] = None
+) -> List[List[str]]:
+    """
+    共有トークナイザでテキストのまとまりをトークン化（プロセス並列のワーカー関数）
+
+    Args:
+        texts: テキストリスト
+        pos_filter: 品詞フィルタ
+        stopwords: 除外する単語
+        backend: 形態素解析のバックエンド（None=現在の設定。ワーカープロセスには親の設定を渡す）
+
+    Returns:
+        List[List[str]]: テキストごとのトークンリスト
+    """
+    tokenizer = _get_tokenizer() if backend is None else _create_tokenizer(backend)
+    return [
+        tokenize_japanese_text(
+            text,
+            pos_filter=pos_filter,
+            stopwords=stopwords,
+            tokenizer=tokenizer
+        )
+        for text in texts
+    ]
+
+
 def extract_word_frequency(
     texts: List[str],
     config: Optional[SurveyConfig] = None,
     top_n: int = 50,
-    pos_filter: Optional[List[str]] = None
+    pos_filter: Optional[Iterable[str]] = None,
+    tokenized_texts: Optional[List[List[str]]] = None
 ) -> pd.DataFrame:
     """
     テキストリストから頻出語を抽出
@@ -137,32 +318,31 @@ def extract_word_frequency(
         config: SurveyConfig（stopwords使用）
         top_n: 上位N語
         pos_filter: 品詞フィルタ
+        tokenized_texts: トークン化済みのテキスト（指定時は texts を再解析しない）
 
     Returns:
         pd.DataFrame: 頻出語と出現回数
     """
-    stopwords = config.stopwords if config else DEFAULT_STOPWORDS
+    if tokenized_texts is None:
+        tokenized_texts = _tokenize_texts(texts, config, pos_filter)
 
-    all_tokens = []
-    for text in texts:
-        tokens = tokenize_japanese_text(
-            text,
-            pos_filter=pos_filter,
-            stopwords=stopwords
-        )
-        all_tokens.extend(tokens)
+    # トークンを連結リストにせずそのまま数え上げ、出現回数の降順（同数は初出順）で上位N語
+    word_counts = Counter(chain.from_iterable(tokenized_texts)).most_common(top_n)
 
-    word_counts = Counter(all_tokens)
-    top_words = word_counts.most_common(top_n)
+    return pd.DataFrame(word_counts, columns=['word', 'count']).astype({'count': 'int64'})
 
-    return pd.DataFrame(top_words, columns=['word', 'count'])
+
+def _passthrough_analyzer(tokens: List[str]) -> List[str]:
+    """トークン化済みの文書をそのまま返す（TfidfVectorizer の analyzer 用）"""
+    return tokens
 
 
 def extract_tfidf_keywords(
     texts: List[str],
     config: Optional[SurveyConfig] = None,
     top_n: int = 20,
-    max_features: int = 1000
+    max_features: int = 1000,
+    tokenized_texts: Optional[List[List[str]]] = None
 ) -> pd.DataFrame:
     """
     TF-IDFでキーワードを抽出
@@ -172,6 +352,7 @@ def extract_tfidf_keywords(
         config: SurveyConfig
         top_n: 上位N語
         max_features: 最大特徴数
+        tokenized_texts: トークン化済みのテキスト（指定時は texts を再解析しない）
 
     Returns:
         pd.DataFrame: キーワードとTF-IDFスコア
@@ -179,32 +360,53 @@ def extract_tfidf_keywords(
     if not _SKLEARN_AVAILABLE:
         raise ImportError("scikit-learnがインストールされていません")
 
-    stopwords = config.stopwords if config else DEFAULT_STOPWORDS
-
-    # テキストをトークン化して結合
-    tokenized_texts = []
-    for text in texts:
-        tokens = tokenize_japanese_text(text, stopwords=stopwords)
-        tokenized_texts.append(' '.join(tokens))
+    if tokenized_texts is None:
+        tokenized_texts = _tokenize_texts(texts, config)
 
-    # 空のテキストを除去
-    tokenized_texts = [t for t in tokenized_texts if t.strip()]
+    # トークンのないテキストを除去
+    documents = [tokens for tokens in tokenized_texts if tokens]
 
-    if not tokenized_texts:
+    if not documents:
         return pd.DataFrame(columns=['word', 'tfidf_score'])
 
-    # TF-IDF計算
-    vectorizer = TfidfVectorizer(max_features=max_features)
-    tfidf_matrix = vectorizer.fit_transform(tokenized_texts)
+    # TF-IDF計算（トークン列をそのまま渡し、空白での結合・再分割をしない）
+    vectorizer = TfidfVectorizer(max_features=max_features, analyzer=_passthrough_analyzer)
+    tfidf_matrix = vectorizer.fit_transform(documents)
 
     # 平均TF-IDFスコア
-    mean_tfidf = tfidf_matrix.mean(axis=0).A1
-    words = vectorizer.get_feature_names_out()
+    mean_tfidf = np.asarray(tfidf_matrix.mean(axis=0)).ravel()
+    top = _top_n_indices(mean_tfidf, top_n)
+
+    return pd.DataFrame({
+        'word': vectorizer.get_feature_names_out()[top],
+        'tfidf_score': mean_tfidf[top]
+    })
+
+
+def _top_n_indices(scores: np.ndarray, top_n: int) -> np.ndarray:
+    """
+    スコア上位N件のインデックスを降順で返す（同点は元の順序）
+
+    全体のソートは行わず、N番目のスコア以上の候補だけを並べ替える。
+
+    Args:
+        scores: スコア配列
+        top_n: 件数
+
+    Returns:
+        np.ndarray: 上位N件のインデックス
+    """
+    k = max(0, min(top_n, len(scores)))
+    if k == 0:
+        return np.array([], dtype=np.intp)
 
-    word_scores = list(zip(words, mean_tfidf))
-    word_scores.sort(key=lambda x: x[1], reverse=True)
+    if k < len(scores):
+        kth_score = np.partition(scores, len(scores) - k)[len(scores) - k]
+        candidates = np.flatnonzero(scores >= kth_score)
+    else:
+        candidates = np.arange(len(scores))
 
-    return pd.DataFrame(word_scores[:top_n], columns=['word', 'tfidf_score'])
+    return candidates[np.argsort(-scores[candidates], kind='stable')][:k]
 
 
 def generate_wordcloud(
@@ -214,7 +416,8 @@ def generate_wordcloud(
     width: int = 800,
     height: int = 400,
     background_color: str = 'white',
-    font_path: Optional[str] = None
+    font_path: Optional[str] = None,
+    tokenized_texts: Optional[List[List[str]]] = None
 ) -> Optional[Any]:
     """
     ワードクラウドを生成
@@ -227,6 +430,7 @@ def generate_wordcloud(
         height: 高さ
         background_color: 背景色
         font_path: 日本語フォントパス
+        tokenized_texts: トークン化済みのテキスト（指定時は texts を再解析しない）
 
     Returns:
         WordCloud: 生成されたワードクラウド（またはNone）
@@ -234,20 +438,16 @@ def generate_wordcloud(
     if not _WORDCLOUD_AVAILABLE:
         raise ImportError("wordcloudがインストールされていません: pip install wordcloud")
 
-    stopwords = config.stopwords if config else DEFAULT_STOPWORDS
-
     # トークン化
-    all_tokens = []
-    for text in texts:
-        tokens = tokenize_japanese_text(text, stopwords=stopwords)
-        all_tokens.extend(tokens)
+    if tokenized_texts is None:
+        tokenized_texts = _tokenize_texts(texts, config)
+
+    text_combined = ' '.join(chain.from_iterable(tokenized_texts))
 
-    if not all_tokens:
+    if not text_combined:
         print("警告: トークンが抽出できませんでした")
         return None
 
-    text_combined = ' '.join(all_tokens)
-
     # フォントパス検出（日本語対応）
     if font_path is None:
         font_path = _find_japanese_font()
@@ -274,19 +474,19 @@ def generate_wordcloud(
     return wc
 
 
+@lru_cache(maxsize=1)
 def _find_japanese_font() -> Optional[str]:
-    """日本語フォントを検索"""
-    import platform
-
+    """日本語フォントを検索（結果はプロセス内でキャッシュ）"""
+    system = platform.system()
     font_paths = []
 
-    if platform.system() == 'Darwin':  # macOS
+    if system == 'Darwin':  # macOS
         font_paths = [
             '/System/Library/Fonts/ヒラギノ角ゴシック W3.ttc',
             '/System/Library/Fonts/Hiragino Sans GB.ttc',
             '/Library/Fonts/Arial Unicode.ttf',
         ]
-    elif platform.system() == 'Windows':
+    elif system == 'Windows':
         font_paths = [
             'C:/Windows/Fonts/msgothic.ttc',
             'C:/Windows/Fonts/meiryo.ttc',
@@ -310,7 +510,8 @@ def analyze_freetext_column(
     df: pd.DataFrame,
     column: str,
     config: Optional[SurveyConfig] = None,
-    output_dir: Optional[Path] = None
+    output_dir: Optional[Path] = None,
+    n_jobs: int = 1
 ) -> Dict[str, Any]:
     """
     自由記述カラムを分析
@@ -320,13 +521,15 @@ def analyze_freetext_column(
         column: カラム名
         config: SurveyConfig
         output_dir: 出力ディレクトリ
+        n_jobs: 形態素解析の並列プロセス数（1=逐次実行、-1=CPU数）
 
     Returns:
         dict: 分析結果
     """
-    # 有効なテキストを抽出
-    texts = df[column].dropna().astype(str).tolist()
-    texts = [t for t in texts if t.strip() and t.lower() != 'nan']
+    # 有効なテキストを抽出（空白のみ・文字列 'nan' を除外）
+    values = df[column].dropna().astype(str)
+    valid = values.str.strip().ne('') & values.str.lower().ne('nan')
+    texts = values[valid].tolist()
 
     result = {
         'column': column,
@@ -342,9 +545,18 @@ def analyze_freetext_column(
 
     print(f"\n分析中: {column} ({len(texts)} 件)")
 
+    # 形態素解析は1回だけ行い、頻出語・TF-IDF・ワードクラウドで共有
+    try:
+        tokenized_texts = _tokenize_texts(texts, config, n_jobs=n_jobs)
+    except Exception as e:
+        print(f"  警告: 形態素解析に失敗 - {e}")
+        return result
+
     # 頻出語
     try:
-        result['word_frequency'] = extract_word_frequency(texts, config, top_n=30)
+        result['word_frequency'] = extract_word_frequency(
+            texts, config, top_n=30, tokenized_texts=tokenized_texts
+        )
         print(f"  ✓ 頻出語抽出完了 (上位30語)")
     except Exception as e:
         print(f"  警告: 頻出語抽出に失敗 - {e}")
@@ -352,7 +564,9 @@ def analyze_freetext_column(
     # TF-IDF
     try:
         if _SKLEARN_AVAILABLE:
-            result['tfidf_keywords'] = extract_tfidf_keywords(texts, config, top_n=20)
+            result['tfidf_keywords'] = extract_tfidf_keywords(
+                texts, config, top_n=20, tokenized_texts=tokenized_texts
+            )
             print(f"  ✓ TF-IDFキーワード抽出完了 (上位20語)")
     except Exception as e:
         print(f"  警告: TF-IDF抽出に失敗 - {e}")
@@ -363,7 +577,9 @@ def analyze_freetext_column(
             output_dir = Path(output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
             wc_path = output_dir / f"wordcloud_{column}.png"
-            generate_wordcloud(texts, config, save_path=wc_path)
+            generate_wordcloud(
+                texts, config, save_path=wc_path, tokenized_texts=tokenized_texts
+            )
             result['wordcloud_path'] = str(wc_path)
         except Exception as e:
             print(f"  警告: ワードクラウド生成に失敗 - {e}")
@@ -375,7 +591,8 @@ def analyze_all_freetext(
     df: pd.DataFrame,
     freetext_columns: List[str],
     config: Optional[SurveyConfig] = None,
-    output_dir: Optional[Path] = None
+    output_dir: Optional[Path] = None,
+    n_jobs: int = 1
 ) -> Dict[str, Dict[str, Any]]:
     """
     複数の自由記述カラムを一括分析
@@ -385,6 +602,7 @@ def analyze_all_freetext(
         freetext_columns: 自由記述カラムのリスト
         config: SurveyConfig
         output_dir: 出力ディレクトリ
+        n_jobs: 形態素解析の並列プロセス数（1=逐次実行、-1=CPU数）
 
     Returns:
         dict: カラム名 → 分析結果のマッピング
@@ -400,7 +618,7 @@ def analyze_all_freetext(
             print(f"警告: カラム '{column}' が見つかりません")
             continue
 
-        result = analyze_freetext_column(df, column, config, output_dir)
+        result = analyze_freetext_column(df, column, config, output_dir, n_jobs=n_jobs)
         results[column] = result
 
     print("\n" + "=" * 60)
@@ -5,12 +5,16 @@
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import warnings
 
 import pandas as pd
 import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 from survey_analysis.base.config import SurveyConfig
 
@@ -40,6 +44,12 @@ matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+# クロス集計表の合計行/列のラベル（グラフ描画時は除外）
+_TOTAL_LABELS: List[str] = ['Total', '合計']
+
+# setup_plot_style で最後に適用した設定（style, figsize, font_size）
+_APPLIED_STYLE: Optional[Tuple[Any, ...]] = None
+
 # 日本語フォント対応
 _JAPANESE_FONT_FAMILY: Optional[str] = None
 try:
@@ -51,30 +61,84 @@ except ImportError:
     plt.rcParams['font.family'] = _JAPANESE_FONT_FAMILY
 
 
-def setup_plot_style(config: Optional[SurveyConfig] = None):
+def setup_plot_style(config: Optional[SurveyConfig] = None, force: bool = False):
     """
     プロットスタイルを設定
 
+    同じ設定が適用済みであれば rcParams を書き換えずに戻る（各プロット関数から毎回呼ばれるため）。
+
     Args:
         config: SurveyConfig（figure_settings プロパティ使用）
+        force: True の場合は適用済みでも設定し直す（rcParams を外部で変更した後など）
     """
+    global _APPLIED_STYLE
+
     settings = config.figure_settings if config else {}
 
     style = settings.get('style', 'whitegrid')
+    figsize = tuple(settings.get('figsize', (12, 8)))
+    font_size = settings.get('font_size', 12)
+
+    style_key = (style, figsize, font_size)
+    if not force and style_key == _APPLIED_STYLE:
+        return
+
     sns.set_style(style)
 
+    rc = {
+        'figure.figsize': figsize,
+        'font.size': font_size,
+        'axes.titlesize': font_size + 4,
+        'axes.labelsize': font_size,
+        'xtick.labelsize': font_size - 2,
+        'ytick.labelsize': font_size - 2,
+    }
     if _JAPANESE_FONT_FAMILY:
-        plt.rcParams['font.family'] = _JAPANESE_FONT_FAMILY
+        rc['font.family'] = _JAPANESE_FONT_FAMILY
+    plt.rcParams.update(rc)
 
-    figsize = settings.get('figsize', (12, 8))
-    plt.rcParams['figure.figsize'] = figsize
+    _APPLIED_STYLE = style_key
+
+
+def _new_figure(figsize: tuple) -> Tuple[Figure, Axes]:
+    """
+    pyplot の状態を介さずに図を生成
+
+    pyplot の図管理（現在の図・図の登録）を使わないため、生成した図は参照がなくなれば
+    解放され、複数のスレッド・プロセスから同時に描画できる。
+
+    Args:
+        figsize: 図のサイズ
+
+    Returns:
+        tuple: (Figure, Axes)
+    """
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots()
+
+
+def _rotate_xticklabels(ax: Axes, rotation: int = 45) -> None:
+    """X軸ラベルを回転し右寄せにする"""
+    for label in ax.get_xticklabels():
+        label.set_rotation(rotation)
+        label.set_horizontalalignment('right')
 
-    font_size = settings.get('font_size', 12)
-    plt.rcParams['font.size'] = font_size
-    plt.rcParams['axes.titlesize'] = font_size + 4
-    plt.rcParams['axes.labelsize'] = font_size
-    plt.rcParams['xtick.labelsize'] = font_size - 2
-    plt.rcParams['ytick.labelsize'] = font_size - 2
+
+def _drop_total_labels(crosstab: pd.DataFrame) -> pd.DataFrame:
+    """
+    合計行/列（'Total', '合計'）を除いたクロス集計表を返す
+
+    Args:
+        crosstab: クロス集計表
+
+    Returns:
+        pd.DataFrame: 合計行/列を除いたクロス集計表
+    """
+    return crosstab.loc[
+        ~crosstab.index.isin(_TOTAL_LABELS),
+        ~crosstab.columns.isin(_TOTAL_LABELS)
+    ]
 
 
 def plot_crosstab_heatmap(
@@ -84,7 +148,7 @@ def plot_crosstab_heatmap(
     cmap: str = 'YlOrRd',
     config: Optional[SurveyConfig] = None,
     figsize: tuple = (12, 8)
-) -> plt.Figure:
+) -> Figure:
     """
     クロス集計表のヒートマップを作成
 
@@ -97,23 +161,17 @@ def plot_crosstab_heatmap(
         figsize: 図のサイズ
 
     Returns:
-        plt.Figure: 生成された図
+        Figure: 生成された図
     """
     setup_plot_style(config)
 
-    # 合計行/列を除去
-    ct_vis = crosstab.copy()
-    for label in ['Total', '合計']:
-        if label in ct_vis.index:
-            ct_vis = ct_vis.drop(label)
-        if label in ct_vis.columns:
-            ct_vis = ct_vis.drop(label, axis=1)
+    # 合計行/列と空の行/列を除去（1回の .loc で抽出）
+    ct_vis = _drop_total_labels(crosstab)
+    row_sums = ct_vis.sum(axis=1).to_numpy()
+    col_sums = ct_vis.sum(axis=0).to_numpy()
+    ct_vis = ct_vis.loc[row_sums > 0, col_sums > 0]
 
-    # 空の行/列を除去
-    ct_vis = ct_vis.loc[ct_vis.sum(axis=1) > 0]
-    ct_vis = ct_vis.loc[:, ct_vis.sum(axis=0) > 0]
-
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _new_figure(figsize)
 
     sns.heatmap(
         ct_vis,
@@ -125,7 +183,7 @@ def plot_crosstab_heatmap(
     )
 
     ax.set_title(title, fontsize=14, pad=20)
-    plt.tight_layout()
+    fig.tight_layout()
 
     if save_path:
         dpi = config.figure_settings.get('dpi', 150) if config else 150
@@ -145,7 +203,7 @@ def plot_bar_chart(
     config: Optional[SurveyConfig] = None,
     figsize: tuple = (10, 6),
     color_palette: str = 'Set2'
-) -> plt.Figure:
+) -> Figure:
     """
     棒グラフを作成
 
@@ -161,11 +219,11 @@ def plot_bar_chart(
         color_palette: カラーパレット
 
     Returns:
-        plt.Figure: 生成された図
+        Figure: 生成された図
     """
     setup_plot_style(config)
 
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _new_figure(figsize)
     colors = sns.color_palette(color_palette, len(data))
 
     if horizontal:
@@ -174,40 +232,24 @@ def plot_bar_chart(
         if xlabel:
             ax.set_ylabel(xlabel)
 
-        # 値ラベル
-        for patch in ax.patches:
-            value = patch.get_width()
-            if value > 0:
-                ax.text(
-                    patch.get_x() + value + max(data.max() * 0.01, 0.5),
-                    patch.get_y() + patch.get_height() / 2,
-                    f"{int(value)}",
-                    va='center',
-                    ha='left',
-                    fontsize=10
-                )
     else:
         data.plot(kind='bar', ax=ax, color=colors)
         if xlabel:
             ax.set_xlabel(xlabel)
         ax.set_ylabel(ylabel)
-        plt.xticks(rotation=45, ha='right')
-
-        # 値ラベル
-        for patch in ax.patches:
-            value = patch.get_height()
-            if value > 0:
-                ax.text(
-                    patch.get_x() + patch.get_width() / 2,
-                    value + max(data.max() * 0.01, 0.5),
-                    f"{int(value)}",
-                    va='bottom',
-                    ha='center',
-                    fontsize=10
-                )
+        _rotate_xticklabels(ax)
+
+    # 値ラベル（0件・欠損のバーには表示しない）
+    values = data.to_numpy(dtype=np.float64)
+    ax.bar_label(
+        ax.containers[0],
+        labels=[f"{int(v)}" if v > 0 else '' for v in values],
+        padding=3,
+        fontsize=10
+    )
 
     ax.set_title(title, fontsize=14, pad=20)
-    plt.tight_layout()
+    fig.tight_layout()
 
     if save_path:
         dpi = config.figure_settings.get('dpi', 150) if config else 150
@@ -226,7 +268,7 @@ def plot_stacked_bar(
     config: Optional[SurveyConfig] = None,
     figsize: tuple = (12, 8),
     colormap: str = 'Set2'
-) -> plt.Figure:
+) -> Figure:
     """
     積み上げ棒グラフを作成
 
@@ -241,26 +283,23 @@ def plot_stacked_bar(
         colormap: カラーマップ
 
     Returns:
-        plt.Figure: 生成された図
+        Figure: 生成された図
     """
     setup_plot_style(config)
 
-    # 合計行/列を除去
-    ct_vis = crosstab.copy()
-    for label in ['Total', '合計']:
-        if label in ct_vis.index:
-            ct_vis = ct_vis.drop(label)
-        if label in ct_vis.columns:
-            ct_vis = ct_vis.drop(label, axis=1)
+    # 合計行/列と空の行を除去
+    ct_vis = _drop_total_labels(crosstab)
+    row_sums = ct_vis.sum(axis=1).to_numpy()
+    non_empty = row_sums > 0
+    ct_vis = ct_vis.loc[non_empty]
+    row_sums = row_sums[non_empty]
 
-    # 空の行を除去
-    ct_vis = ct_vis.loc[ct_vis.sum(axis=1) > 0]
+    # パーセンテージ計算（NumPy配列上で1回だけ割り算し、欠損は0とする）
+    pct = ct_vis.to_numpy(dtype=np.float64) / row_sums[:, np.newaxis] * 100
+    pct[np.isnan(pct)] = 0
+    ct_pct = pd.DataFrame(pct, index=ct_vis.index, columns=ct_vis.columns)
 
-    # パーセンテージ計算
-    ct_pct = ct_vis.div(ct_vis.sum(axis=1), axis=0) * 100
-    ct_pct = ct_pct.fillna(0)
-
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _new_figure(figsize)
 
     ct_pct.plot(
         kind='bar',
@@ -274,7 +313,7 @@ def plot_stacked_bar(
     ax.set_ylabel(ylabel)
     ax.set_title(title, fontsize=14, pad=20)
     ax.legend(title='', bbox_to_anchor=(1.05, 1), loc='upper left')
-    plt.xticks(rotation=45, ha='right')
+    _rotate_xticklabels(ax)
 
     # セグメント内のパーセンテージ表示
     for container in ax.containers:
@@ -292,12 +331,12 @@ def plot_stacked_bar(
                 )
 
     # 各棒の回答者数を表示
-    totals = ct_vis.sum(axis=1).astype(int)
+    totals = row_sums.astype(int)
     ax.set_ylim(0, 110)
-    for i, total in enumerate(totals.values):
+    for i, total in enumerate(totals):
         ax.text(i, 101, f"N={total}", ha='center', va='bottom', fontsize=10)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     if save_path:
         dpi = config.figure_settings.get('dpi', 150) if config else 150
@@ -314,7 +353,7 @@ def plot_pie_chart(
     config: Optional[SurveyConfig] = None,
     figsize: tuple = (8, 8),
     color_palette: str = 'Set2'
-) -> plt.Figure:
+) -> Figure:
     """
     円グラフを作成
 
@@ -327,11 +366,11 @@ def plot_pie_chart(
         color_palette: カラーパレット
 
     Returns:
-        plt.Figure: 生成された図
+        Figure: 生成された図
     """
     setup_plot_style(config)
 
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _new_figure(figsize)
 
     # 小さすぎるスライスをまとめる
     threshold = data.sum() * 0.01
@@ -351,7 +390,7 @@ def plot_pie_chart(
     )
 
     ax.set_title(title, fontsize=14, pad=20)
-    plt.tight_layout()
+    fig.tight_layout()
 
     if save_path:
         dpi = config.figure_settings.get('dpi', 150) if config else 150
@@ -369,7 +408,7 @@ def plot_distribution(
     config: Optional[SurveyConfig] = None,
     order: Optional[List[str]] = None,
     figsize: tuple = (10, 6)
-) -> plt.Figure:
+) -> Figure:
     """
     分布グラフを作成
 
@@ -383,7 +422,7 @@ def plot_distribution(
         figsize: 図のサイズ
 
     Returns:
-        plt.Figure: 生成された図
+        Figure: 生成された図
     """
     counts = df[column].value_counts()
 
@@ -407,7 +446,8 @@ def create_visualization_report(
     df: pd.DataFrame,
     config: SurveyConfig,
     output_dir: Path,
-    visualizations: Optional[List[Dict[str, Any]]] = None
+    visualizations: Optional[List[Dict[str, Any]]] = None,
+    n_jobs: int = 1
 ) -> List[Path]:
     """
     複数の可視化を一括生成
@@ -417,6 +457,8 @@ def create_visualization_report(
         config: SurveyConfig
         output_dir: 出力ディレクトリ
         visualizations: 可視化定義リスト
+        n_jobs: 並列プロセス数（1=逐次実行、-1=CPU数）。
+            並列実行時は df と config をワーカーへ渡すため、pickle 可能である必要がある
 
     Returns:
         List[Path]: 生成したファイルパスのリスト
@@ -440,50 +482,125 @@ def create_visualization_report(
     print("可視化レポート生成")
     print("=" * 60)
 
-    for i, viz in enumerate(visualizations, 1):
-        viz_type = viz.get('type', 'bar')
-        column = viz.get('column')
-        title = viz.get('title', f'図{i}')
-
-        # カラム名解決
-        if config and column in config.questions:
-            col_name = config.get_column_name(column)
-        else:
-            col_name = column
-
-        if col_name not in df.columns:
-            print(f"  警告: カラム '{col_name}' が見つかりません")
-            continue
-
-        filename = f"{i:02d}_{column or 'chart'}.png"
-        save_path = output_dir / filename
-
-        try:
-            if viz_type == 'bar':
-                data = df[col_name].value_counts()
-                order = viz.get('order')
-                if order:
-                    data = data.reindex(order).fillna(0).astype(int)
-                plot_bar_chart(data, title, save_path=save_path, config=config)
-
-            elif viz_type == 'pie':
-                data = df[col_name].value_counts()
-                plot_pie_chart(data, title, save_path=save_path, config=config)
-
-            elif viz_type == 'heatmap':
-                col_var = viz.get('col_var')
-                if col_var:
-                    col_var_name = config.get_column_name(col_var) if config else col_var
-                    ct = pd.crosstab(df[col_name], df[col_var_name])
-                    plot_crosstab_heatmap(ct, title, save_path=save_path, config=config)
-
-            saved_files.append(save_path)
-            plt.close()
-
-        except Exception as e:
-            print(f"  エラー: {title} の生成に失敗 - {e}")
+    # スタイルは最初に1回だけ適用（各プロット関数内の呼び出しは適用済みなら何もしない）
+    setup_plot_style(config)
+
+    # 各図の描画は互いに独立しているため、プロセスで並列実行できる（結果は定義の順序）
+    indices = list(range(1, len(visualizations) + 1))
+    workers = (os.cpu_count() or 1) if n_jobs < 0 else n_jobs
+    if workers > 1 and len(visualizations) > 1:
+        # df と config は図ごとではなくワーカーの起動時に1回だけ転送する
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(visualizations)),
+            initializer=_init_render_worker,
+            initargs=(df, config, output_dir)
+        ) as executor:
+            results = list(executor.map(_render_in_worker, indices, visualizations))
+    else:
+        results = [
+            _render_visualization(df, config, output_dir, i, viz)
+            for i, viz in zip(indices, visualizations)
+        ]
+
+    saved_files = [path for path in results if path is not None]
 
     print(f"\n生成完了: {len(saved_files)} ファイル")
     print("=" * 60)
 
     return saved_files
+
+
+# ワーカープロセスで共有する描画対象 (df, config, output_dir)（_init_render_worker で設定）
+_WORKER_RENDER_CONTEXT: Optional[Tuple[pd.DataFrame, SurveyConfig, Path]] = None
+
+
+def _init_render_worker(df: pd.DataFrame, config: SurveyConfig, output_dir: Path) -> None:
+    """
+    ワーカープロセスの初期化（描画対象を1回だけ受け取って保持）
+
+    Args:
+        df: データフレーム
+        config: SurveyConfig
+        output_dir: 出力ディレクトリ
+    """
+    global _WORKER_RENDER_CONTEXT
+    _WORKER_RENDER_CONTEXT = (df, config, output_dir)
+
+
+def _render_in_worker(index: int, viz: Dict[str, Any]) -> Optional[Path]:
+    """
+    ワーカーが保持する描画対象で可視化定義1件を描画
+
+    Args:
+        index: 定義の通し番号（ファイル名の接頭辞）
+        viz: 可視化定義
+
+    Returns:
+        Path or None: 保存したファイルパス（スキップ・失敗時はNone）
+    """
+    df, config, output_dir = _WORKER_RENDER_CONTEXT
+    return _render_visualization(df, config, output_dir, index, viz)
+
+
+def _render_visualization(
+    df: pd.DataFrame,
+    config: SurveyConfig,
+    output_dir: Path,
+    index: int,
+    viz: Dict[str, Any]
+) -> Optional[Path]:
+    """
+    可視化定義1件を描画して保存（create_visualization_report のワーカー関数）
+
+    Args:
+        df: データフレーム
+        config: SurveyConfig
+        output_dir: 出力ディレクトリ
+        index: 定義の通し番号（ファイル名の接頭辞）
+        viz: 可視化定義
+
+    Returns:
+        Path or None: 保存したファイルパス（スキップ・失敗時はNone）
+    """
+    viz_type = viz.get('type', 'bar')
+    column = viz.get('column')
+    title = viz.get('title', f'図{index}')
+
+    # カラム名解決
+    if config and column in config.questions:
+        col_name = config.get_column_name(column)
+    else:
+        col_name = column
+
+    if col_name not in df.columns:
+        print(f"  警告: カラム '{col_name}' が見つかりません")
+        return None
+
+    filename = f"{index:02d}_{column or 'chart'}.png"
+    save_path = output_dir / filename
+
+    # 図は pyplot に登録されないため、明示的に閉じなくても参照がなくなれば解放される
+    try:
+        if viz_type == 'bar':
+            data = df[col_name].value_counts()
+            order = viz.get('order')
+            if order:
+                data = data.reindex(order).fillna(0).astype(int)
+            plot_bar_chart(data, title, save_path=save_path, config=config)
+
+        elif viz_type == 'pie':
+            data = df[col_name].value_counts()
+            plot_pie_chart(data, title, save_path=save_path, config=config)
+
+        elif viz_type == 'heatmap':
+            col_var = viz.get('col_var')
+            if col_var:
+                col_var_name = config.get_column_name(col_var) if config else col_var
+                ct = pd.crosstab(df[col_name], df[col_var_name])
+                plot_crosstab_heatmap(ct, title, save_path=save_path, config=config)
+
+    except Exception as e:
+        print(f"  エラー: {title} の生成に失敗 - {e}")
+        return None
+
+    return save_path
@@ -6,6 +6,7 @@ survey_analysis.utils - ユーティリティモジュール
 
 from .parsers import (
     parse_first_yen_amount,
+    parse_first_yen_amount_series,
     parse_range_to_midpoint,
     normalize_japanese_text,
     extract_numbers,
@@ -13,10 +14,13 @@ from .parsers import (
     categorize_by_threshold,
     format_percentage,
     format_number_japanese,
+    format_number_japanese_array,
 )
+from .parallel import map_in_threads
 
 __all__ = [
     'parse_first_yen_amount',
+    'parse_first_yen_amount_series',
     'parse_range_to_midpoint',
     'normalize_japanese_text',
     'extract_numbers',
@@ -24,4 +28,6 @@ __all__ = [
     'categorize_by_threshold',
     'format_percentage',
     'format_number_japanese',
+    'format_number_japanese_array',
+    'map_in_threads',
 ]
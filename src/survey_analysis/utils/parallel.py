@@ -0,0 +1,47 @@
+"""
+並列実行ユーティリティ
+
+変数ペアごとの検定・集計など、互いに独立した処理をスレッドで並列実行する。
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# これ未満の件数ではスレッドプールを起動せず逐次実行する
+PARALLEL_MIN_ITEMS = 4
+
+
+def map_in_threads(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: Optional[int] = None,
+    min_items: int = PARALLEL_MIN_ITEMS
+) -> List[R]:
+    """
+    各要素に関数を適用し、入力順の結果リストを返す
+
+    pandas / SciPy の集計処理は多くがGILを解放するため、
+    データフレームをコピー（pickle）せずに済むスレッドで並列化する。
+
+    Args:
+        func: 各要素に適用する関数
+        items: 入力要素
+        max_workers: 最大スレッド数（省略時はCPU数、最大32）
+        min_items: 並列化する最小件数（未満なら逐次実行）
+
+    Returns:
+        list: 入力と同じ順序の結果
+    """
+    items = list(items)
+    if len(items) < min_items or max_workers == 1:
+        return [func(item) for item in items]
+
+    if max_workers is None:
+        max_workers = min(32, os.cpu_count() or 1)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
@@ -5,7 +5,39 @@
 """
 
 import re
-from typing import Optional, Any, List, Dict
+from functools import lru_cache
+from typing import Optional, Any, List, Dict, Pattern, Tuple
+
+import numpy as np
+import pandas as pd
+
+# 円金額: 数字（全角・カンマ区切り対応）+ 円
+_YEN_RE = re.compile(r'([0-9,０-９，]+)\s*円')
+
+# 金額範囲: 数字 + 円（省略可）+ 〜 + 数字 + 円
+_RANGE_RE = re.compile(r'([0-9,０-９，]+)\s*円?\s*[〜～\-−]\s*([0-9,０-９，]+)\s*円')
+
+# 数値（カンマ区切り対応）
+_NUMBER_RE = re.compile(r'[0-9,]+')
+
+# 連続する空白
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# 金額文字列の全角数字・カンマ → 半角
+_AMOUNT_TRANS = str.maketrans('０１２３４５６７８９，', '0123456789,')
+
+# 全角数字 → 半角
+_DIGIT_TRANS = str.maketrans('０１２３４５６７８９', '0123456789')
+
+# 全角英数字 → 半角
+_ALNUM_TRANS = str.maketrans(
+    'ＡＢＣＤＥＦＧＨＩＪＫＬＭＮＯＰＱＲＳＴＵＶＷＸＹＺａｂｃｄｅｆｇｈｉｊｋｌｍｎｏｐｑｒｓｔｕｖｗｘｙｚ０１２３４５６７８９',
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'
+)
+
+# 複数選択のデフォルト区切り文字
+_DEFAULT_DELIMITERS: Tuple[str, ...] = ('、', ',', '，', ';', '；')
+_DEFAULT_DELIMITER_TRANS = str.maketrans(dict.fromkeys(_DEFAULT_DELIMITERS, _DEFAULT_DELIMITERS[0]))
 
 
 def parse_first_yen_amount(text: str) -> Optional[int]:
@@ -29,9 +61,7 @@ def parse_first_yen_amount(text: str) -> Optional[int]:
     if not text or not isinstance(text, str):
         return None
 
-    # パターン: 数字（カンマ区切り対応）+ 円
-    pattern = r'([0-9,０-９，]+)\s*円'
-    match = re.search(pattern, text)
+    match = _YEN_RE.search(text)
 
     if not match:
         return None
@@ -39,7 +69,7 @@ def parse_first_yen_amount(text: str) -> Optional[int]:
     amount_str = match.group(1)
 
     # 全角→半角変換
-    amount_str = amount_str.translate(str.maketrans('０１２３４５６７８９，', '0123456789,'))
+    amount_str = amount_str.translate(_AMOUNT_TRANS)
 
     # カンマ除去
     amount_str = amount_str.replace(',', '')
@@ -50,6 +80,38 @@ def parse_first_yen_amount(text: str) -> Optional[int]:
         return None
 
 
+def parse_first_yen_amount_series(series: pd.Series) -> pd.Series:
+    """
+    Seriesの各要素から最初の円金額を一括抽出（parse_first_yen_amount のベクトル版）
+
+    Args:
+        series: 入力Series
+
+    Returns:
+        pd.Series: 抽出された金額（Int64型、抽出できない要素は欠損）
+
+    Examples:
+        >>> parse_first_yen_amount_series(pd.Series(["月額500円", "無料", None])).tolist()
+        [500, <NA>, <NA>]
+    """
+    result = pd.Series(pd.NA, index=series.index, dtype='Int64', name=series.name)
+
+    # 文字列を含み得ない型（全て欠損で float になった列など）は .str が使えない
+    if not (series.dtype == object or isinstance(series.dtype, (pd.StringDtype, pd.CategoricalDtype))):
+        return result
+
+    digits = (
+        series.str.extract(_YEN_RE, expand=False)
+        .str.translate(_AMOUNT_TRANS)
+        .str.replace(',', '', regex=False)
+    )
+
+    # 数字の残った要素だけを整数化（欠損を含めて変換すると float 経由になり桁落ちする）
+    valid = (digits.str.len() > 0).fillna(False).to_numpy(dtype=bool)
+    result[valid] = pd.to_numeric(digits[valid]).astype('Int64')
+    return result
+
+
 def parse_range_to_midpoint(text: str) -> Optional[float]:
     """
     範囲テキストから中間値を抽出
@@ -70,8 +132,7 @@ def parse_range_to_midpoint(text: str) -> Optional[float]:
         return None
 
     # 範囲パターン
-    range_pattern = r'([0-9,０-９，]+)\s*円?\s*[〜～\-−]\s*([0-9,０-９，]+)\s*円'
-    match = re.search(range_pattern, text)
+    match = _RANGE_RE.search(text)
 
     if match:
         low = parse_first_yen_amount(match.group(1) + '円')
@@ -101,16 +162,13 @@ def normalize_japanese_text(text: str) -> str:
         return ''
 
     # 全角→半角（英数字）
-    text = text.translate(str.maketrans(
-        'ＡＢＣＤＥＦＧＨＩＪＫＬＭＮＯＰＱＲＳＴＵＶＷＸＹＺａｂｃｄｅｆｇｈｉｊｋｌｍｎｏｐｑｒｓｔｕｖｗｘｙｚ０１２３４５６７８９',
-        'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'
-    ))
+    text = text.translate(_ALNUM_TRANS)
 
     # 半角→全角（カタカナ）
     # ※必要に応じて実装
 
     # 空白の正規化
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     text = text.strip()
 
     return text
@@ -130,11 +188,10 @@ def extract_numbers(text: str) -> List[int]:
         return []
 
     # 全角→半角
-    text = text.translate(str.maketrans('０１２３４５６７８９', '0123456789'))
+    text = text.translate(_DIGIT_TRANS)
 
     # 数値抽出（カンマ区切り対応）
-    pattern = r'[0-9,]+'
-    matches = re.findall(pattern, text)
+    matches = _NUMBER_RE.findall(text)
 
     numbers = []
     for match in matches:
@@ -164,17 +221,38 @@ def split_multiselect(
     if not text or not isinstance(text, str):
         return []
 
+    # 区切り文字で分割（1文字の区切り文字だけなら正規表現を使わず、先頭の区切り文字へ寄せて split）
     if delimiters is None:
-        delimiters = ['、', ',', '，', ';', '；']
-
-    # 区切り文字で分割
-    pattern = '|'.join(re.escape(d) for d in delimiters)
-    parts = re.split(pattern, text)
+        parts = text.translate(_DEFAULT_DELIMITER_TRANS).split(_DEFAULT_DELIMITERS[0])
+    else:
+        delimiters = tuple(delimiters)
+        translation = _delimiter_translation(delimiters)
+        if translation is not None:
+            table, separator = translation
+            parts = text.translate(table).split(separator)
+        else:
+            parts = _delimiter_pattern(delimiters).split(text)
 
     # 空白除去と空文字除外
     return [p.strip() for p in parts if p.strip()]
 
 
+@lru_cache(maxsize=32)
+def _delimiter_translation(
+    delimiters: Tuple[str, ...]
+) -> Optional[Tuple[Dict[int, str], str]]:
+    """全て1文字の区切り文字を先頭の区切り文字へ寄せる変換表（複数文字を含む場合はNone）"""
+    if not delimiters or any(len(d) != 1 for d in delimiters):
+        return None
+    return str.maketrans(dict.fromkeys(delimiters, delimiters[0])), delimiters[0]
+
+
+@lru_cache(maxsize=32)
+def _delimiter_pattern(delimiters: Tuple[str, ...]) -> Pattern[str]:
+    """区切り文字のいずれかにマッチする正規表現（区切り文字の組ごとにキャッシュ）"""
+    return re.compile('|'.join(re.escape(d) for d in delimiters))
+
+
 def categorize_by_threshold(
     value: Any,
     thresholds: List[tuple],
@@ -238,22 +316,54 @@ def format_number_japanese(value: int) -> str:
         >>> format_number_japanese(100000000)
         '1億'
     """
-    if value >= 100000000:  # 1億以上
-        oku = value // 100000000
-        remainder = value % 100000000
-        if remainder == 0:
-            return f"{oku:,}億"
-        else:
-            man = remainder // 10000
-            return f"{oku:,}億{man:,}万" if man > 0 else f"{oku:,}億"
-
-    elif value >= 10000:  # 1万以上
-        man = value // 10000
-        remainder = value % 10000
-        if remainder == 0:
-            return f"{man:,}万"
-        else:
-            return f"{man:,}万{remainder:,}"
+    if value >= 100_000_000:  # 1億以上
+        oku, remainder = divmod(value, 100_000_000)
+        man = remainder // 10_000
+        return f"{oku:,}億{man:,}万" if man > 0 else f"{oku:,}億"
 
-    else:
-        return f"{value:,}"
+    if value >= 10_000:  # 1万以上
+        man, units = divmod(value, 10_000)
+        return f"{man:,}万{units:,}" if units else f"{man:,}万"
+
+    return f"{value:,}"
+
+
+def format_number_japanese_array(values) -> np.ndarray:
+    """
+    数値配列をまとめて日本語表記でフォーマット
+
+    億・万への分解は np.divmod で一括して行い、文字列化だけを要素ごとに行う。
+    各要素の結果は format_number_japanese と同じ。
+
+    Args:
+        values: 整数の配列（array-like）
+
+    Returns:
+        np.ndarray: フォーマットされた文字列の配列（object型、入力と同じ形状）
+
+    Examples:
+        >>> format_number_japanese_array([12345, 100000000]).tolist()
+        ['1万2,345', '1億']
+    """
+    arr = np.asarray(values)
+
+    oku, remainder = np.divmod(arr, 100_000_000)
+    man_of_oku = remainder // 10_000
+    man, units = np.divmod(arr, 10_000)
+    is_oku = arr >= 100_000_000
+    is_man = ~is_oku & (arr >= 10_000)
+
+    formatted = [
+        (f"{o:,}億{mo:,}万" if mo > 0 else f"{o:,}億") if in_oku
+        else (f"{m:,}万{u:,}" if u else f"{m:,}万") if in_man
+        else f"{v:,}"
+        for v, o, mo, m, u, in_oku, in_man in zip(
+            arr.ravel().tolist(), oku.ravel().tolist(), man_of_oku.ravel().tolist(),
+            man.ravel().tolist(), units.ravel().tolist(),
+            is_oku.ravel().tolist(), is_man.ravel().tolist()
+        )
+    ]
+
+    result = np.empty(len(formatted), dtype=object)
+    result[:] = formatted
+    return result.reshape(arr.shape)
@@ -7,7 +7,8 @@ survey-analysis-coreパッケージのテスト用フィクスチャ定義。
 import pytest
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Sequence
 
 
 # =============================================================================
@@ -25,7 +26,7 @@ class MockSurveyConfig(SurveyConfig):
         questions: Dict[str, str] = None,
         raw_data_path: Path = None,
         output_dir: Path = None,
-        category_orders: Dict[str, List[str]] = None,
+        category_orders: Dict[str, Sequence[str]] = None,
         alpha: float = 0.05,
         encoding: str = 'utf-8',
         stopwords: List[str] = None,
@@ -58,8 +59,9 @@ class MockSurveyConfig(SurveyConfig):
         return self._output_dir
 
     @property
-    def category_orders(self) -> Dict[str, List[str]]:
-        return self._category_orders
+    def category_orders(self) -> Mapping[str, Sequence[str]]:
+        # 共有フィクスチャでも書き換えられないよう読み取り専用ビューで返す
+        return MappingProxyType(self._category_orders)
 
     @property
     def alpha(self) -> float:
@@ -81,14 +83,22 @@ class MockSurveyConfig(SurveyConfig):
 # =============================================================================
 # フィクスチャ定義
 # =============================================================================
+# 読み取り専用のサンプルデータ・設定はセッションで1回だけ生成して共有する。
+# テスト内で変更する場合は .copy() してから使うこと。
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config():
     """基本的なモック設定"""
     return MockSurveyConfig()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def mock_config_factory():
+    """任意の設定で MockSurveyConfig を生成するファクトリ"""
+    return MockSurveyConfig
+
+
+@pytest.fixture(scope="session")
 def sample_dataframe():
     """テスト用サンプルデータフレーム"""
     return pd.DataFrame({
@@ -96,11 +106,16 @@ def sample_dataframe():
         '性別': ['男性', '女性', '男性', '女性', '男性', '女性', '男性', '女性', '男性', '女性'],
         '満足度': ['満足', '普通', '不満', '満足', '満足', '普通', '不満', '満足', '普通', '満足'],
         '興味度': ['高', '中', '低', '高', '中', '高', '低', '中', '高', '高'],
-        '数値スコア': [5, 3, 1, 5, 4, 3, 2, 5, 3, 4],
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def numeric_sample_dataframe(sample_dataframe):
+    """数値カラム（数値スコア）を加えたサンプルデータフレーム"""
+    return sample_dataframe.assign(数値スコア=[5, 3, 1, 5, 4, 3, 2, 5, 3, 4])
+
+
+@pytest.fixture(scope="session")
 def sample_dataframe_with_missing():
     """欠損値を含むサンプルデータフレーム"""
     return pd.DataFrame({
@@ -110,16 +125,30 @@ def sample_dataframe_with_missing():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def crosstab_sample():
-    """クロス集計テスト用データ"""
+    """クロス集計テスト用データ（集計済みデータと同じく順序付きcategory型）"""
     return pd.DataFrame({
-        '年齢': ['20代'] * 5 + ['30代'] * 5 + ['40代'] * 5,
-        '興味度': ['高', '高', '中', '中', '低'] * 3,
+        '年齢': pd.Categorical(
+            ['20代'] * 5 + ['30代'] * 5 + ['40代'] * 5,
+            categories=['20代', '30代', '40代'], ordered=True
+        ),
+        '興味度': pd.Categorical(
+            ['高', '高', '中', '中', '低'] * 3,
+            categories=['低', '中', '高'], ordered=True
+        ),
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def base_crosstab(sample_dataframe):
+    """sample_dataframe の 年齢×性別 クロス集計表（読み取り専用）"""
+    from survey_analysis.core import crosstab
+
+    return crosstab.create_crosstab(sample_dataframe, '年齢', '性別')
+
+
+@pytest.fixture(scope="session")
 def freetext_sample():
     """自由記述テスト用データ"""
     return pd.DataFrame({
@@ -133,33 +162,56 @@ def freetext_sample():
     })
 
 
-@pytest.fixture
-def config_with_categories(tmp_path):
+@pytest.fixture(scope="session")
+def config_with_categories(tmp_path_factory):
     """カテゴリ順序付き設定"""
     return MockSurveyConfig(
         category_orders={
-            'age': ['20代', '30代', '40代', '50代以上'],
-            'satisfaction': ['非常に不満', '不満', '普通', '満足', '非常に満足'],
+            'age': ('20代', '30代', '40代', '50代以上'),
+            'satisfaction': ('非常に不満', '不満', '普通', '満足', '非常に満足'),
         },
-        output_dir=tmp_path / 'output'
+        output_dir=tmp_path_factory.mktemp('config_with_categories') / 'output'
     )
 
 
-@pytest.fixture
-def tmp_csv_file(tmp_path):
-    """一時CSVファイルを作成"""
-    csv_path = tmp_path / 'test_data.csv'
-    df = pd.DataFrame({
+@pytest.fixture(scope="session")
+def tmp_csv_dataframe():
+    """tmp_csv_file の内容（読み込み結果の期待値。CSVを再パースせずに比較できる）"""
+    return pd.DataFrame({
         '年齢': ['20代', '30代', '40代'],
         '性別': ['男性', '女性', '男性'],
         '満足度': ['満足', '普通', '不満'],
     })
-    df.to_csv(csv_path, index=False, encoding='utf-8-sig')
+
+
+@pytest.fixture(scope="session")
+def tmp_csv_file(tmp_path_factory):
+    """一時CSVファイルを作成（セッションで1回だけ書き出す。内容は tmp_csv_dataframe と同じ）"""
+    csv_path = tmp_path_factory.mktemp('csv_data') / 'test_data.csv'
+    csv_path.write_bytes(
+        '\ufeff年齢,性別,満足度\n20代,男性,満足\n30代,女性,普通\n40代,男性,不満\n'.encode('utf-8')
+    )
+    return csv_path
+
+
+@pytest.fixture(scope="session")
+def age_gender_csv(tmp_path_factory):
+    """年齢・性別の2列のCSV（年齢は順序定義と異なる並び。セッションで1回だけ書き出す）"""
+    csv_path = tmp_path_factory.mktemp('age_gender') / 'test.csv'
+    csv_path.write_bytes('\ufeff年齢,性別\n30代,男性\n20代,女性\n40代,男性\n'.encode('utf-8'))
+    return csv_path
+
+
+@pytest.fixture(scope="session")
+def age_gender_missing_csv(tmp_path_factory):
+    """欠損値を含む年齢・性別の2列のCSV（セッションで1回だけ書き出す）"""
+    csv_path = tmp_path_factory.mktemp('age_gender_missing') / 'test.csv'
+    csv_path.write_bytes('\ufeff年齢,性別\n20代,男性\n,女性\n40代,\n'.encode('utf-8'))
     return csv_path
 
 
-@pytest.fixture
-def config_with_csv(tmp_csv_file, tmp_path):
+@pytest.fixture(scope="session")
+def config_with_csv(tmp_csv_file, tmp_path_factory):
     """CSVファイル付き設定"""
     return MockSurveyConfig(
         questions={
@@ -168,5 +220,13 @@ def config_with_csv(tmp_csv_file, tmp_path):
             'satisfaction': '満足度',
         },
         raw_data_path=tmp_csv_file,
-        output_dir=tmp_path / 'output'
+        output_dir=tmp_path_factory.mktemp('config_with_csv') / 'output'
     )
+
+
+@pytest.fixture(scope="session")
+def loaded_csv_df(config_with_csv):
+    """config_with_csv の CSV を load_raw_data で1回だけ読み込んだ結果（読み取り専用）"""
+    from survey_analysis.core import loader
+
+    return loader.load_raw_data(config_with_csv)
@@ -0,0 +1,275 @@
+"""
+データ監査モジュールのテスト
+
+audit.pyの各関数をテスト。
+"""
+
+import pandas as pd
+import pytest
+
+from survey_analysis.core import audit
+
+
+class TestCheckDataCompleteness:
+    """check_data_completeness関数のテスト"""
+
+    def test_counts_per_column(self, sample_dataframe_with_missing, mock_config):
+        """カラムごとの欠損数と完全性を集計"""
+        result = audit.check_data_completeness(sample_dataframe_with_missing, mock_config)
+
+        age = result['column_completeness']['年齢']
+        assert age['non_null_count'] == 4
+        assert age['null_count'] == 1
+        assert age['completeness_rate'] == pytest.approx(80.0)
+
+    def test_detects_missing_and_extra_columns(self, mock_config):
+        """期待カラムとの差分を検出"""
+        df = pd.DataFrame({'年齢': ['20代'], '不明なカラム': [1]})
+        result = audit.check_data_completeness(df, mock_config)
+
+        assert '性別' in result['missing_columns']
+        assert result['extra_columns'] == ['不明なカラム']
+
+
+class TestGetDataProfile:
+    """get_data_profile関数のテスト"""
+
+    def test_profile_columns(self, sample_dataframe):
+        """全カラムのプロファイルを返す"""
+        profile = audit.get_data_profile(sample_dataframe)
+
+        assert profile['column'].tolist() == sample_dataframe.columns.tolist()
+        assert (profile['non_null_count'] == len(sample_dataframe)).all()
+
+    def test_numeric_and_categorical_stats(self, numeric_sample_dataframe):
+        """数値型は平均等、カテゴリカル型は最頻値を持つ"""
+        profile = audit.get_data_profile(numeric_sample_dataframe).set_index('column')
+
+        assert profile.loc['数値スコア', 'max'] == 5.0
+        assert pd.isna(profile.loc['数値スコア', 'top_value'])
+        assert profile.loc['性別', 'top_count'] == 5
+        assert pd.isna(profile.loc['性別', 'mean'])
+
+    def test_category_dtype_top_value(self):
+        """category型は出現数最大のカテゴリを最頻値とする"""
+        df = pd.DataFrame({
+            '満足度': pd.Categorical(
+                ['満足', '普通', '満足', None],
+                categories=['不満', '普通', '満足']
+            )
+        })
+        profile = audit.get_data_profile(df).set_index('column')
+
+        assert profile.loc['満足度', 'top_value'] == '満足'
+        assert profile.loc['満足度', 'top_count'] == 2
+
+    def test_ties_use_first_appearance(self):
+        """同数の値は value_counts と同じく先に出現した値を最頻値とする"""
+        df = pd.DataFrame({
+            '混在': pd.Series(['x', 1, 'x', 1, 'y', None], dtype=object),
+            '性別': ['女性', '男性', '男性', '女性', None, None],
+        })
+        profile = audit.get_data_profile(df).set_index('column')
+
+        assert profile.loc['混在', 'top_value'] == 'x'
+        assert profile.loc['混在', 'top_count'] == 2
+        assert profile.loc['性別', 'top_value'] == '女性'
+
+    def test_string_top_values_keep_str_dtype(self, sample_dataframe):
+        """文字列の最頻値のみなら top_value は str 型"""
+        profile = audit.get_data_profile(sample_dataframe)
+
+        assert pd.api.types.is_string_dtype(profile['top_value'])
+        assert profile['top_value'].dtype != object
+
+    def test_precomputed_stats(self, sample_dataframe):
+        """計算済みの集計を渡しても同じプロファイルを返す"""
+        stats = audit._compute_column_stats(sample_dataframe)
+
+        pd.testing.assert_frame_equal(
+            audit.get_data_profile(sample_dataframe, stats),
+            audit.get_data_profile(sample_dataframe)
+        )
+
+
+class TestCheckDataConsistency:
+    """check_data_consistency関数のテスト"""
+
+    def test_detects_duplicate_rows(self):
+        """重複行の件数とインデックスを検出"""
+        df = pd.DataFrame(
+            {'年齢': ['20代', '30代', '20代'], '性別': ['男性', '女性', '男性']},
+            index=[10, 11, 12]
+        )
+        result = audit.check_data_consistency(df)
+
+        assert result['duplicate_rows'] == 1
+        assert result['duplicate_indices'] == [12]
+
+    def test_constant_and_high_cardinality_columns(self):
+        """定数カラムと高カーディナリティカラムを検出"""
+        df = pd.DataFrame({
+            'ID': list(range(10)),
+            '定数': ['A'] * 10,
+            '性別': ['男性', '女性'] * 5,
+        })
+        result = audit.check_data_consistency(df)
+
+        assert result['constant_columns'] == ['定数']
+        assert result['high_cardinality_columns'] == [
+            {'column': 'ID', 'unique_count': 10, 'percentage': 100.0}
+        ]
+
+
+class TestGenerateAuditReport:
+    """generate_audit_report関数のテスト"""
+
+    def test_report_sections(self, sample_dataframe, mock_config):
+        """Markdownレポートの主要セクションを含む"""
+        report = audit.generate_audit_report(sample_dataframe, mock_config)
+
+        assert report.startswith('# データ監査レポート')
+        assert '## 1. 概要' in report
+        assert '## 5. サマリー' in report
+
+    def test_missing_table_sorted_by_null_count(self, mock_config):
+        """欠損値サマリーは欠損数の多い順に欠損のあるカラムのみ並ぶ"""
+        df = pd.DataFrame({
+            '年齢': ['20代', None, None],
+            '性別': ['男性', '女性', None],
+            '満足度': ['満足', '普通', '不満'],
+        })
+        report = audit.generate_audit_report(df, mock_config, use_cache=False)
+
+        rows = [line for line in report.splitlines() if line.startswith('| ') and '...' in line]
+        assert rows == ['| 年齢... | 2 | 66.7% |', '| 性別... | 1 | 33.3% |']
+
+    def test_checks_are_cached(self, sample_dataframe, mock_config, monkeypatch):
+        """同一データ・設定の再呼び出しではチェックを再実行しない"""
+        audit._AUDIT_CACHE.clear()
+        calls = []
+        original = audit.check_data_consistency
+        monkeypatch.setattr(
+            audit, 'check_data_consistency',
+            lambda *args: calls.append(1) or original(*args)
+        )
+
+        first = audit.generate_audit_report(sample_dataframe, mock_config)
+        second = audit.generate_audit_report(sample_dataframe.copy(), mock_config)
+
+        assert len(calls) == 1
+        assert first.splitlines()[4:] == second.splitlines()[4:]
+
+    def test_cache_distinguishes_index(self, mock_config):
+        """値が同じでもインデックスが異なれば重複行のラベルを再計算する"""
+        audit._AUDIT_CACHE.clear()
+        df = pd.DataFrame({'a': [1, 2, 3, 4, 5, 6, 1], 'b': list('xyzuvwx')})
+        reindexed = df.set_axis(range(100, 107))
+
+        first = audit._run_audit_checks(df, mock_config)
+        second = audit._run_audit_checks(reindexed, mock_config)
+
+        assert first[2]['duplicate_indices'] == [6]
+        assert second[2]['duplicate_indices'] == [106]
+
+    def test_cached_results_are_copies(self, sample_dataframe, mock_config):
+        """返されたチェック結果を変更してもキャッシュに影響しない"""
+        audit._AUDIT_CACHE.clear()
+        first = audit._run_audit_checks(sample_dataframe, mock_config)
+        expected = first[2]['constant_columns'][:]
+        first[2]['constant_columns'].append('改変')
+
+        second = audit._run_audit_checks(sample_dataframe, mock_config)
+
+        assert second[2]['constant_columns'] == expected
+
+    def test_cache_can_be_disabled(self, sample_dataframe, mock_config, monkeypatch):
+        """use_cache=Falseで毎回チェックを実行"""
+        calls = []
+        original = audit.check_data_consistency
+        monkeypatch.setattr(
+            audit, 'check_data_consistency',
+            lambda *args: calls.append(1) or original(*args)
+        )
+
+        audit.generate_audit_report(sample_dataframe, mock_config, use_cache=False)
+        audit.generate_audit_report(sample_dataframe, mock_config, use_cache=False)
+
+        assert len(calls) == 2
+
+    def test_column_stats_computed_once(self, sample_dataframe, mock_config, monkeypatch):
+        """完全性・一貫性チェックで共通の集計を1回だけ計算"""
+        calls = []
+        original = audit._compute_column_stats
+        monkeypatch.setattr(
+            audit, '_compute_column_stats',
+            lambda df: calls.append(1) or original(df)
+        )
+
+        audit.generate_audit_report(sample_dataframe, mock_config, use_cache=False)
+
+        assert len(calls) == 1
+
+    def test_writes_report_to_file(self, sample_dataframe, mock_config, tmp_path):
+        """ファイルへ直接書き出し、return_text=FalseならNoneを返す"""
+        output_path = tmp_path / 'reports' / 'audit.md'
+        result = audit.generate_audit_report(
+            sample_dataframe, mock_config, output_path, return_text=False
+        )
+
+        assert result is None
+        assert output_path.read_text(encoding='utf-8').startswith('# データ監査レポート')
+
+
+class TestCheckDataValidity:
+    """check_data_validity関数のテスト"""
+
+    def test_detects_invalid_values(self, config_with_categories):
+        """順序定義にない値を検出"""
+        df = pd.DataFrame({'年齢': ['20代', '30代', '60代', None, '60代']})
+        result = audit.check_data_validity(df, config_with_categories)
+
+        check = result['category_validity']['age']
+        assert check['invalid_values'] == ['60代']
+        assert check['is_valid'] is False
+        assert result['invalid_values'] == {'age': ['60代']}
+
+    def test_valid_categories(self, config_with_categories):
+        """全て定義内の値なら妥当"""
+        df = pd.DataFrame({'年齢': ['20代', '30代', '40代']})
+        result = audit.check_data_validity(df, config_with_categories)
+
+        assert result['category_validity']['age']['is_valid'] is True
+        assert result['invalid_values'] == {}
+
+    def test_invalid_values_in_appearance_order(self, config_with_categories):
+        """型の混在した不正値も出現順に列挙"""
+        df = pd.DataFrame({'年齢': ['70代', '20代', 25, '60代', 25]})
+        result = audit.check_data_validity(df, config_with_categories)
+
+        assert result['invalid_values'] == {'age': ['70代', 25, '60代']}
+
+    def test_category_dtype_column(self, config_with_categories):
+        """category型カラムでも未定義のカテゴリ値を検出"""
+        df = pd.DataFrame({
+            '年齢': pd.Categorical(
+                ['20代', '60代', None],
+                categories=['20代', '30代', '60代', '70代']
+            )
+        })
+        result = audit.check_data_validity(df, config_with_categories)
+
+        # 出現していないカテゴリ（70代）は不正値に含めない
+        assert result['invalid_values'] == {'age': ['60代']}
+
+class TestExportAuditResults:
+    """export_audit_results関数のテスト"""
+
+    def test_writes_report_and_profile(self, sample_dataframe, mock_config, tmp_path):
+        """監査レポートとBOM付きUTF-8のプロファイルCSVを出力"""
+        paths = audit.export_audit_results(sample_dataframe, mock_config, tmp_path)
+
+        assert paths['report'].exists()
+        assert paths['profile'].read_bytes().startswith(b'\xef\xbb\xbf')
+        profile = pd.read_csv(paths['profile'], encoding='utf-8-sig')
+        assert profile['column'].tolist() == sample_dataframe.columns.tolist()
@@ -4,12 +4,21 @@ SurveyConfig抽象クラスのテスト
 抽象クラスの実装要件と振る舞いをテスト。
 """
 
+import pickle
+
 import pytest
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict, List
 
 from survey_analysis.base.config import SurveyConfig
 
+# SurveyConfig の必須（抽象）プロパティの実装
+_REQUIRED_PROPERTIES = {
+    'questions': property(lambda self: {'q1': 'Question 1'}),
+    'raw_data_path': property(lambda self: Path('/tmp/data.csv')),
+    'output_dir': property(lambda self: Path('/tmp/output')),
+}
+
 
 class TestSurveyConfigAbstract:
     """SurveyConfig抽象クラスのテスト"""
@@ -19,44 +28,13 @@ class TestSurveyConfigAbstract:
         with pytest.raises(TypeError):
             SurveyConfig()
 
-    def test_requires_questions_property(self):
-        """questionsプロパティが必須"""
-        class IncompleteConfig(SurveyConfig):
-            @property
-            def raw_data_path(self) -> Path:
-                return Path('/tmp/data.csv')
-
-            @property
-            def output_dir(self) -> Path:
-                return Path('/tmp/output')
-
-        with pytest.raises(TypeError):
-            IncompleteConfig()
-
-    def test_requires_raw_data_path_property(self):
-        """raw_data_pathプロパティが必須"""
-        class IncompleteConfig(SurveyConfig):
-            @property
-            def questions(self) -> Dict[str, str]:
-                return {'q1': 'Question 1'}
-
-            @property
-            def output_dir(self) -> Path:
-                return Path('/tmp/output')
-
-        with pytest.raises(TypeError):
-            IncompleteConfig()
-
-    def test_requires_output_dir_property(self):
-        """output_dirプロパティが必須"""
-        class IncompleteConfig(SurveyConfig):
-            @property
-            def questions(self) -> Dict[str, str]:
-                return {'q1': 'Question 1'}
-
-            @property
-            def raw_data_path(self) -> Path:
-                return Path('/tmp/data.csv')
+    @pytest.mark.parametrize('missing_prop', ['questions', 'raw_data_path', 'output_dir'])
+    def test_requires_abstract_property(self, missing_prop):
+        """questions / raw_data_path / output_dir プロパティが必須"""
+        props = {
+            name: prop for name, prop in _REQUIRED_PROPERTIES.items() if name != missing_prop
+        }
+        IncompleteConfig = type('IncompleteConfig', (SurveyConfig,), props)
 
         with pytest.raises(TypeError):
             IncompleteConfig()
@@ -83,9 +61,12 @@ class TestMockSurveyConfig:
         assert isinstance(path, Path)
 
     def test_category_orders_default_empty(self, mock_config):
-        """category_ordersのデフォルトは空辞書"""
+        """category_ordersのデフォルトは空のマッピング（読み取り専用）"""
         orders = mock_config.category_orders
-        assert isinstance(orders, dict)
+        assert isinstance(orders, Mapping)
+        assert len(orders) == 0
+        with pytest.raises(TypeError):
+            orders['age'] = ['20代']
 
     def test_alpha_default_value(self, mock_config):
         """alphaのデフォルトは0.05"""
@@ -109,7 +90,7 @@ class TestConfigWithCategories:
         orders = config_with_categories.category_orders
         assert 'age' in orders
         assert 'satisfaction' in orders
-        assert orders['age'] == ['20代', '30代', '40代', '50代以上']
+        assert orders['age'] == ('20代', '30代', '40代', '50代以上')
 
     def test_custom_output_dir(self, config_with_categories):
         """カスタム出力ディレクトリが設定される"""
@@ -149,6 +130,25 @@ class TestGetColumnName:
         assert col == 'unknown_key'
 
 
+class TestGetQuestionId:
+    """get_question_idメソッドのテスト"""
+
+    def test_returns_question_id(self, mock_config):
+        """カラム名から質問IDを逆引きする"""
+        assert mock_config.get_question_id('年齢') == 'age'
+
+    def test_returns_none_if_not_found(self, mock_config):
+        """見つからない場合はNoneを返す"""
+        assert mock_config.get_question_id('存在しないカラム') is None
+
+    def test_reverse_index_is_cached(self, mock_config):
+        """逆引きインデックスはインスタンスごとに1回だけ構築される"""
+        mock_config.get_question_id('年齢')
+        index = mock_config._question_id_by_column
+        mock_config.get_question_id('性別')
+        assert mock_config._question_id_by_column is index
+
+
 class TestValidate:
     """validateメソッドのテスト"""
 
@@ -164,11 +164,18 @@ class TestValidate:
             # 例外が発生しなければ成功
             config_with_csv.validate()
 
-    def test_validate_missing_questions(self, tmp_path):
-        """questionsが空の場合のバリデーション"""
-        from conftest import MockSurveyConfig
+    def test_validate_reports_missing_data_file(self, config_with_csv, tmp_path, monkeypatch):
+        """データファイルが存在しない場合はエラーを返す"""
+        # 共有のCSVは削除せず、存在しないパスに差し替える
+        monkeypatch.setattr(config_with_csv, '_raw_data_path', tmp_path / 'missing.csv')
+
+        errors = config_with_csv.validate()
 
-        config = MockSurveyConfig(
+        assert any('データファイルが見つかりません' in e for e in errors)
+
+    def test_validate_missing_questions(self, tmp_path, mock_config_factory):
+        """questionsが空の場合のバリデーション"""
+        config = mock_config_factory(
             questions={},
             raw_data_path=tmp_path / 'data.csv',
             output_dir=tmp_path / 'output'
@@ -177,3 +184,41 @@ class TestValidate:
         if hasattr(config, 'validate'):
             # 空のquestionsでも現在の実装ではエラーにならない可能性あり
             pass
+
+
+class TestQuestionsFrozen:
+    """_questions_frozenプロパティのテスト"""
+
+    def test_is_read_only(self, mock_config):
+        """読み取り専用のマッピングを返す"""
+        frozen = mock_config._questions_frozen
+        assert frozen['age'] == '年齢'
+        with pytest.raises(TypeError):
+            frozen['age'] = '変更'
+
+    def test_is_built_once(self, mock_config):
+        """インスタンスごとに1回だけ構築される"""
+        assert mock_config._questions_frozen is mock_config._questions_frozen
+
+
+class TestExpectedColumns:
+    """_expected_columnsプロパティのテスト"""
+
+    def test_contains_question_columns(self, mock_config):
+        """questionsのカラム名を集合で保持する"""
+        expected = mock_config._expected_columns
+        assert isinstance(expected, frozenset)
+        assert expected == frozenset(mock_config.questions.values())
+
+
+class TestPickle:
+    """pickle 対応のテスト"""
+
+    def test_roundtrip_after_caches_are_built(self, mock_config):
+        """派生キャッシュの構築後も pickle でき、復元後に再構築される"""
+        assert mock_config.get_column_name('age') == '年齢'
+
+        restored = pickle.loads(pickle.dumps(mock_config))
+
+        assert '_questions_frozen' not in restored.__dict__
+        assert restored.get_column_name('age') == '年齢'
@@ -5,9 +5,15 @@ crosstab.pyの各関数をテスト。
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 
-from survey_analysis.core import crosstab
+from survey_analysis.core import crosstab, stats
+
+
+def _assert_sums_to_100(df: pd.DataFrame, axis: int) -> None:
+    """各行（axis=1）または各列（axis=0）の合計が約100%であることを確認"""
+    np.testing.assert_allclose(df.sum(axis=axis).to_numpy(), 100.0, rtol=0, atol=0.1)
 
 
 class TestCreateCrosstab:
@@ -45,6 +51,18 @@ class TestCreateCrosstab:
         assert '合計' in ct.index
         assert '合計' in ct.columns
 
+    @pytest.mark.parametrize('margins', [False, True])
+    def test_matches_pd_crosstab(self, sample_dataframe_with_missing, margins):
+        """欠損・category型を含んでもpd.crosstabと同じ集計結果"""
+        df = sample_dataframe_with_missing.copy()
+        df['年齢'] = pd.Categorical(
+            df['年齢'], categories=['50代以上', '40代', '30代', '20代'], ordered=True
+        )
+        ct = crosstab.create_crosstab(df, '年齢', '性別', margins=margins)
+        expected = pd.crosstab(df['年齢'], df['性別'], margins=margins, margins_name='合計')
+
+        pd.testing.assert_frame_equal(ct, expected)
+
     def test_crosstab_normalize_index(self, sample_dataframe):
         """行ごとに正規化したクロス集計"""
         ct = crosstab.create_crosstab(
@@ -54,9 +72,7 @@ class TestCreateCrosstab:
             normalize='index'
         )
         # 各行の合計が100%になる
-        row_sums = ct.sum(axis=1)
-        for s in row_sums:
-            assert abs(s - 100) < 0.1
+        _assert_sums_to_100(ct, axis=1)
 
     def test_crosstab_missing_column_raises_error(self, sample_dataframe):
         """存在しないカラムでエラー"""
@@ -68,6 +84,21 @@ class TestCreateCrosstab:
             )
 
 
+class TestContingencyCounts:
+    """度数集計がデータフレームの現在の内容を反映することのテスト"""
+
+    def test_reflects_inplace_column_edit(self):
+        """集計後にカラムをインプレースで変更しても古い表を返さない"""
+        df = pd.DataFrame({'a': ['x', 'y', 'x', 'y'], 'b': ['p', 'p', 'q', 'q']})
+        assert crosstab.create_crosstab(df, 'a', 'b').values.tolist() == [[1, 1], [1, 1]]
+
+        df['a'] = ['z'] * 4
+
+        assert crosstab.create_crosstab(df, 'a', 'b').values.tolist() == [[2, 2]]
+        with pytest.raises(ValueError, match='小さすぎます'):
+            stats.chi_square_test(df, 'a', 'b')
+
+
 class TestCreateCrosstabWithTotals:
     """create_crosstab_with_totals関数のテスト"""
 
@@ -85,60 +116,40 @@ class TestCreateCrosstabWithTotals:
 class TestCreateCrosstabPercentage:
     """create_crosstab_percentage関数のテスト"""
 
-    def test_row_percentage(self, sample_dataframe):
-        """行ごとのパーセンテージ"""
+    @pytest.mark.parametrize('by, axis', [('row', 1), ('column', 0)])
+    def test_percentage_sums_to_100(self, sample_dataframe, by, axis):
+        """行ごと/列ごとのパーセンテージ"""
         ct = crosstab.create_crosstab_percentage(
             sample_dataframe,
             '年齢',
             '性別',
-            by='row'
+            by=by
         )
-        # 各行の合計が約100%
-        row_sums = ct.sum(axis=1)
-        for s in row_sums:
-            assert abs(s - 100) < 0.1
-
-    def test_column_percentage(self, sample_dataframe):
-        """列ごとのパーセンテージ"""
-        ct = crosstab.create_crosstab_percentage(
-            sample_dataframe,
-            '年齢',
-            '性別',
-            by='column'
-        )
-        # 各列の合計が約100%
-        col_sums = ct.sum(axis=0)
-        for s in col_sums:
-            assert abs(s - 100) < 0.1
+        # 各行（列）の合計が約100%
+        _assert_sums_to_100(ct, axis=axis)
 
 
 class TestCreateMultiselectCrosstab:
     """create_multiselect_crosstab関数のテスト"""
 
-    def test_multiselect_expansion(self):
-        """複数選択の展開"""
-        df = pd.DataFrame({
-            '年齢': ['20代', '30代', '20代'],
-            '趣味': ['読書、映画', '映画、音楽', '読書']
-        })
-        ct = crosstab.create_multiselect_crosstab(df, '年齢', '趣味')
-
-        assert '読書' in ct.columns
-        assert '映画' in ct.columns
-        assert '音楽' in ct.columns
-
-    def test_multiselect_with_custom_delimiter(self):
-        """カスタム区切り文字での展開"""
-        df = pd.DataFrame({
-            '年齢': ['20代', '30代'],
-            '趣味': ['読書,映画', '音楽,ゲーム']
-        })
+    @pytest.mark.parametrize('data, delimiter, expected', [
+        # 複数選択の展開
+        ({'年齢': ['20代', '30代', '20代'], '趣味': ['読書、映画', '映画、音楽', '読書']},
+         '、', {'読書', '映画', '音楽'}),
+        # カスタム区切り文字での展開
+        ({'年齢': ['20代', '30代'], '趣味': ['読書,映画', '音楽,ゲーム']},
+         ',', {'読書', '映画'}),
+        # 空白が除去される
+        ({'年齢': ['20代'], '趣味': ['  読書  、  映画  ']},
+         '、', {'読書', '映画'}),
+    ], ids=['expansion', 'custom_delimiter', 'strips_whitespace'])
+    def test_multiselect_columns(self, data, delimiter, expected):
+        """選択肢ごとの列に展開される"""
         ct = crosstab.create_multiselect_crosstab(
-            df, '年齢', '趣味', delimiter=','
+            pd.DataFrame(data), '年齢', '趣味', delimiter=delimiter
         )
 
-        assert '読書' in ct.columns
-        assert '映画' in ct.columns
+        assert expected.issubset(ct.columns)
 
     def test_multiselect_with_empty_data(self):
         """空データで空DataFrameを返す"""
@@ -149,17 +160,6 @@ class TestCreateMultiselectCrosstab:
         ct = crosstab.create_multiselect_crosstab(df, '年齢', '趣味')
         assert len(ct) == 0
 
-    def test_multiselect_strips_whitespace(self):
-        """空白が除去される"""
-        df = pd.DataFrame({
-            '年齢': ['20代'],
-            '趣味': ['  読書  、  映画  ']
-        })
-        ct = crosstab.create_multiselect_crosstab(df, '年齢', '趣味')
-
-        assert '読書' in ct.columns
-        assert '映画' in ct.columns
-
 
 class TestGetCrosstabSummary:
     """get_crosstab_summary関数のテスト"""
@@ -195,17 +195,25 @@ class TestGetCrosstabSummary:
         assert 'count' in max_cell
         assert 'percentage' in max_cell
 
+    def test_int32_counts_do_not_overflow(self):
+        """int32の度数表でも総数が桁あふれしない"""
+        ct = pd.DataFrame(
+            [[2_000_000_000, 2_000_000_000], [1, 2]],
+            index=['20代', '30代'],
+            columns=['男性', '女性'],
+            dtype='int32'
+        )
+        summary = crosstab.get_crosstab_summary(ct, '年齢', '性別')
+
+        assert summary['total_n'] == 4_000_000_003
+
 
 class TestFilterCrosstabByCategory:
     """filter_crosstab_by_category関数のテスト"""
 
-    def test_filter_rows(self, sample_dataframe):
+    def test_filter_rows(self, base_crosstab):
         """行のフィルタ"""
-        ct = crosstab.create_crosstab(
-            sample_dataframe,
-            '年齢',
-            '性別'
-        )
+        ct = base_crosstab
         filtered = crosstab.filter_crosstab_by_category(
             ct,
             row_categories=['20代', '30代']
@@ -215,13 +223,9 @@ class TestFilterCrosstabByCategory:
         assert '30代' in filtered.index
         assert '40代' not in filtered.index
 
-    def test_filter_columns(self, sample_dataframe):
+    def test_filter_columns(self, base_crosstab):
         """列のフィルタ"""
-        ct = crosstab.create_crosstab(
-            sample_dataframe,
-            '年齢',
-            '性別'
-        )
+        ct = base_crosstab
         filtered = crosstab.filter_crosstab_by_category(
             ct,
             col_categories=['男性']
@@ -231,52 +235,43 @@ class TestFilterCrosstabByCategory:
         assert '女性' not in filtered.columns
 
 
-class TestCalculateRowPercentages:
-    """calculate_row_percentages関数のテスト"""
+class TestCalculatePercentages:
+    """calculate_row_percentages / calculate_column_percentages関数のテスト"""
 
-    def test_row_percentages(self, sample_dataframe):
-        """行パーセンテージ計算"""
-        ct = crosstab.create_crosstab(
-            sample_dataframe,
-            '年齢',
-            '性別'
-        )
-        pct = crosstab.calculate_row_percentages(ct)
+    @pytest.mark.parametrize('calculate, axis', [
+        (crosstab.calculate_row_percentages, 1),
+        (crosstab.calculate_column_percentages, 0),
+    ])
+    def test_percentages_sum_to_100(self, base_crosstab, calculate, axis):
+        """行（列）パーセンテージ計算"""
+        pct = calculate(base_crosstab)
 
-        # 各行の合計が約100%
-        row_sums = pct.sum(axis=1)
-        for s in row_sums:
-            assert abs(s - 100) < 0.1
+        # 各行（列）の合計が約100%
+        _assert_sums_to_100(pct, axis=axis)
 
 
-class TestCalculateColumnPercentages:
-    """calculate_column_percentages関数のテスト"""
+class TestCalculateRowPercentages:
+    """calculate_row_percentages関数のテスト"""
 
-    def test_column_percentages(self, sample_dataframe):
-        """列パーセンテージ計算"""
-        ct = crosstab.create_crosstab(
-            sample_dataframe,
-            '年齢',
-            '性別'
+    def test_excludes_total_column_and_zero_rows(self):
+        """合計列を除外し、度数0の行はNaNになる"""
+        ct = pd.DataFrame(
+            {'男性': [1, 0], '女性': [3, 0], '合計': [4, 0]},
+            index=['20代', '30代']
         )
-        pct = crosstab.calculate_column_percentages(ct)
+        pct = crosstab.calculate_row_percentages(ct)
 
-        # 各列の合計が約100%
-        col_sums = pct.sum(axis=0)
-        for s in col_sums:
-            assert abs(s - 100) < 0.1
+        assert pct.columns.tolist() == ['男性', '女性']
+        assert pct.loc['20代'].tolist() == [25.0, 75.0]
+        assert pct.loc['30代'].isna().all()
 
 
 class TestExportCrosstabsToCsv:
     """export_crosstabs_to_csv関数のテスト"""
 
-    def test_export_creates_files(self, sample_dataframe, tmp_path):
+    def test_export_creates_files(self, base_crosstab, tmp_path):
         """CSVファイルが作成される"""
-        ct = crosstab.create_crosstab(
-            sample_dataframe,
-            '年齢',
-            '性別'
-        )
+        ct = base_crosstab
         crosstabs = {'age_x_gender': ct}
 
         saved_files = crosstab.export_crosstabs_to_csv(
@@ -288,13 +283,9 @@ class TestExportCrosstabsToCsv:
         assert len(saved_files) == 1
         assert 'test_age_x_gender.csv' in saved_files[0]
 
-    def test_export_creates_directory(self, sample_dataframe, tmp_path):
+    def test_export_creates_directory(self, base_crosstab, tmp_path):
         """ディレクトリが作成される"""
-        ct = crosstab.create_crosstab(
-            sample_dataframe,
-            '年齢',
-            '性別'
-        )
+        ct = base_crosstab
         new_dir = tmp_path / 'new_output'
         crosstabs = {'age_x_gender': ct}
 
@@ -305,3 +296,17 @@ class TestExportCrosstabsToCsv:
         )
 
         assert new_dir.exists()
+
+    def test_export_many_files_in_order(self, base_crosstab, tmp_path):
+        """複数ファイルを入力順に出力し、完了通知は1回だけ出す"""
+        ct = base_crosstab
+        names = [f'pair{i}' for i in range(6)]
+
+        with pytest.warns(UserWarning, match='保存完了') as record:
+            saved_files = crosstab.export_crosstabs_to_csv(
+                {name: ct for name in names}, str(tmp_path), prefix='test'
+            )
+
+        assert saved_files == [str(tmp_path / f'test_{name}.csv') for name in names]
+        assert all((tmp_path / f'test_{name}.csv').exists() for name in names)
+        assert len(record) == 1
@@ -6,30 +6,36 @@
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
 from survey_analysis.core import loader
 
+# エンコーディング検出テスト用のCSVバイト列（モジュール読み込み時に1回だけエンコード）
+_UTF8_CSV = '日本語,テスト\na,b'.encode('utf-8')
+_UTF8_BOM_CSV = b'\xef\xbb\xbfcol1,col2\na,b\n'
+_UTF16_CSV = '日本語,テスト\na,b'.encode('utf-16')
+
 
 class TestDetectEncoding:
     """detect_encoding関数のテスト"""
 
-    def test_detect_utf8(self, tmp_path):
+    def test_detect_utf8(self):
         """UTF-8を検出"""
-        csv_path = tmp_path / 'utf8.csv'
-        csv_path.write_text('日本語,テスト\na,b', encoding='utf-8')
-
-        encoding = loader.detect_encoding(csv_path)
+        encoding = loader._detect_encoding_from_bytes(_UTF8_CSV)
         assert encoding.lower() in ['utf-8', 'utf8', 'ascii']
 
-    def test_detect_utf8_bom(self, tmp_path):
+    def test_detect_utf8_bom(self):
         """UTF-8 BOMを検出"""
+        assert loader._detect_encoding_from_bytes(_UTF8_BOM_CSV) == 'utf-8-sig'
+
+    def test_detect_from_file(self, tmp_path):
+        """ファイルの先頭バイトから検出"""
         csv_path = tmp_path / 'utf8bom.csv'
-        csv_path.write_bytes(b'\xef\xbb\xbfcol1,col2\na,b\n')
+        csv_path.write_bytes(_UTF8_BOM_CSV)
 
-        encoding = loader.detect_encoding(csv_path)
-        assert encoding == 'utf-8-sig'
+        assert loader.detect_encoding(csv_path) == 'utf-8-sig'
 
     def test_detect_with_sample_size(self, tmp_path):
         """サンプルサイズ指定での検出"""
@@ -39,13 +45,77 @@ class TestDetectEncoding:
         encoding = loader.detect_encoding(csv_path, sample_size=100)
         assert encoding is not None
 
+    def test_reads_only_sample_size(self, tmp_path, monkeypatch):
+        """大きなファイルでも先頭 sample_size バイトしか読まない"""
+        csv_path = tmp_path / 'huge.csv'
+        with open(csv_path, 'wb') as f:
+            f.write(b'col1,col2\n' + b'a,b\n' * 1000)
+            f.truncate(10 * 1024 * 1024)  # 10MBの疎ファイル
+        sample_size = 4096
+
+        class BoundedReader:
+            def __init__(self, f):
+                self._f = f
+                self._read = 0
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self._f.close()
+
+            def read(self, size=-1):
+                if size < 0 or self._read + size > sample_size:
+                    raise AssertionError(f'sample_size を超えて読み込んだ: {size}')
+                data = self._f.read(size)
+                self._read += len(data)
+                return data
+
+        monkeypatch.setattr(
+            loader, 'open', lambda path, mode='r': BoundedReader(open(path, mode)), raising=False
+        )
+
+        assert loader.detect_encoding(csv_path, sample_size=sample_size) is not None
+
+    def test_detect_utf16_bom(self):
+        """UTF-16 BOMを検出"""
+        assert loader._detect_encoding_from_bytes(_UTF16_CSV) == 'utf-16'
+
+    def test_bom_skips_chardet(self, monkeypatch):
+        """BOMがあればchardetを呼ばない"""
+        monkeypatch.setattr(
+            loader.chardet, 'detect',
+            lambda data: pytest.fail('chardet.detect が呼ばれた')
+        )
+
+        assert loader._detect_encoding_from_bytes(b'\xef\xbb\xbfcol1\n1\n') == 'utf-8-sig'
+
+    def test_result_is_cached_until_file_changes(self, tmp_path, monkeypatch):
+        """同じファイルの再検出はキャッシュを使い、更新されたら再検出する"""
+        csv_path = tmp_path / 'cached.csv'
+        csv_path.write_text('col1\n1\n', encoding='utf-8')
+        calls = []
+        original = loader.chardet.detect
+        monkeypatch.setattr(
+            loader.chardet, 'detect',
+            lambda data: calls.append(1) or original(data)
+        )
+
+        loader.detect_encoding(csv_path)
+        loader.detect_encoding(csv_path)
+        assert len(calls) == 1
+
+        csv_path.write_text('col1,col2\n1,2\n', encoding='utf-8')
+        loader.detect_encoding(csv_path)
+        assert len(calls) == 2
+
 
 class TestLoadRawData:
     """load_raw_data関数のテスト"""
 
-    def test_load_raw_data_with_valid_config(self, config_with_csv):
+    def test_load_raw_data_with_valid_config(self, loaded_csv_df):
         """有効な設定でデータを読み込み"""
-        df = loader.load_raw_data(config_with_csv)
+        df = loaded_csv_df
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 3
 
@@ -54,13 +124,29 @@ class TestLoadRawData:
         with pytest.raises(FileNotFoundError, match="データファイルが見つかりません"):
             loader.load_raw_data(mock_config)
 
-    def test_load_raw_data_returns_all_columns(self, config_with_csv):
+    def test_load_raw_data_returns_all_columns(self, loaded_csv_df):
         """全カラムが読み込まれる"""
-        df = loader.load_raw_data(config_with_csv)
+        df = loaded_csv_df
         assert '年齢' in df.columns
         assert '性別' in df.columns
         assert '満足度' in df.columns
 
+    @pytest.mark.parametrize('use_pyarrow', [
+        pytest.param(True, id='pyarrow'),
+        pytest.param(False, id='c-fallback'),
+    ])
+    def test_engines_read_same_contents(
+        self, config_with_csv, tmp_csv_dataframe, monkeypatch, use_pyarrow
+    ):
+        """pyarrowエンジンでも、pyarrowが無い環境のCエンジンでも同じ内容を読み込む"""
+        if use_pyarrow:
+            pytest.importorskip('pyarrow')
+        monkeypatch.setattr(loader, '_PYARROW_AVAILABLE', use_pyarrow)
+
+        df = loader.load_raw_data(config_with_csv)
+
+        pd.testing.assert_frame_equal(df, tmp_csv_dataframe, check_dtype=False)
+
 
 class TestCleanColumnNames:
     """clean_column_names関数のテスト"""
@@ -81,6 +167,15 @@ class TestCleanColumnNames:
         _ = loader.clean_column_names(sample_dataframe)
         assert sample_dataframe.columns.tolist() == original_columns
 
+    def test_already_clean_reuses_columns(self):
+        """空白がなければカラムの Index を作り直さない"""
+        df = pd.DataFrame({'col1': [1, 2], 'col2': [3, 4]})
+
+        cleaned = loader.clean_column_names(df)
+
+        assert cleaned is not df
+        assert cleaned.columns is df.columns
+
 
 class TestHandleMissingValues:
     """handle_missing_values関数のテスト"""
@@ -98,6 +193,19 @@ class TestHandleMissingValues:
         assert len(result) == 2
         assert result['col1'].isna().sum() == 0
 
+    def test_drop_strategy_keeps_arrow_dtypes(self):
+        """Arrow型の列もdrop戦略で欠損値行が削除され、型は保たれる"""
+        pytest.importorskip('pyarrow')
+        df = pd.DataFrame({
+            'col1': pd.array([1, None, 3], dtype='int64[pyarrow]'),
+            'col2': pd.array([0.5, 1.5, None], dtype='double[pyarrow]'),
+        })
+
+        result = loader.handle_missing_values(df, strategy='drop')
+
+        assert len(result) == 1
+        assert result.dtypes.tolist() == df.dtypes.tolist()
+
     def test_fill_strategy_replaces_na(self):
         """fill戦略で欠損値が埋められる"""
         df = pd.DataFrame({'col1': ['a', None, 'c']})
@@ -108,40 +216,47 @@ class TestHandleMissingValues:
 class TestSplitMultiselectCell:
     """split_multiselect_cell関数のテスト"""
 
-    def test_splits_with_default_delimiter(self):
-        """デフォルト区切り文字で分割"""
-        result = loader.split_multiselect_cell('選択肢A、選択肢B、選択肢C')
-        assert result == ['選択肢A', '選択肢B', '選択肢C']
+    @pytest.mark.parametrize('raw, delimiter, expected', [
+        ('選択肢A、選択肢B、選択肢C', None, ['選択肢A', '選択肢B', '選択肢C']),
+        ('a,b,c', ',', ['a', 'b', 'c']),
+        (None, None, []),
+        (np.nan, None, []),
+        ('  a 、 b 、 c  ', None, ['a', 'b', 'c']),
+    ], ids=['default_delimiter', 'custom_delimiter', 'none', 'nan', 'strips_whitespace'])
+    def test_split(self, raw, delimiter, expected):
+        """区切り文字で分割し、各要素の空白を除去（欠損値は空リスト）"""
+        kwargs = {} if delimiter is None else {'delimiter': delimiter}
+
+        assert loader.split_multiselect_cell(raw, **kwargs) == expected
 
-    def test_splits_with_custom_delimiter(self):
-        """カスタム区切り文字で分割"""
-        result = loader.split_multiselect_cell('a,b,c', delimiter=',')
-        assert result == ['a', 'b', 'c']
 
-    def test_returns_empty_list_for_none(self):
-        """Noneで空リスト"""
-        assert loader.split_multiselect_cell(None) == []
+class TestSplitMultiselectSeries:
+    """split_multiselect_series関数のテスト"""
 
-    def test_returns_empty_list_for_nan(self):
-        """NaNで空リスト"""
-        import numpy as np
-        assert loader.split_multiselect_cell(np.nan) == []
+    def test_matches_cell_version(self):
+        """要素ごとの split_multiselect_cell と同じ結果で、インデックスを保持"""
+        values = ['価格、 品質', None, np.nan, '、', 3, '  デザイン  '] * 2000
+        series = pd.Series(values, index=range(10, 10 + len(values)), dtype=object)
 
-    def test_strips_whitespace(self):
-        """各要素の空白が除去される"""
-        result = loader.split_multiselect_cell('  a 、 b 、 c  ')
-        assert result == ['a', 'b', 'c']
+        result = loader.split_multiselect_series(series)
+
+        assert result.index.equals(series.index)
+        assert result.tolist() == [loader.split_multiselect_cell(v) for v in values]
+
+    def test_string_dtype(self):
+        """文字列型（欠損はpd.NA）のカラムも分割"""
+        series = pd.Series(['a,b', None], dtype='string')
+
+        assert loader.split_multiselect_series(series, delimiter=',').tolist() == [['a', 'b'], []]
 
 
 class TestConvertOrderedCategories:
     """convert_ordered_categories関数のテスト"""
 
-    def test_converts_to_categorical(self, tmp_path):
+    def test_converts_to_categorical(self, tmp_path, mock_config_factory):
         """カテゴリカル型に変換される"""
-        from conftest import MockSurveyConfig
-
         df = pd.DataFrame({'年齢': ['20代', '30代', '40代']})
-        config = MockSurveyConfig(
+        config = mock_config_factory(
             questions={'age': '年齢'},
             category_orders={'age': ['20代', '30代', '40代', '50代']},
             raw_data_path=tmp_path / 'test.csv'
@@ -150,12 +265,10 @@ class TestConvertOrderedCategories:
         result = loader.convert_ordered_categories(df, config)
         assert result['年齢'].dtype.name == 'category'
 
-    def test_preserves_specified_order(self, tmp_path):
+    def test_preserves_specified_order(self, tmp_path, mock_config_factory):
         """指定した順序が保持される"""
-        from conftest import MockSurveyConfig
-
         df = pd.DataFrame({'年齢': ['40代', '20代', '30代']})
-        config = MockSurveyConfig(
+        config = mock_config_factory(
             questions={'age': '年齢'},
             category_orders={'age': ['20代', '30代', '40代']},
             raw_data_path=tmp_path / 'test.csv'
@@ -165,12 +278,10 @@ class TestConvertOrderedCategories:
         categories = result['年齢'].cat.categories.tolist()
         assert categories == ['20代', '30代', '40代']
 
-    def test_ordered_is_true(self, tmp_path):
+    def test_ordered_is_true(self, tmp_path, mock_config_factory):
         """ordered=Trueで変換される"""
-        from conftest import MockSurveyConfig
-
         df = pd.DataFrame({'年齢': ['20代', '30代']})
-        config = MockSurveyConfig(
+        config = mock_config_factory(
             questions={'age': '年齢'},
             category_orders={'age': ['20代', '30代', '40代']},
             raw_data_path=tmp_path / 'test.csv'
@@ -179,12 +290,10 @@ class TestConvertOrderedCategories:
         result = loader.convert_ordered_categories(df, config)
         assert result['年齢'].cat.ordered is True
 
-    def test_ignores_missing_columns(self, tmp_path):
+    def test_ignores_missing_columns(self, tmp_path, mock_config_factory):
         """存在しないカラムは無視される"""
-        from conftest import MockSurveyConfig
-
         df = pd.DataFrame({'年齢': ['20代', '30代']})
-        config = MockSurveyConfig(
+        config = mock_config_factory(
             questions={'age': '年齢', 'missing': '存在しないカラム'},
             category_orders={'missing': ['a', 'b']},
             raw_data_path=tmp_path / 'test.csv'
@@ -194,6 +303,63 @@ class TestConvertOrderedCategories:
         result = loader.convert_ordered_categories(df, config)
         assert len(result) == 2
 
+    def test_does_not_modify_input(self, sample_dataframe, config_with_categories):
+        """元のデータフレームの型は変更されない"""
+        original_dtype = sample_dataframe['年齢'].dtype
+
+        result = loader.convert_ordered_categories(sample_dataframe, config_with_categories)
+
+        assert isinstance(result['年齢'].dtype, pd.CategoricalDtype)
+        assert sample_dataframe['年齢'].dtype == original_dtype
+
+    def test_warns_about_values_outside_order(self, config_with_categories):
+        """順序定義にない値は警告し、欠損値として変換する"""
+        df = pd.DataFrame({'年齢': ['20代', '60代', None]})
+
+        with pytest.warns(UserWarning, match='60代'):
+            result = loader.convert_ordered_categories(df, config_with_categories)
+
+        assert result['年齢'].isna().tolist() == [False, True, True]
+
+    def test_category_dtype_is_built_once(self, config_with_categories):
+        """順序付きカテゴリ型は設定ごとに1回だけ構築される"""
+        dtypes = config_with_categories._category_dtypes
+
+        assert dtypes['age'].categories.tolist() == ['20代', '30代', '40代', '50代以上']
+        assert config_with_categories._category_dtypes is dtypes
+
+
+class TestConvertStringColumnsToCategory:
+    """convert_string_columns_to_category関数のテスト"""
+
+    def test_converts_repeated_strings(self, sample_dataframe):
+        """繰り返しの多い文字列カラムはcategory型になる"""
+        result = loader.convert_string_columns_to_category(sample_dataframe)
+
+        assert isinstance(result['性別'].dtype, pd.CategoricalDtype)
+        assert result['性別'].tolist() == sample_dataframe['性別'].tolist()
+
+    def test_keeps_high_cardinality_and_numeric(self):
+        """ユニーク値の多いカラムと数値カラムは変換しない"""
+        df = pd.DataFrame({
+            '自由記述': ['a', 'b', 'c', 'd'],
+            'スコア': [1, 1, 2, 2],
+        })
+        result = loader.convert_string_columns_to_category(df)
+
+        assert not isinstance(result['自由記述'].dtype, pd.CategoricalDtype)
+        assert not isinstance(result['スコア'].dtype, pd.CategoricalDtype)
+
+    def test_keeps_ordered_categories(self):
+        """順序付きカテゴリカル型はそのまま保持"""
+        df = pd.DataFrame({
+            '満足度': pd.Categorical(['満足', '不満', '満足'], categories=['不満', '満足'], ordered=True)
+        })
+        result = loader.convert_string_columns_to_category(df)
+
+        assert result['満足度'].cat.ordered
+        assert result['満足度'].cat.categories.tolist() == ['不満', '満足']
+
 
 class TestLoadAndPrepareData:
     """load_and_prepare_data関数のテスト"""
@@ -206,20 +372,41 @@ class TestLoadAndPrepareData:
         assert len(df) == 3
         assert '年齢' in df.columns
 
-    def test_applies_category_order(self, tmp_path):
-        """カテゴリ順序が適用される"""
-        from conftest import MockSurveyConfig
+    def test_uses_native_csv_engine(self, monkeypatch, config_with_csv):
+        """CSVはpyarrowかCエンジンで読み込む"""
+        engines = []
+        read_csv = pd.read_csv
+        monkeypatch.setattr(
+            loader.pd, 'read_csv',
+            lambda *args, **kwargs: engines.append(kwargs.get('engine')) or read_csv(*args, **kwargs)
+        )
+
+        loader.load_and_prepare_data(config_with_csv)
+
+        assert engines
+        assert set(engines) <= {'pyarrow', 'c'}
+
+    def test_category_conversion_is_opt_in(self, monkeypatch, config_with_csv):
+        """文字列カラムのcategory型変換は categorize=True の場合のみ"""
+        calls = []
+        convert = loader.convert_string_columns_to_category
+        monkeypatch.setattr(
+            loader, 'convert_string_columns_to_category',
+            lambda df: calls.append(1) or convert(df)
+        )
 
-        # テストCSV作成
-        csv_path = tmp_path / 'test.csv'
-        pd.DataFrame({
-            '年齢': ['30代', '20代', '40代'],
-            '性別': ['男性', '女性', '男性']
-        }).to_csv(csv_path, index=False, encoding='utf-8-sig')
+        df = loader.load_and_prepare_data(config_with_csv)
+        assert calls == []
+        df.loc[0, '性別'] = '無回答'
+
+        loader.load_and_prepare_data(config_with_csv, categorize=True)
+        assert calls == [1]
 
-        config = MockSurveyConfig(
+    def test_applies_category_order(self, tmp_path, mock_config_factory, age_gender_csv):
+        """カテゴリ順序が適用される"""
+        config = mock_config_factory(
             questions={'age': '年齢', 'gender': '性別'},
-            raw_data_path=csv_path,
+            raw_data_path=age_gender_csv,
             output_dir=tmp_path / 'output',
             category_orders={'age': ['20代', '30代', '40代']}
         )
@@ -230,19 +417,13 @@ class TestLoadAndPrepareData:
             categories = df['年齢'].cat.categories.tolist()
             assert categories == ['20代', '30代', '40代']
 
-    def test_with_drop_missing_strategy(self, tmp_path):
+    def test_with_drop_missing_strategy(
+        self, tmp_path, mock_config_factory, age_gender_missing_csv
+    ):
         """drop戦略で欠損値が削除される"""
-        from conftest import MockSurveyConfig
-
-        csv_path = tmp_path / 'test.csv'
-        pd.DataFrame({
-            '年齢': ['20代', None, '40代'],
-            '性別': ['男性', '女性', None]
-        }).to_csv(csv_path, index=False, encoding='utf-8-sig')
-
-        config = MockSurveyConfig(
+        config = mock_config_factory(
             questions={'age': '年齢', 'gender': '性別'},
-            raw_data_path=csv_path,
+            raw_data_path=age_gender_missing_csv,
             output_dir=tmp_path / 'output'
         )
 
@@ -276,6 +457,20 @@ class TestValidateData:
 
         assert len(result['missing_values']) > 0
 
+    def test_missing_values_single_pass(self, sample_dataframe_with_missing, mock_config, monkeypatch):
+        """欠損値はデータフレーム全体を1回だけ走査して集計"""
+        calls = []
+        original = pd.DataFrame.isna
+        monkeypatch.setattr(
+            pd.DataFrame, 'isna', lambda self: calls.append(1) or original(self)
+        )
+
+        result = loader.validate_data(sample_dataframe_with_missing, mock_config)
+
+        assert len(calls) == 1
+        assert result['missing_values']['年齢'] == {'count': 1, 'percentage': 20.0}
+        assert list(result['missing_values']) == ['年齢', '性別', '満足度']
+
 
 class TestCreateNumericScores:
     """create_numeric_scores関数のテスト"""
@@ -298,3 +493,18 @@ class TestCreateNumericScores:
 
         assert result.iloc[0] == 5
         assert pd.isna(result.iloc[1])
+
+    @pytest.mark.parametrize('with_missing', [False, True])
+    def test_category_column_returns_numeric(self, with_missing):
+        """category型のカラムでも数値型のスコアを返し、object型と同じ値になる"""
+        values = ['満足', '普通', '不満'] * 33_334
+        if with_missing:
+            values[1] = None
+        mapping = {'満足': 5, '普通': 3, '不満': 1}
+        df = pd.DataFrame({'満足度': pd.Series(values, dtype=object)})
+
+        expected = loader.create_numeric_scores(df, '満足度', mapping)
+        result = loader.create_numeric_scores(df.astype('category'), '満足度', mapping)
+
+        assert pd.api.types.is_numeric_dtype(result)
+        pd.testing.assert_series_equal(result, expected)
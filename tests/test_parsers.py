@@ -0,0 +1,83 @@
+"""
+パースユーティリティのテスト
+
+parsers.pyの各関数をテスト。
+"""
+
+import numpy as np
+import pandas as pd
+
+from survey_analysis.utils import parsers
+
+
+class TestParseFirstYenAmountSeries:
+    """parse_first_yen_amount_series関数のテスト"""
+
+    def test_matches_scalar_version(self):
+        """要素ごとの parse_first_yen_amount と同じ結果"""
+        values = ['月額500円程度', '1,000円〜2,000円', '無料', None, '１，２００円', ',円', 300]
+        series = pd.Series(values, dtype=object)
+
+        result = parsers.parse_first_yen_amount_series(series)
+        expected = [parsers.parse_first_yen_amount(v) for v in values]
+
+        assert result.dtype == 'Int64'
+        assert [None if pd.isna(v) else v for v in result] == expected
+
+    def test_keeps_large_amounts_exact(self):
+        """欠損を含んでも大きな金額を桁落ちさせない"""
+        series = pd.Series(['12345678901234567円', None])
+
+        assert parsers.parse_first_yen_amount_series(series)[0] == 12345678901234567
+
+    def test_all_missing_float_column(self):
+        """全て欠損のfloat列は全要素が欠損"""
+        result = parsers.parse_first_yen_amount_series(pd.Series([np.nan, np.nan]))
+
+        assert result.isna().all()
+
+
+class TestSplitMultiselect:
+    """split_multiselect関数のテスト"""
+
+    def test_default_delimiters(self):
+        """デフォルトの区切り文字で分割し、空白と空要素を除く"""
+        assert parsers.split_multiselect('価格、 品質,,対応；') == ['価格', '品質', '対応']
+
+    def test_custom_delimiters_table_is_cached(self):
+        """区切り文字の組ごとに変換表を使い回す"""
+        assert parsers.split_multiselect('a/b|c', ['/', '|']) == ['a', 'b', 'c']
+        assert parsers._delimiter_translation(('/', '|')) is parsers._delimiter_translation(('/', '|'))
+
+    def test_multichar_delimiters_fall_back_to_regex(self):
+        """複数文字の区切り文字は正規表現で分割"""
+        assert parsers._delimiter_translation((' / ', '、')) is None
+        assert parsers.split_multiselect('a / b、c/d', [' / ', '、']) == ['a', 'b', 'c/d']
+
+
+class TestFormatNumberJapanese:
+    """format_number_japanese / format_number_japanese_array関数のテスト"""
+
+    CASES = [
+        (0, '0'),
+        (9999, '9,999'),
+        (10000, '1万'),
+        (12345, '1万2,345'),
+        (100000000, '1億'),
+        (100009999, '1億'),
+        (123456789012, '1,234億5,678万'),
+    ]
+
+    def test_scalar(self):
+        """億・万単位で表記"""
+        for value, expected in self.CASES:
+            assert parsers.format_number_japanese(value) == expected
+
+    def test_array_matches_scalar(self):
+        """配列版は要素ごとのスカラー版と同じ結果で形状を保つ"""
+        values = np.array([value for value, _ in self.CASES[:6]]).reshape(2, 3)
+
+        result = parsers.format_number_japanese_array(values)
+
+        assert result.shape == (2, 3)
+        assert result.ravel().tolist() == [expected for _, expected in self.CASES[:6]]
@@ -0,0 +1,58 @@
+"""
+ReportGenerator抽象クラスのテスト
+
+共通のフォーマット処理をテスト。
+"""
+
+import numpy as np
+import pytest
+
+from survey_analysis.base.report import ReportGenerator
+
+
+class SimpleReportGenerator(ReportGenerator):
+    """テスト用の最小実装"""
+
+    def generate_summary(self, results):
+        return ''
+
+    def generate_insights(self, df, tests):
+        return ''
+
+
+@pytest.fixture
+def report_generator(mock_config):
+    """テスト用レポート生成器"""
+    return SimpleReportGenerator(mock_config)
+
+
+class TestSignificanceStars:
+    """有意水準の星のテスト"""
+
+    def test_scalar_thresholds(self, report_generator):
+        """p値に応じた星を返す"""
+        assert report_generator._get_significance_stars(0.0005) == '***'
+        assert report_generator._get_significance_stars(0.005) == '**'
+        assert report_generator._get_significance_stars(0.03) == '*'
+        assert report_generator._get_significance_stars(0.2) == 'ns'
+
+    def test_vectorized_matches_scalar(self, report_generator):
+        """配列版はスカラー版と同じ判定を返す"""
+        p_values = np.array([0.0005, 0.001, 0.005, 0.01, 0.03, 0.05, 0.2])
+
+        stars = report_generator._significance_stars_vec(p_values)
+
+        assert stars.tolist() == [
+            report_generator._get_significance_stars(p) for p in p_values
+        ]
+
+
+class TestInterpretCramersV:
+    """Cramer's Vの解釈のテスト"""
+
+    def test_boundaries(self, report_generator):
+        """閾値ちょうどの値は上の区分に入る"""
+        assert report_generator._interpret_cramers_v(0.05) == "効果なし"
+        assert report_generator._interpret_cramers_v(0.1) == "弱い関連"
+        assert report_generator._interpret_cramers_v(0.3) == "中程度の関連"
+        assert report_generator._interpret_cramers_v(0.5) == "強い関連"
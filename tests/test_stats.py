@@ -7,8 +7,47 @@
 import pytest
 import pandas as pd
 import numpy as np
+from scipy import stats as scipy_stats
 
-from survey_analysis.core import stats
+from survey_analysis.core import crosstab, stats
+
+
+class TestCalculateFrequencyDistribution:
+    """calculate_frequency_distribution関数のテスト"""
+
+    def test_percentages_include_missing(self):
+        """割合は欠損値を含む全行数に対して計算する"""
+        df = pd.DataFrame({'性別': ['男性', '女性', None, '男性']})
+        result = stats.calculate_frequency_distribution(df, '性別', normalize=True)
+
+        assert result['count'].tolist() == [2, 1, 1]
+        assert result['percentage'].tolist() == [50.0, 25.0, 25.0]
+
+
+class TestCalculateSummaryStatistics:
+    """calculate_summary_statistics関数のテスト"""
+
+    def test_matches_pandas_moments(self):
+        """pandasの統計量と同じ値を返す"""
+        series = pd.Series([1.0, 2.0, np.nan, 4.0, 10.0, 3.0])
+        result = stats.calculate_summary_statistics(pd.DataFrame({'x': series}), 'x')
+        s = series.dropna()
+
+        assert result['count'] == 5
+        assert result['std'] == pytest.approx(s.std())
+        assert result['q1'] == pytest.approx(s.quantile(0.25))
+        assert result['median'] == pytest.approx(s.median())
+        assert result['skewness'] == pytest.approx(s.skew())
+        assert result['kurtosis'] == pytest.approx(s.kurtosis())
+
+    def test_small_and_constant_samples(self):
+        """件数不足の歪度・尖度はNaN、分散0なら0"""
+        few = stats.calculate_summary_statistics(pd.DataFrame({'x': [1.0, 2.0]}), 'x')
+        constant = stats.calculate_summary_statistics(pd.DataFrame({'x': [5.0] * 4}), 'x')
+
+        assert np.isnan(few['skewness']) and np.isnan(few['kurtosis'])
+        assert constant['skewness'] == 0.0
+        assert constant['kurtosis'] == 0.0
 
 
 class TestChiSquareTest:
@@ -35,6 +74,15 @@ class TestChiSquareTest:
         if 'cramers_v' in result:
             assert 0 <= result['cramers_v'] <= 1
 
+    def test_observed_matches_pd_crosstab(self, crosstab_sample, mock_config):
+        """観測度数はpd.crosstabと一致する"""
+        result = stats.chi_square_test(
+            crosstab_sample, '年齢', '興味度', mock_config
+        )
+        expected = pd.crosstab(crosstab_sample['年齢'], crosstab_sample['興味度'])
+
+        assert result['observed'] == expected.values.tolist()
+
     def test_chi_square_with_missing_column(self, sample_dataframe, mock_config):
         """存在しないカラムでValueError"""
         with pytest.raises(ValueError, match="カラムが見つかりません"):
@@ -42,14 +90,25 @@ class TestChiSquareTest:
                 sample_dataframe, '存在しない', '年齢', mock_config
             )
 
+    def test_uses_given_contingency_table(self, crosstab_sample, mock_config):
+        """作成済みのクロス集計表（合計付き）をそのまま使う"""
+        ct = crosstab.create_crosstab_with_totals(crosstab_sample, '年齢', '興味度')
+        result = stats.chi_square_test(
+            crosstab_sample, '年齢', '興味度', mock_config, contingency_table=ct
+        )
+        expected = stats.chi_square_test(crosstab_sample, '年齢', '興味度', mock_config)
+
+        assert result['observed'] == expected['observed']
+        assert result['chi2'] == pytest.approx(expected['chi2'])
+
 
 class TestTTest:
     """t検定のテスト"""
 
-    def test_t_test_with_valid_data(self, sample_dataframe, mock_config):
+    def test_t_test_with_valid_data(self, numeric_sample_dataframe, mock_config):
         """有効なデータでt検定"""
         result = stats.t_test_independent(
-            sample_dataframe, '数値スコア', '性別', mock_config
+            numeric_sample_dataframe, '数値スコア', '性別', mock_config
         )
 
         if 'error' not in result:
@@ -57,19 +116,19 @@ class TestTTest:
             assert 'p_value' in result
             assert isinstance(result['t_stat'], (int, float))
 
-    def test_t_test_returns_cohens_d(self, sample_dataframe, mock_config):
+    def test_t_test_returns_cohens_d(self, numeric_sample_dataframe, mock_config):
         """Cohen's dが計算される"""
         result = stats.t_test_independent(
-            sample_dataframe, '数値スコア', '性別', mock_config
+            numeric_sample_dataframe, '数値スコア', '性別', mock_config
         )
 
         if 'cohens_d' in result:
             assert isinstance(result['cohens_d'], (int, float))
 
-    def test_t_test_with_non_binary_group(self, sample_dataframe, mock_config):
+    def test_t_test_with_non_binary_group(self, numeric_sample_dataframe, mock_config):
         """2群以外でのt検定"""
         result = stats.t_test_independent(
-            sample_dataframe, '数値スコア', '年齢', mock_config
+            numeric_sample_dataframe, '数値スコア', '年齢', mock_config
         )
 
         # 3群以上の場合はエラーまたは最初の2群で計算
@@ -80,64 +139,89 @@ class TestTTest:
 class TestAnova:
     """ANOVAのテスト"""
 
-    def test_anova_with_valid_data(self, sample_dataframe, mock_config):
+    def test_anova_with_valid_data(self, numeric_sample_dataframe, mock_config):
         """有効なデータでANOVA"""
         result = stats.anova_test(
-            sample_dataframe, '数値スコア', '年齢', mock_config
+            numeric_sample_dataframe, '数値スコア', '年齢', mock_config
         )
 
         if 'error' not in result:
             assert 'f_stat' in result
             assert 'p_value' in result
 
-    def test_anova_returns_eta_squared(self, sample_dataframe, mock_config):
+    def test_anova_returns_eta_squared(self, numeric_sample_dataframe, mock_config):
         """η²（イータ二乗）が計算される"""
         result = stats.anova_test(
-            sample_dataframe, '数値スコア', '年齢', mock_config
+            numeric_sample_dataframe, '数値スコア', '年齢', mock_config
         )
 
         if 'eta_squared' in result:
             assert 0 <= result['eta_squared'] <= 1
 
+    def test_anova_excludes_missing_values(self):
+        """欠損値を除外してグループ別に集計"""
+        df = pd.DataFrame({
+            'グループ': ['A', 'A', 'A', 'B', 'B', 'B', None],
+            'スコア': [1.0, 2.0, np.nan, 4.0, 5.0, 6.0, 3.0],
+        })
+        result = stats.anova_test(df, 'グループ', 'スコア')
+
+        assert result['group_sizes'] == {'A': 2, 'B': 3}
+        assert result['n_groups'] == 2
+        # η² = SS_between / SS_total（全体平均 3.6）
+        assert result['eta_squared'] == pytest.approx(14.7 / 17.2)
+
 
 class TestCorrelation:
     """相関分析のテスト"""
 
-    def test_correlation_with_valid_data(self, mock_config):
-        """有効なデータで相関分析"""
+    @pytest.mark.parametrize('method, func', [
+        ('spearman', scipy_stats.spearmanr),
+        ('pearson', scipy_stats.pearsonr),
+        ('kendall', scipy_stats.kendalltau),
+    ])
+    def test_correlation_with_valid_data(self, mock_config, method, func):
+        """各手法の相関係数がSciPyと一致し、-1から1の範囲"""
         df = pd.DataFrame({
             'var1': [1, 2, 3, 4, 5],
             'var2': [2, 4, 5, 4, 5]
         })
 
-        result = stats.correlation_test(df, 'var1', 'var2', mock_config)
+        result = stats.correlation_test(df, 'var1', 'var2', method=method, config=mock_config)
+        expected = func(df['var1'], df['var2'])
 
-        if 'error' not in result:
-            assert 'rho' in result or 'r' in result
-            assert 'p_value' in result
+        assert result['method'] == method
+        assert result['correlation'] == pytest.approx(expected[0])
+        assert result['p_value'] == pytest.approx(expected[1])
+        assert -1 <= result['correlation'] <= 1
+
+    def test_unknown_method_raises(self):
+        """未対応の手法はValueError"""
+        df = pd.DataFrame({'var1': [1, 2, 3], 'var2': [3, 2, 1]})
+
+        with pytest.raises(ValueError, match='未対応の相関手法'):
+            stats.correlation_test(df, 'var1', 'var2', method='cosine')
 
-    def test_correlation_coefficient_range(self, mock_config):
-        """相関係数が-1から1の範囲"""
+    def test_ordered_categoricals_use_category_order(self):
+        """順序カテゴリカルはカテゴリの順序で順位付けする"""
+        levels = ['低', '中', '高']
         df = pd.DataFrame({
-            'var1': [1, 2, 3, 4, 5],
-            'var2': [5, 4, 3, 2, 1]  # 負の相関
+            'var1': pd.Categorical(['低', '中', '高', '中', '低'], categories=levels, ordered=True),
+            'var2': pd.Categorical(['中', '高', '高', '中', '低'], categories=levels, ordered=True),
         })
 
-        result = stats.correlation_test(df, 'var1', 'var2', mock_config)
-
-        if 'rho' in result:
-            assert -1 <= result['rho'] <= 1
-        elif 'r' in result:
-            assert -1 <= result['r'] <= 1
+        result = stats.correlation_test(df, 'var1', 'var2')
+        expected = stats.spearmanr([0, 1, 2, 1, 0], [1, 2, 2, 1, 0])
 
+        assert result['correlation'] == pytest.approx(expected[0])
 
 class TestFdrCorrection:
     """FDR補正のテスト"""
 
     def test_fdr_correction_reduces_significance(self, mock_config):
         """FDR補正がp値を調整"""
-        if not hasattr(stats, 'apply_fdr_correction'):
-            pytest.skip("apply_fdr_correction関数が存在しません")
+        if not hasattr(stats, 'apply_fdr_correction_to_results'):
+            pytest.skip("apply_fdr_correction_to_results関数が存在しません")
 
         results = [
             {'p_value': 0.01},
@@ -146,7 +230,7 @@ class TestFdrCorrection:
             {'p_value': 0.10},
         ]
 
-        corrected = stats.apply_fdr_correction(results, alpha=0.05)
+        corrected = stats.apply_fdr_correction_to_results(results, alpha=0.05)
 
         # 補正後のp値が追加されていることを確認
         for r in corrected:
@@ -154,8 +238,8 @@ class TestFdrCorrection:
 
     def test_fdr_correction_preserves_order(self, mock_config):
         """FDR補正がp値の順序を保持"""
-        if not hasattr(stats, 'apply_fdr_correction'):
-            pytest.skip("apply_fdr_correction関数が存在しません")
+        if not hasattr(stats, 'apply_fdr_correction_to_results'):
+            pytest.skip("apply_fdr_correction_to_results関数が存在しません")
 
         results = [
             {'p_value': 0.001},
@@ -163,7 +247,7 @@ class TestFdrCorrection:
             {'p_value': 0.05},
         ]
 
-        corrected = stats.apply_fdr_correction(results, alpha=0.05)
+        corrected = stats.apply_fdr_correction_to_results(results, alpha=0.05)
 
         # 元のp値が小さい順に補正後も小さいはず
         p_key = 'p_value_corrected' if 'p_value_corrected' in corrected[0] else 'p_adj'
@@ -171,6 +255,42 @@ class TestFdrCorrection:
             p_values = [r[p_key] for r in corrected]
             assert p_values[0] <= p_values[1] <= p_values[2]
 
+    def test_fdr_array_api(self):
+        """p値の配列では補正後p値の配列を返し、元のp値の大小関係を保つ"""
+        p_values = np.random.default_rng(0).uniform(size=10_000)
+
+        reject, corrected, _, _ = stats.apply_fdr_correction(p_values, alpha=0.05)
+
+        order = np.argsort(p_values)
+        assert corrected.shape == p_values.shape
+        assert np.all(np.diff(corrected[order]) >= 0)
+        assert np.all(corrected >= p_values)
+
+    def test_series_with_non_zero_index(self):
+        """0始まりでないインデックスのSeriesも補正できる"""
+        p_values = pd.Series([0.01, 0.04, 0.5], index=[5, 6, 7])
+
+        reject, corrected, _, _ = stats.apply_fdr_correction(p_values, alpha=0.05)
+
+        assert corrected.tolist() == pytest.approx([0.03, 0.06, 0.5])
+        assert reject.tolist() == [True, False, False]
+
+    def test_dict_results_point_to_results_function(self):
+        """検定結果の辞書を渡すと専用関数を案内するTypeError"""
+        with pytest.raises(TypeError, match='apply_fdr_correction_to_results'):
+            stats.apply_fdr_correction([{'p_value': 0.01}])
+
+    def test_dict_results_are_not_modified(self):
+        """検定結果の辞書は変更せず、補正結果を追加した新しい辞書を返す"""
+        results = [{'p_value': 0.01, 'test': 'a'}, {'p_value': 0.04, 'test': 'b'}]
+
+        corrected = stats.apply_fdr_correction_to_results(results, alpha=0.05)
+
+        assert 'p_value_corrected' not in results[0]
+        assert [r['test'] for r in corrected] == ['a', 'b']
+        assert [r['p_value_corrected'] for r in corrected] == pytest.approx([0.02, 0.04])
+        assert [r['significant'] for r in corrected] == [True, True]
+
 
 class TestSignificanceInterpretation:
     """有意水準解釈のテスト"""
@@ -240,3 +360,54 @@ class TestErrorHandling:
 
         with pytest.raises(ValueError, match="クロス集計表が小さすぎます"):
             stats.chi_square_test(constant_df, 'col1', 'col2', mock_config)
+
+
+class TestAnalyzeMissingValues:
+    """analyze_missing_values関数のテスト"""
+
+    def test_sorted_by_missing_count(self, sample_dataframe_with_missing):
+        """欠損数の降順に並び、同数は元のカラム順"""
+        df = sample_dataframe_with_missing.assign(完全=range(5), 欠損多=[None] * 4 + [1])
+        result = stats.analyze_missing_values(df)
+
+        assert result['column'].tolist() == ['欠損多', '年齢', '性別', '満足度', '完全']
+        assert result['missing_count'].tolist() == [4, 1, 1, 1, 0]
+        assert result['missing_percentage'].tolist() == [80.0, 20.0, 20.0, 20.0, 0.0]
+
+
+class TestRunAllChiSquareTests:
+    """run_all_chi_square_tests関数のテスト"""
+
+    def test_results_follow_pair_order(self, sample_dataframe, mock_config):
+        """並列実行しても結果はペアの順序どおり"""
+        pairs = [
+            ('age', 'gender'),
+            ('age', 'satisfaction'),
+            ('age', 'interest'),
+            ('gender', 'satisfaction'),
+            ('satisfaction', 'interest'),
+        ]
+        result = stats.run_all_chi_square_tests(sample_dataframe, pairs, mock_config)
+
+        assert list(zip(result['var1'], result['var2'])) == pairs
+        sequential = [
+            stats.chi_square_test(sample_dataframe, v1, v2, mock_config)['p_value']
+            for v1, v2 in pairs
+        ]
+        assert result['p_value'].tolist() == pytest.approx(sequential)
+
+    def test_resolves_columns_without_get_column_name(self, sample_dataframe, mock_config, monkeypatch):
+        """カラム名はペアごとに get_column_name を呼ばずに解決する"""
+        calls = []
+        original = mock_config.get_column_name
+        monkeypatch.setattr(
+            mock_config, 'get_column_name',
+            lambda qid: calls.append(qid) or original(qid)
+        )
+
+        result = stats.run_all_chi_square_tests(
+            sample_dataframe, [('age', 'gender')], mock_config
+        )
+
+        assert calls == []
+        assert result['var1'].tolist() == ['age']
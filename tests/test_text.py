@@ -0,0 +1,298 @@
+"""
+テキスト分析モジュールのテスト
+
+text.pyの各関数をテスト。形態素解析が必要なテストはJanome未導入時にスキップ。
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from survey_analysis.core import text
+
+requires_janome = pytest.mark.skipif(
+    not text.check_janome_available(),
+    reason="janomeがインストールされていません"
+)
+
+requires_sklearn = pytest.mark.skipif(
+    not text._SKLEARN_AVAILABLE,
+    reason="scikit-learnがインストールされていません"
+)
+
+
+class TestStopwordSets:
+    """ストップワード・品詞フィルタの集合化のテスト"""
+
+    def test_default_stopwords_is_frozenset(self):
+        """デフォルトストップワードはfrozenset"""
+        assert isinstance(text.DEFAULT_STOPWORDS, frozenset)
+        assert 'です' in text.DEFAULT_STOPWORDS
+
+    def test_as_set_keeps_sets_and_converts_lists(self):
+        """集合はそのまま、リストはfrozensetに変換"""
+        words = {'価格'}
+
+        assert text._as_set(words) is words
+        assert text._as_set(['価格', '品質']) == frozenset({'価格', '品質'})
+
+
+class TestDigitsOnlyPattern:
+    """数字のみのトークン判定のテスト"""
+
+    @pytest.mark.parametrize('word, expected', [
+        ('2024', True),
+        ('２０２４', True),
+        ('2024年', False),
+        ('①', False),
+    ])
+    def test_matches_halfwidth_and_fullwidth_digits(self, word, expected):
+        """半角・全角の数字だけからなる語を判定"""
+        assert bool(text._DIGITS_ONLY_RE.fullmatch(word)) is expected
+
+
+class TestGetTokenizer:
+    """_get_tokenizer関数のテスト"""
+
+    def test_raises_without_tokenizer_backend(self, monkeypatch):
+        """fugashiもJanomeも未導入ならImportError"""
+        monkeypatch.setattr(text, '_FUGASHI_AVAILABLE', False)
+        monkeypatch.setattr(text, '_JANOME_AVAILABLE', False)
+        text._create_tokenizer.cache_clear()
+
+        with pytest.raises(ImportError, match='janome'):
+            text._get_tokenizer()
+
+        text._create_tokenizer.cache_clear()
+
+    def test_rejects_unknown_backend(self):
+        """未対応のバックエンド名はValueError"""
+        with pytest.raises(ValueError, match='未対応のバックエンド'):
+            text._create_tokenizer('mecab')
+
+    def test_default_backend_is_janome(self):
+        """fugashiの有無に関わらずデフォルトはJanome"""
+        assert text._TOKENIZER_BACKEND == 'janome'
+
+    def test_set_backend_rejects_unknown(self, monkeypatch):
+        """未対応のバックエンド名は設定できない"""
+        monkeypatch.setattr(text, '_TOKENIZER_BACKEND', 'janome')
+
+        with pytest.raises(ValueError, match='未対応のバックエンド'):
+            text.set_tokenizer_backend('auto')
+
+        text.set_tokenizer_backend('fugashi')
+        assert text._TOKENIZER_BACKEND == 'fugashi'
+
+    @requires_janome
+    def test_returns_shared_instance(self):
+        """トークナイザは1回だけ生成して使い回す"""
+        assert text._get_tokenizer() is text._get_tokenizer()
+
+
+class _FakeJanomeToken:
+    """Janomeのトークンの代用"""
+
+    def __init__(self, surface, part_of_speech, base_form):
+        self.surface = surface
+        self.part_of_speech = part_of_speech
+        self.base_form = base_form
+
+
+class _FakeJanomeTokenizer:
+    """「サービスをする」を解析するJanome Tokenizerの代用"""
+
+    def tokenize(self, sentence):
+        return [
+            _FakeJanomeToken('サービス', '名詞,サ変接続,*,*', 'サービス'),
+            _FakeJanomeToken('を', '助詞,格助詞,一般,*', 'を'),
+            _FakeJanomeToken('する', '動詞,自立,*,*', 'する'),
+        ]
+
+
+class _FakeUnidicFeature:
+    """UniDicの素性の代用（語彙素は漢字表記に正規化される）"""
+
+    def __init__(self, pos1, lemma, orthBase):
+        self.pos1 = pos1
+        self.lemma = lemma
+        self.orthBase = orthBase
+
+
+class _FakeFugashiWord:
+    """fugashiの形態素の代用"""
+
+    def __init__(self, surface, feature):
+        self.surface = surface
+        self.feature = feature
+
+
+def _fake_fugashi_tagger(sentence):
+    """「サービスをする」を解析するfugashi.Taggerの代用"""
+    return [
+        _FakeFugashiWord('サービス', _FakeUnidicFeature('名詞', 'サービス-service', 'サービス')),
+        _FakeFugashiWord('を', _FakeUnidicFeature('助詞', 'を', 'を')),
+        _FakeFugashiWord('する', _FakeUnidicFeature('動詞', '為る', 'する')),
+    ]
+
+
+class TestBackendStopwords:
+    """バックエンドごとのストップワード除外のテスト"""
+
+    @pytest.mark.parametrize('backend', ['janome', 'fugashi'])
+    def test_kana_stopwords_filtered(self, monkeypatch, backend):
+        """どちらのバックエンドでも基本形がかな表記で、ストップワードが除外される"""
+        monkeypatch.setattr(text, 'Tokenizer', _FakeJanomeTokenizer)
+        tokenizer = _FakeJanomeTokenizer() if backend == 'janome' else _fake_fugashi_tagger
+
+        tokens = text.tokenize_japanese_text('サービスをする', min_length=1, tokenizer=tokenizer)
+
+        assert tokens == ['サービス']
+
+
+@requires_janome
+class TestTokenizeJapaneseText:
+    """tokenize_japanese_text関数のテスト"""
+
+    def test_extracts_nouns(self):
+        """名詞を基本形で抽出"""
+        tokens = text.tokenize_japanese_text('価格が高いので購入を検討中です')
+
+        assert '価格' in tokens
+        assert '購入' in tokens
+
+    def test_accepts_explicit_tokenizer(self):
+        """渡されたトークナイザでも同じ結果を返す"""
+        sentence = '価格が高いので購入を検討中です'
+
+        assert text.tokenize_japanese_text(
+            sentence, tokenizer=text._get_tokenizer()
+        ) == text.tokenize_japanese_text(sentence)
+
+    def test_empty_text(self):
+        """空文字や欠損値は空リスト"""
+        assert text.tokenize_japanese_text('') == []
+        assert text.tokenize_japanese_text(None) == []
+
+
+class TestExtractWordFrequency:
+    """extract_word_frequency関数のテスト"""
+
+    def test_uses_tokenized_texts(self):
+        """トークン化済みのテキストを渡すと再解析せずに集計する"""
+        tokenized = [['価格', '品質'], ['価格'], []]
+
+        result = text.extract_word_frequency(
+            ['未使用', '未使用', '未使用'], tokenized_texts=tokenized
+        )
+
+        assert result['word'].tolist() == ['価格', '品質']
+        assert result['count'].tolist() == [2, 1]
+
+    def test_ties_keep_first_appearance_order(self):
+        """同数の語は初出順に並ぶ"""
+        tokenized = [['品質', '価格'], ['価格', '品質', '対応']]
+
+        result = text.extract_word_frequency([], top_n=2, tokenized_texts=tokenized)
+
+        assert result['word'].tolist() == ['品質', '価格']
+
+
+@requires_sklearn
+class TestExtractTfidfKeywords:
+    """extract_tfidf_keywords関数のテスト"""
+
+    def test_uses_tokens_as_vocabulary(self):
+        """トークンを分割・小文字化せずに語彙とする"""
+        tokenized = [['Wi-Fi', '価格'], ['価格'], []]
+
+        result = text.extract_tfidf_keywords([], tokenized_texts=tokenized)
+
+        assert set(result['word']) == {'Wi-Fi', '価格'}
+
+    def test_empty_tokens(self):
+        """トークンがなければ空のDataFrame"""
+        result = text.extract_tfidf_keywords([], tokenized_texts=[[], []])
+
+        assert result.empty
+        assert result.columns.tolist() == ['word', 'tfidf_score']
+
+class TestAnalyzeFreetextColumn:
+    """analyze_freetext_column関数のテスト"""
+
+    def test_tokenizes_once(self, monkeypatch):
+        """形態素解析は1回だけ行い、各分析で共有する"""
+        calls = []
+        monkeypatch.setattr(
+            text, '_tokenize_texts',
+            lambda texts, config=None, pos_filter=None, n_jobs=1: calls.append(1) or [['価格']] * len(texts)
+        )
+        df = pd.DataFrame({'感想': ['価格が高い', '価格が安い', None]})
+
+        result = text.analyze_freetext_column(df, '感想')
+
+        assert len(calls) == 1
+        assert result['word_frequency']['count'].tolist() == [2]
+
+    def test_skips_blank_and_nan_texts(self, monkeypatch):
+        """空白のみ・'nan' の回答は分析対象に含めない"""
+        received = []
+        monkeypatch.setattr(
+            text, '_tokenize_texts',
+            lambda texts, config=None, pos_filter=None, n_jobs=1: received.extend(texts) or [[]] * len(texts)
+        )
+        df = pd.DataFrame({'感想': ['良い', '  ', '\u3000', 'NaN', None, '普通']})
+
+        result = text.analyze_freetext_column(df, '感想')
+
+        assert received == ['良い', '普通']
+        assert result['total_responses'] == 2
+
+
+class TestTokenizeTexts:
+    """_tokenize_texts関数のテスト"""
+
+    def test_small_input_runs_in_process(self, monkeypatch):
+        """件数が少なければ並列指定でもプロセスを起動しない"""
+        monkeypatch.setattr(
+            text, '_tokenize_batch',
+            lambda texts, pos_filter, stopwords: [[t] for t in texts]
+        )
+
+        assert text._tokenize_texts(['価格', '品質'], n_jobs=4) == [['価格'], ['品質']]
+
+    @requires_janome
+    def test_parallel_matches_sequential(self):
+        """プロセス並列でも逐次実行と同じ結果を入力順に返す"""
+        texts = ['価格が高いので購入を検討中です', '品質に満足しています'] * 100
+
+        assert text._tokenize_texts(texts, n_jobs=2) == text._tokenize_texts(texts)
+
+
+class TestTopNIndices:
+    """_top_n_indices関数のテスト"""
+
+    def test_descending_with_stable_ties(self):
+        """スコアの降順、同点は元の順序"""
+        scores = np.array([0.2, 0.5, 0.2, 0.9, 0.5])
+
+        assert text._top_n_indices(scores, 3).tolist() == [3, 1, 4]
+        assert text._top_n_indices(scores, 10).tolist() == [3, 1, 4, 0, 2]
+        assert text._top_n_indices(scores, 0).tolist() == []
+
+
+class TestFindJapaneseFont:
+    """_find_japanese_font関数のテスト"""
+
+    def test_result_is_cached(self, monkeypatch):
+        """フォントの探索は1回だけ行う"""
+        calls = []
+        monkeypatch.setattr(text.platform, 'system', lambda: calls.append(1) or 'Linux')
+        text._find_japanese_font.cache_clear()
+
+        first = text._find_japanese_font()
+
+        assert text._find_japanese_font() == first
+        assert len(calls) == 1
+
+        text._find_japanese_font.cache_clear()
@@ -0,0 +1,163 @@
+"""
+可視化モジュールのテスト
+
+viz.pyの各関数をテスト。
+"""
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from survey_analysis.core import viz
+
+
+class TestDropTotalLabels:
+    """_drop_total_labels関数のテスト"""
+
+    def test_removes_total_row_and_column(self):
+        """合計行/列を除外し、元の表は変更しない"""
+        ct = pd.DataFrame(
+            [[1, 2, 3], [4, 5, 9], [5, 7, 12]],
+            index=['20代', '30代', '合計'],
+            columns=['男性', '女性', 'Total']
+        )
+
+        result = viz._drop_total_labels(ct)
+
+        assert result.index.tolist() == ['20代', '30代']
+        assert result.columns.tolist() == ['男性', '女性']
+        assert ct.shape == (3, 3)
+
+
+class TestPlotBarChart:
+    """plot_bar_chart関数のテスト"""
+
+    def test_value_labels_skip_zero(self):
+        """値ラベルは件数が正のバーにだけ表示"""
+        data = pd.Series([3, 0, 5], index=['A', 'B', 'C'])
+
+        for horizontal in (False, True):
+            fig = viz.plot_bar_chart(data, 'テスト', horizontal=horizontal)
+            labels = [t.get_text() for t in fig.axes[0].texts]
+
+            assert labels == ['3', '', '5']
+
+
+class TestPlotStackedBar:
+    """plot_stacked_bar関数のテスト"""
+
+    def test_skips_empty_rows(self):
+        """空の行は描画せず、回答者数を表示"""
+        ct = pd.DataFrame(
+            [[1, 3], [0, 0], [1, 3]],
+            index=['20代', '30代', '合計'],
+            columns=['男性', '女性']
+        )
+
+        fig = viz.plot_stacked_bar(ct, 'テスト')
+        labels = [t.get_text() for t in fig.axes[0].texts]
+
+        assert labels == ['25%', '75%', 'N=4']
+
+
+class TestCreateVisualizationReport:
+    """create_visualization_report関数のテスト"""
+
+    def test_closes_generated_figures(self, sample_dataframe, mock_config, tmp_path):
+        """生成した図は保存後に閉じる"""
+        plt.close('all')
+        visualizations = [
+            {'type': 'bar', 'column': 'age', 'title': '年齢分布'},
+            {'type': 'pie', 'column': 'gender', 'title': '性別分布'},
+            {'type': 'heatmap', 'column': 'age', 'col_var': 'gender', 'title': '年齢×性別'},
+        ]
+
+        saved = viz.create_visualization_report(
+            sample_dataframe, mock_config, tmp_path, visualizations
+        )
+
+        assert len(saved) == 3
+        assert all(path.exists() for path in saved)
+        assert plt.get_fignums() == []
+
+    def test_parallel_matches_sequential(self, sample_dataframe, mock_config, tmp_path):
+        """プロセス並列でも定義の順序どおりにファイルを生成"""
+        visualizations = [
+            {'type': 'bar', 'column': 'age', 'title': '年齢分布'},
+            {'type': 'pie', 'column': 'gender', 'title': '性別分布'},
+            {'type': 'bar', 'column': 'missing', 'title': '存在しない'},
+        ]
+
+        saved = viz.create_visualization_report(
+            sample_dataframe, mock_config, tmp_path, visualizations, n_jobs=2
+        )
+
+        assert saved == [tmp_path / '01_age.png', tmp_path / '02_gender.png']
+        assert all(path.exists() for path in saved)
+
+
+    def test_parallel_sends_dataframe_once_per_worker(
+        self, sample_dataframe, mock_config, tmp_path, monkeypatch
+    ):
+        """df と config はワーカー初期化時に渡し、図ごとの引数には含めない"""
+        submitted = []
+
+        class _InlineExecutor:
+            """初期化関数と map をプロセスを起動せずに実行する代用"""
+
+            def __init__(self, max_workers, initializer, initargs):
+                initializer(*initargs)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def map(self, fn, *iterables):
+                args = list(zip(*iterables))
+                submitted.extend(args)
+                return [fn(*a) for a in args]
+
+        monkeypatch.setattr(viz, 'ProcessPoolExecutor', _InlineExecutor)
+        monkeypatch.setattr(viz, '_WORKER_RENDER_CONTEXT', None)
+        visualizations = [
+            {'type': 'bar', 'column': 'age', 'title': '年齢分布'},
+            {'type': 'pie', 'column': 'gender', 'title': '性別分布'},
+        ]
+
+        saved = viz.create_visualization_report(
+            sample_dataframe, mock_config, tmp_path, visualizations, n_jobs=2
+        )
+
+        assert saved == [tmp_path / '01_age.png', tmp_path / '02_gender.png']
+        assert [a[0] for a in submitted] == [1, 2]
+        assert all(not isinstance(x, pd.DataFrame) for a in submitted for x in a)
+
+
+class TestNewFigure:
+    """_new_figure関数のテスト"""
+
+    def test_not_registered_with_pyplot(self):
+        """pyplot の図管理に登録されない"""
+        plt.close('all')
+        fig, ax = viz._new_figure((4, 3))
+
+        assert ax.figure is fig
+        assert plt.get_fignums() == []
+
+
+class TestSetupPlotStyle:
+    """setup_plot_style関数のテスト"""
+
+    def test_skips_when_already_applied(self, monkeypatch):
+        """同じ設定の再適用では rcParams を書き換えない"""
+        calls = []
+        monkeypatch.setattr(viz, '_APPLIED_STYLE', None)
+        monkeypatch.setattr(viz.sns, 'set_style', lambda style: calls.append(style))
+
+        viz.setup_plot_style()
+        viz.setup_plot_style()
+        assert calls == ['whitegrid']
+
+        viz.setup_plot_style(force=True)
+        assert calls == ['whitegrid', 'whitegrid']